@@ -0,0 +1,73 @@
+"""Throughput of `AsyncDeque` with many concurrent producer / consumer tasks.
+
+The baseline polls a plain `Deque` with `await asyncio.sleep(0)` while it is
+empty or full, and `asyncio.Queue` is included as a reference point.
+
+    python benchmarks/async_deque.py [n_tasks] [n_items] [maxlen]
+"""
+import asyncio
+import sys
+import time
+
+from datastructures import AsyncDeque, Deque
+
+
+class PollingDeque:
+    def __init__(self, maxlen):
+        self.deque = Deque(maxlen=maxlen)
+
+    async def append(self, val):
+        while len(self.deque) >= self.deque.maxlen:
+            await asyncio.sleep(0)
+        self.deque.append(val)
+
+    async def popleft(self):
+        while not self.deque:
+            await asyncio.sleep(0)
+        return self.deque.popleft()
+
+
+class QueueAdapter(asyncio.Queue):
+    append = asyncio.Queue.put
+    popleft = asyncio.Queue.get
+
+
+async def run(make_deque, n_tasks, n_items, batched=False):
+    d = make_deque()
+
+    async def producer():
+        for i in range(n_items):
+            await d.append(i)
+
+    async def consumer():
+        remaining = n_items
+        while remaining:
+            if batched:
+                remaining -= len(await d.get_many(remaining))
+            else:
+                await d.popleft()
+                remaining -= 1
+
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(producer() for _ in range(n_tasks)), *(consumer() for _ in range(n_tasks))
+    )
+    return n_tasks * n_items / (time.perf_counter() - start)
+
+
+def main(n_tasks=100, n_items=2000, maxlen=1000):
+    print(f"{n_tasks} producer / {n_tasks} consumer tasks, maxlen={maxlen}")
+    print(f"{'implementation':<28}{'items / sec':>14}")
+    cases = [
+        ("Deque + polling", lambda: PollingDeque(maxlen), False),
+        ("asyncio.Queue", lambda: QueueAdapter(maxlen), False),
+        ("AsyncDeque", lambda: AsyncDeque(maxlen=maxlen), False),
+        ("AsyncDeque (get_many)", lambda: AsyncDeque(maxlen=maxlen), True),
+    ]
+    for name, make_deque, batched in cases:
+        rate = asyncio.run(run(make_deque, n_tasks, n_items, batched))
+        print(f"{name:<28}{rate:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
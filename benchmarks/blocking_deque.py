@@ -0,0 +1,82 @@
+"""Multi-producer / multi-consumer throughput of `BlockingDeque`.
+
+The baseline wraps every call to a bounded `Deque` in one coarse lock and
+polls (yielding the GIL with `time.sleep(0)`) when the deque is empty or full,
+which is what callers had to do before `BlockingDeque` existed. Thread
+scheduling makes single runs noisy, so each case reports the median of
+`repeat` runs.
+
+    python benchmarks/blocking_deque.py [n_threads] [n_items] [maxlen] [repeat]
+"""
+import statistics
+import sys
+import threading
+import time
+
+from datastructures import BlockingDeque, Deque
+
+
+class CoarseLockDeque:
+    def __init__(self, maxlen):
+        self.deque = Deque(maxlen=maxlen)
+        self.lock = threading.Lock()
+
+    def append(self, val):
+        while True:
+            with self.lock:
+                if len(self.deque) < self.deque.maxlen:
+                    self.deque.append(val)
+                    return
+            time.sleep(0)
+
+    def popleft(self):
+        while True:
+            with self.lock:
+                if self.deque:
+                    return self.deque.popleft()
+            time.sleep(0)
+
+
+def run(d, n_threads, n_items, batched=False):
+    def producer():
+        for i in range(n_items):
+            d.append(i)
+
+    def consumer():
+        remaining = n_items
+        while remaining:
+            if batched:
+                remaining -= len(d.drain(remaining, block=True))
+            else:
+                d.popleft()
+                remaining -= 1
+
+    threads = [threading.Thread(target=producer) for _ in range(n_threads)]
+    threads += [threading.Thread(target=consumer) for _ in range(n_threads)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return n_threads * n_items / (time.perf_counter() - start)
+
+
+def main(n_threads=4, n_items=50_000, maxlen=1000, repeat=11):
+    print(f"{n_threads} producers / {n_threads} consumers, maxlen={maxlen}")
+    print(f"{'implementation':<28}{'items / sec':>14}")
+    cases = [
+        ("Deque + coarse lock", lambda: CoarseLockDeque(maxlen), False),
+        ("BlockingDeque", lambda: BlockingDeque(maxlen=maxlen), False),
+        ("BlockingDeque (drain)", lambda: BlockingDeque(maxlen=maxlen), True),
+    ]
+    rates = {name: [] for name, _, _ in cases}
+    # interleave the cases so that they see the same background load
+    for _ in range(repeat):
+        for name, make_deque, batched in cases:
+            rates[name].append(run(make_deque(), n_threads, n_items, batched))
+    for name, _, _ in cases:
+        print(f"{name:<28}{statistics.median(rates[name]):>14,.0f}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
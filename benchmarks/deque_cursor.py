@@ -0,0 +1,58 @@
+"""Editing a `Deque` while walking it: indices vs a cursor.
+
+Walks the deque once, removing every multiple of three and inserting a copy of
+every other even item after it.
+
+    python benchmarks/deque_cursor.py [n_items]
+"""
+import sys
+import time
+
+from datastructures import Deque
+
+
+def edit_by_index(d):
+    i = 0
+    while i < len(d):
+        val = d[i]
+        if val % 3 == 0:
+            del d[i]
+            continue
+        if val % 2 == 0:
+            d.insert(i + 1, val)
+            i += 1
+        i += 1
+
+
+def edit_by_cursor(d):
+    c = d.cursor()
+    while True:
+        val = c.value
+        if val % 3 == 0:
+            c.remove_current()
+            if c.current is None:
+                return
+            continue
+        if val % 2 == 0:
+            c.insert_after(val)
+            c.move_next()
+        if not c.move_next():
+            return
+
+
+def main(n_items=100_000):
+    print(f"editing {n_items} items")
+    print(f"{'implementation':<20}{'ms':>10}")
+    results = []
+    for name, fn in [("indices", edit_by_index), ("cursor", edit_by_cursor)]:
+        d = Deque(range(1, n_items + 1))
+        start = time.perf_counter()
+        fn(d)
+        elapsed = time.perf_counter() - start
+        results.append(list(d))
+        print(f"{name:<20}{elapsed * 1000:>10.1f}")
+    assert results[0] == results[1]
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
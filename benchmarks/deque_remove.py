@@ -0,0 +1,60 @@
+"""Removing many items from a `Deque`: repeated `remove` vs the bulk methods.
+
+Removes every tenth item (all equal to the same marker value) from a deque.
+The baseline calls `remove` until the marker is gone, which restarts the scan
+from the left each time, and the previous `remove` (`index` followed by
+`del d[i]`) walked the deque twice per call.
+
+    python benchmarks/deque_remove.py [n_items]
+"""
+import sys
+import time
+
+from datastructures import Deque
+
+MARKER = -1
+
+
+def make_deque(n_items):
+    return Deque(MARKER if i % 10 == 0 else i for i in range(n_items))
+
+
+def index_and_del(d):
+    while True:
+        try:
+            i = d.index(MARKER)
+        except ValueError:
+            return
+        # walk to the node a second time, like the previous `remove` did
+        d._finger = None
+        del d[i]
+
+
+def repeated_remove(d):
+    while True:
+        try:
+            d.remove(MARKER)
+        except ValueError:
+            return
+
+
+def main(n_items=20_000):
+    print(f"removing {n_items // 10} of {n_items} items")
+    print(f"{'implementation':<28}{'ms':>10}")
+    cases = [
+        ("index + del (previous)", index_and_del),
+        ("repeated remove", repeated_remove),
+        ("remove_all", lambda d: d.remove_all(MARKER)),
+        ("retain", lambda d: d.retain(lambda x: x != MARKER)),
+    ]
+    for name, fn in cases:
+        d = make_deque(n_items)
+        start = time.perf_counter()
+        fn(d)
+        elapsed = time.perf_counter() - start
+        assert MARKER not in d and len(d) == n_items - n_items // 10
+        print(f"{name:<28}{elapsed * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,31 @@
+"""Time large rotations of `Deque`.
+
+`Deque.rotate` relinks the chain at the split point, so it is compared against
+the previous approach of moving one item at a time with `appendleft(pop())`.
+
+    python benchmarks/deque_rotate.py [n_items]
+"""
+import sys
+import timeit
+
+from datastructures import Deque
+
+
+def rotate_by_popping(d, n):
+    for _ in range(n):
+        d.appendleft(d.pop())
+
+
+def main(n=100_000):
+    d = Deque(range(n))
+    print(f"{'rotation':>12}{'relink (s)':>14}{'pop/append (s)':>16}")
+    for k in (1, n // 10, n // 2, n - 1, 10 * n + 3):
+        relink = min(timeit.repeat(lambda: d.rotate(k), number=1, repeat=3))
+        popping = min(
+            timeit.repeat(lambda: rotate_by_popping(d, k), number=1, repeat=3)
+        )
+        print(f"{k:>12,}{relink:>14.6f}{popping:>16.6f}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,77 @@
+"""Speed of `Deque` scans (`count`, `index`, `in`) on int and str payloads.
+
+The baseline is the previous implementation, which iterated through the generic
+iterator and checked the mutation state after every comparison.
+`collections.deque` is included as a reference point.
+
+    python benchmarks/deque_scan.py [n_items]
+"""
+import sys
+import timeit
+from collections import deque
+
+from datastructures import Deque
+
+
+def checked_count(d, x):
+    total = 0
+    start_state = d._Deque__state
+    for item in d:
+        if item == x:
+            total += 1
+        d._check_not_mutated(start_state)
+    return total
+
+
+def checked_contains(d, x):
+    start_state = d._Deque__state
+    for val in d:
+        if val == x:
+            return True
+        d._check_not_mutated(start_state)
+    return False
+
+
+def checked_index(d, x):
+    start_state = d._Deque__state
+    for idx, val in enumerate(d):
+        if val == x:
+            d._check_not_mutated(start_state)
+            return idx
+        d._check_not_mutated(start_state)
+    raise ValueError(f"{x} is not in the Deque")
+
+
+def best_of(fn, repeat=3):
+    return min(timeit.repeat(fn, number=1, repeat=repeat))
+
+
+def main(n_items=1_000_000):
+    payloads = {
+        "int": list(range(n_items)),
+        "str": [f"item-{i}" for i in range(n_items)],
+    }
+    print(f"{n_items} items, time in ms")
+    print(f"{'payload':<10}{'operation':<12}{'checked':>10}{'Deque':>10}{'deque':>10}")
+    for payload, items in payloads.items():
+        d = Deque(items)
+        ref = deque(items)
+        # the last item makes `index` and `in` walk the whole deque
+        x = items[-1]
+        cases = [
+            ("count", lambda: checked_count(d, x), d.count, ref.count),
+            ("in", lambda: checked_contains(d, x), d.__contains__, ref.__contains__),
+            ("index", lambda: checked_index(d, x), d.index, ref.index),
+        ]
+        for name, checked, fast, reference in cases:
+            checked_ms = best_of(checked) * 1000
+            fast_ms = best_of(lambda: fast(x)) * 1000
+            ref_ms = best_of(lambda: reference(x)) * 1000
+            print(
+                f"{payload:<10}{name:<12}{checked_ms:>10.1f}{fast_ms:>10.1f}"
+                f"{ref_ms:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
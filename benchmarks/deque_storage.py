@@ -0,0 +1,52 @@
+"""Compare the node-per-item `Deque` with the block based `BlockDeque`.
+
+Reports the memory used per element and the number of appends per second for
+each storage engine, with `collections.deque` as a reference point.
+
+    python benchmarks/deque_storage.py [n_items]
+"""
+import sys
+import timeit
+import tracemalloc
+from collections import deque
+
+from datastructures import BlockDeque, Deque
+
+IMPLEMENTATIONS = [Deque, BlockDeque, deque]
+
+
+def bytes_per_item(cls, n):
+    # we append `None` so that only the storage of the container is measured
+    # and not the items themselves
+    tracemalloc.start()
+    d = cls()
+    start, _ = tracemalloc.get_traced_memory()
+    append = d.append
+    for _ in range(n):
+        append(None)
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (end - start) / n
+
+
+def appends_per_second(cls, n, repeat=3):
+    def run():
+        append = cls().append
+        for i in range(n):
+            append(i)
+
+    return n / min(timeit.repeat(run, number=1, repeat=repeat))
+
+
+def main(n=200_000):
+    print(f"{'implementation':<16}{'bytes / item':>14}{'appends / sec':>16}")
+    for cls in IMPLEMENTATIONS:
+        print(
+            f"{cls.__name__:<16}"
+            f"{bytes_per_item(cls, n):>14.1f}"
+            f"{appends_per_second(cls, n):>16,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,80 @@
+"""Insert throughput and worst case insert latency of the hash maps.
+
+Inserts `n_keys` keys into a growing `HashMap` (rehashing in a single pass or
+incrementally), a `FixedHashMap` that was allocated with enough capacity up
+front and a `dict`. Then churns a `HashMap` that holds `n_keys // 5` keys,
+deleting a random key and inserting a new one `n_keys` times, and finally
+deletes every key. Like `timeit`, the garbage collector is disabled while
+timing since its collections would dwarf the latency of a single operation.
+
+    python benchmarks/hash_map.py [n_keys]
+"""
+import gc
+import random
+import sys
+import time
+
+from datastructures import FixedHashMap, HashMap
+
+
+def run(hash_map, n_keys):
+    worst = 0
+    gc.disable()
+    start = time.perf_counter()
+    for key in range(n_keys):
+        before = time.perf_counter()
+        hash_map[key] = key
+        worst = max(worst, time.perf_counter() - before)
+    rate = n_keys / (time.perf_counter() - start)
+    gc.enable()
+    return rate, worst
+
+
+def churn(hash_map, n_keys):
+    random.seed(0)
+    n_live = n_keys // 5
+    for key in range(n_live):
+        hash_map[key] = key
+    live, new_key = list(range(n_live)), n_live
+    worst_churn = worst_delete = 0
+    gc.disable()
+    for _ in range(n_keys):
+        i = random.randrange(n_live)
+        before = time.perf_counter()
+        del hash_map[live[i]]
+        hash_map[new_key] = new_key
+        worst_churn = max(worst_churn, time.perf_counter() - before)
+        live[i] = new_key
+        new_key += 1
+    for key in live:
+        before = time.perf_counter()
+        del hash_map[key]
+        worst_delete = max(worst_delete, time.perf_counter() - before)
+    gc.enable()
+    return worst_churn, worst_delete
+
+
+def main(n_keys=500_000):
+    cases = [
+        ("HashMap", lambda: HashMap()),
+        ("HashMap (incremental)", lambda: HashMap(incremental=True)),
+        ("FixedHashMap", lambda: FixedHashMap(n_keys * 2)),
+        ("dict", dict),
+    ]
+    print(f"{n_keys} keys")
+    header = ("implementation", "inserts / sec", "worst insert ms")
+    print("{:<24}{:>16}{:>18}".format(*header))
+    for name, make_map in cases:
+        rate, worst = run(make_map(), n_keys)
+        print(f"{name:<24}{rate:>16,.0f}{worst * 1000:>18.2f}")
+
+    print(f"\n{n_keys // 5} keys, {n_keys} deletes and inserts, then delete all")
+    header = ("implementation", "worst churn ms", "worst delete ms")
+    print("{:<24}{:>16}{:>18}".format(*header))
+    for name, make_map in cases[:2]:
+        worst_churn, worst_delete = churn(make_map(), n_keys)
+        print(f"{name:<24}{worst_churn * 1000:>16.2f}{worst_delete * 1000:>18.2f}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,78 @@
+"""Throughput of the bulk operations of the hash maps against single key calls.
+
+Loads `n_keys` random integer keys into a map one `__setitem__` at a time and
+with `from_items` (for `FixedHashMap`) or `set_many` (for `HashMap`, starting
+from its default capacity), then looks every key up one `__getitem__` at a
+time and with `get_many`. A `dict` is included for reference.
+
+    python benchmarks/hash_map_bulk.py [n_keys]
+"""
+import random
+import sys
+import time
+
+from datastructures import FixedHashMap, HashMap
+
+
+def rate(func, n_keys):
+    start = time.perf_counter()
+    func()
+    return n_keys / (time.perf_counter() - start)
+
+
+def single_set(hash_map, pairs):
+    for key, value in pairs:
+        hash_map[key] = value
+    return hash_map
+
+
+def single_get(hash_map, keys):
+    return [hash_map[key] for key in keys]
+
+
+def main(n_keys=1_000_000):
+    random.seed(0)
+    keys = random.sample(range(n_keys * 100), n_keys)
+    pairs = list(zip(keys, range(n_keys)))
+    capacity = n_keys * 4 // 3 + 1
+
+    def fixed_single():
+        return single_set(FixedHashMap(capacity), pairs)
+
+    def fixed_bulk():
+        return FixedHashMap.from_items(pairs, load_factor=0.75)
+
+    def resizing_single():
+        return single_set(HashMap(), pairs)
+
+    def resizing_bulk():
+        hash_map = HashMap()
+        hash_map.set_many(pairs)
+        return hash_map
+
+    cases = [
+        ("FixedHashMap", fixed_single, fixed_bulk),
+        ("HashMap", resizing_single, resizing_bulk),
+        ("dict", lambda: single_set({}, pairs), lambda: dict(pairs)),
+    ]
+    print(f"{n_keys} keys")
+    header = ("implementation", "set / sec", "bulk / sec", "get / sec", "bulk / sec")
+    print("{:<16}{:>12}{:>14}{:>12}{:>14}".format(*header))
+    for name, load_single, load_bulk in cases:
+        set_rate = rate(load_single, n_keys)
+        bulk_set_rate = rate(load_bulk, n_keys)
+        hash_map = load_bulk()
+        get_rate = rate(lambda: single_get(hash_map, keys), n_keys)
+        if isinstance(hash_map, dict):
+            get_many = lambda: list(map(hash_map.get, keys))  # noqa: E731
+        else:
+            get_many = lambda: hash_map.get_many(keys)  # noqa: E731
+        bulk_get_rate = rate(get_many, n_keys)
+        print(
+            f"{name:<16}{set_rate:>12,.0f}{bulk_set_rate:>14,.0f}"
+            f"{get_rate:>12,.0f}{bulk_get_rate:>14,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,62 @@
+"""Lookup latency of a `FixedHashMap` under a long insert / delete churn.
+
+Fills a map with random keys up to `load_percent` and then repeatedly
+deletes a random key and inserts a new one, timing lookups of present and
+missing keys every `n_ops / 10` operations. Compares automatic compaction (at
+25% tombstones) with none.
+
+    python benchmarks/hash_map_churn.py [capacity] [n_ops] [load_percent]
+"""
+import random
+import sys
+import time
+
+from datastructures import FixedHashMap
+
+N_LOOKUPS = 2000
+
+
+def lookup_us(fhm, keys):
+    start = time.perf_counter()
+    for key in keys:
+        try:
+            fhm[key]
+        except KeyError:
+            pass
+    return (time.perf_counter() - start) / len(keys) * 1e6
+
+
+def churn(fhm, n_ops, n_keys):
+    random.seed(0)
+    # missing keys are negative, live keys are not
+    live = [random.getrandbits(60) for _ in range(n_keys)]
+    for key in live:
+        fhm[key] = key
+    rows = []
+    for i in range(n_ops):
+        idx = random.randrange(len(live))
+        del fhm[live[idx]]
+        live[idx] = random.getrandbits(60)
+        fhm[live[idx]] = live[idx]
+        if (i + 1) % (n_ops // 10) == 0:
+            present = random.sample(live, N_LOOKUPS)
+            missing = [-random.getrandbits(60) - 1 for _ in range(N_LOOKUPS)]
+            hit, miss = lookup_us(fhm, present), lookup_us(fhm, missing)
+            rows.append((i + 1, fhm.tombstones, hit, miss))
+    return rows
+
+
+def main(capacity=10_000, n_ops=50_000, load_percent=50):
+    n_keys = capacity * load_percent // 100
+    print(f"capacity={capacity}, {n_keys} keys, {n_ops} churn operations")
+    for name, max_tombstones in (("compaction", 0.25), ("no compaction", 1.0)):
+        print(name)
+        header = ("operations", "tombstones", "hit us", "miss us")
+        print("{:>12}{:>12}{:>10}{:>10}".format(*header))
+        fhm = FixedHashMap(capacity, max_tombstones=max_tombstones)
+        for ops, tombstones, hit, miss in churn(fhm, n_ops, n_keys):
+            print(f"{ops:>12,}{tombstones:>12,}{hit:>10.2f}{miss:>10.2f}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,58 @@
+"""Time and peak memory of dumping every item of a `FixedHashMap`.
+
+Fills a map with `n_keys` keys and writes every key, value pair to a null
+"exporter", either by building the list of keys and looking each one up (how
+the string representation used to do it) or by streaming `items()`. A `dict`
+is included for reference.
+
+    python benchmarks/hash_map_iteration.py [n_keys]
+"""
+import sys
+import time
+import tracemalloc
+
+from datastructures import FixedHashMap
+
+
+def export(pairs):
+    for _ in pairs:
+        pass
+
+
+def lookup_keys(hash_map):
+    export([(key, hash_map[key]) for key in list(hash_map.keys())])
+
+
+def stream_items(hash_map):
+    export(hash_map.items())
+
+
+def measure(dump, hash_map):
+    start = time.perf_counter()
+    dump(hash_map)
+    elapsed = time.perf_counter() - start
+    # tracing slows every allocation down, so the memory is measured separately
+    tracemalloc.start()
+    dump(hash_map)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main(n_keys=1_000_000):
+    fixed = FixedHashMap.from_items((key, key) for key in range(n_keys))
+    dictionary = {key: key for key in range(n_keys)}
+    print(f"{n_keys} keys")
+    header = ("implementation", "dump", "ms", "peak MiB")
+    print("{:<16}{:<14}{:>10}{:>10}".format(*header))
+    for name, hash_map in (("FixedHashMap", fixed), ("dict", dictionary)):
+        for dump in (lookup_keys, stream_items):
+            elapsed, peak = measure(dump, hash_map)
+            print(
+                f"{name:<16}{dump.__name__:<14}{elapsed * 1000:>10.1f}"
+                f"{peak / 2**20:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
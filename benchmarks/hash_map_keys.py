@@ -0,0 +1,77 @@
+"""Lookup cost of `FixedHashMap` with keys that are expensive to compare.
+
+Fills a map to a load of 0.75 with long strings that share a prefix, tuples
+that share all but their last item, and dataclasses (whose `__eq__` compares
+tuples of their fields and is counted), then looks up every key plus as many
+missing keys. A `dict` is included for reference.
+
+    python benchmarks/hash_map_keys.py [n_keys]
+"""
+import sys
+import time
+from dataclasses import dataclass
+
+from datastructures import FixedHashMap
+
+PREFIX = "x" * 1000
+
+
+@dataclass(frozen=True, eq=False)
+class Point:
+    x: int
+    y: int
+    z: int
+
+    eq_calls = 0
+
+    def __eq__(self, other):
+        Point.eq_calls += 1
+        return (self.x, self.y, self.z) == (other.x, other.y, other.z)
+
+    def __hash__(self):
+        return hash((self.x, self.y, self.z))
+
+
+KEY_TYPES = {
+    "long str": lambda i: PREFIX + str(i),
+    "tuple": lambda i: tuple(range(20)) + (i,),
+    "dataclass": lambda i: Point(i, i, i),
+}
+
+
+def lookup_us(hash_map, keys):
+    start = time.perf_counter()
+    for key in keys:
+        try:
+            hash_map[key]
+        except KeyError:
+            pass
+    return (time.perf_counter() - start) / len(keys) * 1e6
+
+
+def main(n_keys=50_000):
+    capacity = n_keys * 4 // 3
+    print(f"{n_keys} keys, capacity={capacity}")
+    header = ("keys", "implementation", "hit us", "miss us", "__eq__ / lookup")
+    print("{:<12}{:<16}{:>8}{:>9}{:>17}".format(*header))
+    for key_type, make_key in KEY_TYPES.items():
+        # build the lookup keys separately so that they are equal to the keys
+        # in the map but not the same objects
+        keys = [make_key(i) for i in range(n_keys)]
+        hits = [make_key(i) for i in range(n_keys)]
+        misses = [make_key(i) for i in range(n_keys, 2 * n_keys)]
+        for name, hash_map in (
+            ("FixedHashMap", FixedHashMap(capacity)),
+            ("dict", {}),
+        ):
+            for key in keys:
+                hash_map[key] = key
+            Point.eq_calls = 0
+            hit, miss = lookup_us(hash_map, hits), lookup_us(hash_map, misses)
+            eq_calls = Point.eq_calls / (2 * n_keys)
+            eq_calls = f"{eq_calls:.2f}" if key_type == "dataclass" else "-"
+            print(f"{key_type:<12}{name:<16}{hit:>8.2f}{miss:>9.2f}{eq_calls:>17}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
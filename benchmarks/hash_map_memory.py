@@ -0,0 +1,45 @@
+"""Memory use and iteration time of a mostly empty `FixedHashMap`.
+
+Allocates a map with `capacity` slots, measures its size while empty and after
+inserting `n_keys` keys, and times `keys()`. A `dict` is included for
+reference.
+
+    python benchmarks/hash_map_memory.py [capacity] [n_keys]
+"""
+import sys
+import time
+import tracemalloc
+
+from datastructures import FixedHashMap
+
+
+def measure(make_map, n_keys):
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    hash_map = make_map()
+    empty, _ = tracemalloc.get_traced_memory()
+    for key in range(n_keys):
+        hash_map[key] = key
+    full, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    before = time.perf_counter()
+    for _ in range(100):
+        list(hash_map.keys())
+    keys_us = (time.perf_counter() - before) / 100 * 1e6
+    return empty - start, full - empty, keys_us
+
+
+def main(capacity=1_000_000, n_keys=1000):
+    print(f"capacity={capacity}, {n_keys} keys")
+    header = ("implementation", "empty bytes", "bytes / key", "keys() us")
+    print("{:<16}{:>14}{:>14}{:>12}".format(*header))
+    for name, make_map in (
+        ("FixedHashMap", lambda: FixedHashMap(capacity)),
+        ("dict", dict),
+    ):
+        empty, full, keys_us = measure(make_map, n_keys)
+        print(f"{name:<16}{empty:>14,}{full / n_keys:>14.1f}{keys_us:>12.1f}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,69 @@
+"""Probe counts of linear probing vs Robin Hood probing in `FixedHashMap`.
+
+Fills a map with random keys up to each load factor and reports the mean and
+99th percentile number of slots that a lookup inspects, for keys in the map
+(hits) and keys that are not (misses).
+
+    python benchmarks/hash_map_probes.py [capacity] [n_misses]
+"""
+import random
+import statistics
+import sys
+
+from datastructures import FixedHashMap
+
+LOADS = (0.5, 0.6, 0.7, 0.8, 0.9, 0.95)
+
+
+def hit_probes(fhm):
+    # no keys were deleted, so every entry is its distance from its home slot
+    # plus one away from where a lookup starts
+    return [
+        (slot - fhm._hashes[entry]) % fhm.capacity + 1
+        for slot, entry in enumerate(fhm.data)
+        if entry >= 0
+    ]
+
+
+def miss_probes(fhm, key):
+    slot = hash(key) % fhm.capacity
+    probes = 1
+    while True:
+        entry = fhm.data[slot]
+        if entry < 0:
+            return probes
+        distance = (slot - fhm._hashes[entry]) % fhm.capacity
+        if fhm.robin_hood and distance < probes - 1:
+            return probes
+        slot = (slot + 1) % fhm.capacity
+        probes += 1
+
+
+def summary(probes):
+    probes = sorted(probes)
+    return statistics.mean(probes), probes[int(len(probes) * 0.99)]
+
+
+def main(capacity=100_000, n_misses=10_000):
+    random.seed(0)
+    keys = [random.getrandbits(60) for _ in range(capacity)]
+    # missing keys are negative, the keys in the map are not
+    missing = [-random.getrandbits(60) - 1 for _ in range(n_misses)]
+    print(f"capacity={capacity}")
+    header = ("load", "probing", "hit mean", "hit p99", "miss mean", "miss p99")
+    print("{:>6}{:>12}{:>10}{:>9}{:>11}{:>10}".format(*header))
+    for load in LOADS:
+        for name, robin_hood in (("linear", False), ("robin hood", True)):
+            fhm = FixedHashMap(capacity, robin_hood=robin_hood)
+            for key in keys[: int(capacity * load)]:
+                fhm[key] = key
+            hit_mean, hit_p99 = summary(hit_probes(fhm))
+            miss_mean, miss_p99 = summary(miss_probes(fhm, key) for key in missing)
+            print(
+                f"{load:>6.2f}{name:>12}{hit_mean:>10.2f}{hit_p99:>9}"
+                f"{miss_mean:>11.2f}{miss_p99:>10}"
+            )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
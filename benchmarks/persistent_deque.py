@@ -0,0 +1,57 @@
+"""Work queue checkpoints: `Deque.copy()` snapshots vs `PersistentDeque`.
+
+Each step pops one item, pushes one item and takes a snapshot of the queue.
+Also reports the one-off cost of `Deque.freeze()` compared with `Deque.copy()`.
+
+    python benchmarks/persistent_deque.py [queue_size] [n_steps]
+"""
+import sys
+import time
+
+from datastructures import Deque, PersistentDeque
+
+
+def deque_checkpoints(size, steps):
+    d = Deque(range(size))
+    snapshots = []
+    for i in range(steps):
+        d.popleft()
+        d.append(i)
+        snapshots.append(d.copy())
+    return snapshots
+
+
+def persistent_checkpoints(size, steps):
+    p = PersistentDeque(range(size))
+    snapshots = []
+    for i in range(steps):
+        p = p.popleft().append(i)
+        snapshots.append(p)
+    return snapshots
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def main(queue_size=10_000, n_steps=1000):
+    print(f"queue of {queue_size} items, {n_steps} checkpoints")
+    print(f"{'implementation':<28}{'checkpoints / sec':>20}")
+    for name, fn in [
+        ("Deque + copy()", deque_checkpoints),
+        ("PersistentDeque", persistent_checkpoints),
+    ]:
+        rate = n_steps / timed(fn, queue_size, n_steps)
+        print(f"{name:<28}{rate:>20,.0f}")
+
+    d = Deque(range(queue_size))
+    print(f"\nconverting a Deque of {queue_size} items")
+    print(f"{'method':<28}{'ms':>20}")
+    for name, fn in [("Deque.copy()", d.copy), ("Deque.freeze()", d.freeze)]:
+        print(f"{name:<28}{timed(fn) * 1000:>20.2f}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,73 @@
+"""Sliding window statistics over float samples: `Deque` vs `RingBuffer`.
+
+Every tick appends one sample to a window of `maxlen` samples and computes the
+sum, mean, min and max of the window. Also reports the memory used per sample.
+
+    python benchmarks/ring_buffer.py [window] [n_samples]
+"""
+import random
+import sys
+import time
+import tracemalloc
+
+from datastructures import Deque, RingBuffer
+
+
+def deque_tick(d, val):
+    d.append(val)
+    total = sum(d)
+    return total, total / len(d), min(d), max(d)
+
+
+def ring_tick(r, val):
+    r.append(val)
+    return r.sum(), r.mean(), r.min(), r.max()
+
+
+def run(make_window, tick, samples):
+    window = make_window()
+    start = time.perf_counter()
+    for val in samples:
+        tick(window, val)
+    return len(samples) / (time.perf_counter() - start)
+
+
+def bytes_per_sample(make_window, samples):
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    window = make_window()
+    window.extend(samples)
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (end - start) / len(window)
+
+
+def main(window=1000, n_samples=5000):
+    random.seed(0)
+    samples = [random.random() for _ in range(n_samples)]
+    cases = [
+        ("Deque", lambda: Deque(maxlen=window), deque_tick),
+        ("RingBuffer (array)", lambda: RingBuffer(maxlen=window), ring_tick),
+    ]
+    try:
+        import numpy  # noqa: F401
+
+        cases.append(
+            (
+                "RingBuffer (numpy)",
+                lambda: RingBuffer(maxlen=window, use_numpy=True),
+                ring_tick,
+            )
+        )
+    except ImportError:
+        print("numpy is not installed, skipping the numpy backend")
+    print(f"window={window}, {n_samples} samples")
+    print(f"{'implementation':<24}{'ticks / sec':>14}{'bytes / sample':>16}")
+    for name, make_window, tick in cases:
+        rate = run(make_window, tick, samples)
+        size = bytes_per_sample(make_window, samples[:window])
+        print(f"{name:<24}{rate:>14,.0f}{size:>16.1f}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
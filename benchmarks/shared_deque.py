@@ -0,0 +1,61 @@
+"""Throughput of passing records between processes: `SharedDeque` vs
+`multiprocessing.Queue`.
+
+Each producer process sends `n_records` `(int, float)` records to the parent
+process, which consumes them. Runs with one producer (single producer / single
+consumer) and with `n_producers` producers.
+
+    python benchmarks/shared_deque.py [n_records] [n_producers] [maxlen]
+"""
+import multiprocessing
+import sys
+import time
+
+from datastructures import SharedDeque
+
+
+def produce(queue, start, n_records):
+    for i in range(start, start + n_records):
+        queue.put((i, i * 0.5))
+
+
+def produce_shared(d, start, n_records):
+    for i in range(start, start + n_records):
+        d.append((i, i * 0.5))
+
+
+def run(target, queue, get, n_records, n_producers):
+    producers = [
+        multiprocessing.Process(target=target, args=(queue, i * n_records, n_records))
+        for i in range(n_producers)
+    ]
+    start = time.perf_counter()
+    for producer in producers:
+        producer.start()
+    for _ in range(n_records * n_producers):
+        get()
+    for producer in producers:
+        producer.join()
+    return n_records * n_producers / (time.perf_counter() - start)
+
+
+def main(n_records=200_000, n_producers=4, maxlen=1024):
+    print(f"{n_records} records per producer, maxlen={maxlen}")
+    print(f"{'implementation':<32}{'producers':>10}{'records / sec':>16}")
+    for producers in sorted({1, n_producers}):
+        queue = multiprocessing.Queue(maxlen)
+        rate = run(produce, queue, queue.get, n_records, producers)
+        print(f"{'multiprocessing.Queue':<32}{producers:>10}{rate:>16,.0f}")
+
+        d = SharedDeque(maxlen=maxlen, struct_format="qd", multi_producer=producers > 1)
+        try:
+            rate = run(produce_shared, d, d.popleft, n_records, producers)
+        finally:
+            d.close()
+            d.unlink()
+        name = "SharedDeque (" + ("multi producer" if producers > 1 else "SPSC") + ")"
+        print(f"{name:<32}{producers:>10}{rate:>16,.0f}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,54 @@
+"""Rolling min / max: rescanning a `Deque(maxlen=N)` vs `SlidingWindowAggregator`.
+
+    python benchmarks/sliding_window.py [window] [n_samples]
+"""
+import random
+import sys
+import time
+
+from datastructures import Deque, SlidingWindowAggregator
+
+
+def rescan(samples, window):
+    d = Deque(maxlen=window)
+    for val in samples:
+        d.append(val)
+        min(d)
+        max(d)
+
+
+def aggregate(samples, window):
+    agg = SlidingWindowAggregator(size=window)
+    for val in samples:
+        agg.push(val)
+        agg.min()
+        agg.max()
+
+
+def aggregate_batched(samples, window, batch=1000):
+    agg = SlidingWindowAggregator(size=window)
+    for i in range(0, len(samples), batch):
+        agg.extend(samples[i : i + batch])
+        agg.min()
+        agg.max()
+
+
+def main(window=1000, n_samples=20_000):
+    random.seed(0)
+    samples = [random.random() for _ in range(n_samples)]
+    print(f"window={window}, {n_samples} samples")
+    print(f"{'implementation':<36}{'samples / sec':>16}")
+    cases = [
+        ("Deque + min / max", rescan),
+        ("SlidingWindowAggregator.push", aggregate),
+        ("SlidingWindowAggregator.extend", aggregate_batched),
+    ]
+    for name, fn in cases:
+        start = time.perf_counter()
+        fn(samples, window)
+        rate = n_samples / (time.perf_counter() - start)
+        print(f"{name:<36}{rate:>16,.0f}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
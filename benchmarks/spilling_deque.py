@@ -0,0 +1,43 @@
+"""Peak memory and throughput of a queue backlog: `Deque` vs `SpillingDeque`.
+
+Appends `n_items` records (small dicts) and then pops them all from the left,
+like an ingest buffer absorbing a spike and draining it again.
+
+    python benchmarks/spilling_deque.py [n_items] [block_size] [memory_blocks]
+"""
+import sys
+import time
+import tracemalloc
+
+from datastructures import Deque, SpillingDeque
+
+
+def run(d, n_items):
+    tracemalloc.start()
+    start = time.perf_counter()
+    for i in range(n_items):
+        d.append({"id": i, "payload": "x" * 32})
+    filled = time.perf_counter()
+    while d:
+        d.popleft()
+    end = time.perf_counter()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return n_items / (filled - start), n_items / (end - filled), peak
+
+
+def main(n_items=500_000, block_size=4096, memory_blocks=4):
+    print(f"{n_items} items, block_size={block_size}, memory_blocks={memory_blocks}")
+    header = ("implementation", "appends / sec", "pops / sec", "peak MiB")
+    print("{:<16}{:>16}{:>14}{:>10}".format(*header))
+    cases = [
+        ("Deque", Deque()),
+        ("SpillingDeque", SpillingDeque(None, block_size, memory_blocks)),
+    ]
+    for name, d in cases:
+        appends, pops, peak = run(d, n_items)
+        print(f"{name:<16}{appends:>16,.0f}{pops:>14,.0f}{peak / 2**20:>10.1f}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -1,13 +1,31 @@
+from .async_deque import AsyncDeque
+from .block_deque import BlockDeque
+from .blocking_deque import BlockingDeque
 from .deque import Deque
 from .divide_and_conquer import binary_search, quicksort
 from .fixed_hash_map import FixedHashMap
 from .graph import SimpleGraph
+from .hash_map import HashMap
 from .heap import MaxHeap, MinHeap, PriorityQueue, heapsort
+from .persistent_deque import PersistentDeque
+from .ring_buffer import RingBuffer
+from .shared_deque import SharedDeque
+from .sliding_window import SlidingWindowAggregator
+from .spilling_deque import SpillingDeque
 from .tree import BinaryTree
 
 __all__ = [
     "FixedHashMap",
+    "HashMap",
     "Deque",
+    "BlockDeque",
+    "BlockingDeque",
+    "AsyncDeque",
+    "PersistentDeque",
+    "SharedDeque",
+    "SpillingDeque",
+    "RingBuffer",
+    "SlidingWindowAggregator",
     "BinaryTree",
     "MaxHeap",
     "MinHeap",
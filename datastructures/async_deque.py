@@ -0,0 +1,144 @@
+"""An asyncio deque whose pops wait for items and appends wait for room."""
+import asyncio
+
+from .deque import Deque
+
+# Note: waiting coroutines park on futures that are kept in FIFO order, the
+#       same way `asyncio.Queue` is implemented. An append wakes the oldest
+#       waiting consumer and a pop wakes the oldest waiting producer. No threads
+#       or locks are involved since everything runs on the event loop.
+#       https://github.com/python/cpython/blob/main/Lib/asyncio/queues.py
+
+
+class AsyncDeque:
+    """A `Deque` for asyncio producers and consumers.
+
+    `pop` and `popleft` wait until there is an item rather than raising, and
+    `append` and `appendleft` wait until there is room when the deque is at
+    `maxlen` rather than evicting an item from the other end.
+
+    """
+
+    def __init__(self, iterable=None, maxlen=None):
+        if maxlen is not None and maxlen <= 0:
+            # nothing could ever be appended, so every append would wait forever
+            raise ValueError("maxlen must be > 0")
+        self._deque = Deque(iterable, maxlen=maxlen)
+        # futures of the coroutines that are waiting for an item / for room
+        self._getters = Deque()
+        self._putters = Deque()
+
+    @property
+    def maxlen(self):
+        return self._deque.maxlen
+
+    def _full(self):
+        maxlen = self._deque.maxlen
+        return maxlen is not None and len(self._deque) >= maxlen
+
+    @staticmethod
+    def _wakeup_next(waiters):
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+    @staticmethod
+    async def _wait(waiters):
+        waiter = asyncio.get_running_loop().create_future()
+        waiters.append(waiter)
+        try:
+            await waiter
+        except BaseException:
+            waiter.cancel()
+            try:
+                waiters.remove(waiter)
+            except ValueError:
+                # the waiter was already woken up
+                pass
+            raise
+
+    async def _wait_for_items(self):
+        # we loop since another coroutine may take the item between our wakeup
+        # and the time that we get to run
+        while not self._deque:
+            try:
+                await self._wait(self._getters)
+            except BaseException:
+                # if we were cancelled after being woken, hand the wakeup on
+                if self._deque:
+                    self._wakeup_next(self._getters)
+                raise
+
+    async def _wait_for_room(self):
+        while self._full():
+            try:
+                await self._wait(self._putters)
+            except BaseException:
+                if not self._full():
+                    self._wakeup_next(self._putters)
+                raise
+
+    # the public methods check for the fast path themselves so that we don't
+    # create an extra coroutine per call when there is no need to wait
+
+    async def append(self, val):
+        if self._full():
+            await self._wait_for_room()
+        self._deque.append(val)
+        if self._getters:
+            self._wakeup_next(self._getters)
+
+    async def appendleft(self, val):
+        if self._full():
+            await self._wait_for_room()
+        self._deque.appendleft(val)
+        if self._getters:
+            self._wakeup_next(self._getters)
+
+    async def pop(self):
+        if not self._deque:
+            await self._wait_for_items()
+        val = self._deque.pop()
+        if self._putters:
+            self._wakeup_next(self._putters)
+        return val
+
+    async def popleft(self):
+        if not self._deque:
+            await self._wait_for_items()
+        val = self._deque.popleft()
+        if self._putters:
+            self._wakeup_next(self._putters)
+        return val
+
+    async def get_many(self, max_items, timeout=None):
+        """Pop up to max_items items from the left in a single call.
+
+        This waits until there is at least one item and returns an empty list
+        if the timeout expires first.
+
+        """
+        if not self._deque:
+            if timeout is None:
+                # `wait_for` wraps the wait in a task, so skip it if we can
+                await self._wait_for_items()
+            else:
+                try:
+                    await asyncio.wait_for(self._wait_for_items(), timeout)
+                except asyncio.TimeoutError:
+                    return []
+        popleft = self._deque.popleft
+        items = [popleft() for _ in range(min(max_items, len(self._deque)))]
+        for _ in items:
+            if not self._putters:
+                break
+            self._wakeup_next(self._putters)
+        return items
+
+    def __len__(self):
+        return len(self._deque)
+
+    def __repr__(self):
+        return f"Async{self._deque!r}"
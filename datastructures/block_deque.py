@@ -0,0 +1,420 @@
+"""A linked list of fixed-size blocks implementation of a deque."""
+from functools import total_ordering
+from operator import index as as_index
+
+# Note: this mirrors the layout used by CPython for `collections.deque`. Rather
+#       than allocating one node per item, items are stored in fixed-size
+#       arrays (blocks) and only the blocks are linked together.
+#       https://github.com/python/cpython/blob/main/Modules/_collectionsmodule.c
+
+# number of items stored in each block
+BLOCKLEN = 64
+# an empty deque starts in the middle of its only block so that both `append`
+# and `appendleft` can run without immediately allocating a new block
+CENTER = (BLOCKLEN - 1) // 2
+
+
+@total_ordering
+class BlockDeque:
+    """A pure python implementation of collections.deque that uses blocks
+
+    `BlockDeque` only provides the `collections.deque` API: appends and pops at
+    both ends, `extend`, `rotate`, `index`, `insert`, `remove`, integer
+    indexing and the sequence operators. It does not have the additions of
+    `Deque` (slice views, `splice`, `split`, `remove_all`, `retain`, `cursor`
+    and `freeze`), which rely on relinking single nodes.
+
+    """
+
+    class _Block:
+        __slots__ = ("data", "parent", "child")
+
+        def __init__(self):
+            self.data = [None] * BLOCKLEN
+            self.parent = None
+            self.child = None
+
+        def __repr__(self):  # pragma: no cover
+            return f"BlockDeque._Block({self.data})"
+
+    # We need this separate iterator class so that we can pickle the iterator
+    class _Iterator:
+        def __init__(self, deque, reverse=False, consumed=0):
+            self.deque = deque
+            self.reverse = reverse
+            self.remaining = len(deque) - consumed
+            self.state = deque._state
+            if self.remaining <= 0:
+                self.remaining = 0
+                self.block, self.index = None, 0
+            elif reverse:
+                self.block, self.index = deque._locate(len(deque) - 1 - consumed)
+            else:
+                self.block, self.index = deque._locate(consumed)
+
+        def __iter__(self):
+            return self
+
+        def __next__(self):
+            if self.deque._state != self.state:
+                raise RuntimeError("BlockDeque mutated during iteration")
+            if self.remaining == 0:
+                raise StopIteration
+            val = self.block.data[self.index]
+            self.remaining -= 1
+            if self.reverse:
+                self.index -= 1
+                if self.index < 0 and self.remaining:
+                    self.block = self.block.parent
+                    self.index = BLOCKLEN - 1
+            else:
+                self.index += 1
+                if self.index == BLOCKLEN and self.remaining:
+                    self.block = self.block.child
+                    self.index = 0
+            return val
+
+        def __reduce__(self):
+            # the blocks are rebuilt when the deque is unpickled, so we store
+            # the position of the iterator rather than the block it points to
+            consumed = len(self.deque) - self.remaining
+            return type(self), (self.deque, self.reverse, consumed)
+
+    def __init__(self, iterable=None, maxlen=None):
+        if maxlen is not None and maxlen < 0:
+            raise ValueError("maxlen must be > 0")
+        self._maxlen = maxlen
+        self._state = getattr(self, "_state", 0) + 1
+        self._reset()
+        if iterable is not None:
+            self.extend(iterable)
+
+    def _reset(self):
+        self.head = self.tail = self._Block()
+        self.leftindex = CENTER + 1
+        self.rightindex = CENTER
+        self._total_items = 0
+
+    @property
+    def maxlen(self):
+        return self._maxlen
+
+    def _check_not_mutated(self, start_state):
+        if self._state != start_state:
+            raise RuntimeError("BlockDeque mutated during iteration")
+
+    def append(self, val):
+        if self.maxlen is not None and self._total_items >= self.maxlen:
+            if self.maxlen == 0:
+                return
+            else:
+                self.popleft()
+        if self.rightindex == BLOCKLEN - 1:
+            block = self._Block()
+            block.parent = self.tail
+            self.tail.child = block
+            self.tail = block
+            self.rightindex = -1
+        self.rightindex += 1
+        self.tail.data[self.rightindex] = val
+        self._total_items += 1
+        self._state += 1
+
+    def appendleft(self, val):
+        if self.maxlen is not None and self._total_items >= self.maxlen:
+            if self.maxlen == 0:
+                return
+            else:
+                self.pop()
+        if self.leftindex == 0:
+            block = self._Block()
+            block.child = self.head
+            self.head.parent = block
+            self.head = block
+            self.leftindex = BLOCKLEN
+        self.leftindex -= 1
+        self.head.data[self.leftindex] = val
+        self._total_items += 1
+        self._state += 1
+
+    def pop(self):
+        if self._total_items == 0:
+            raise IndexError("pop from an empty BlockDeque")
+        block = self.tail
+        val = block.data[self.rightindex]
+        # drop the reference so that the item can be garbage collected
+        block.data[self.rightindex] = None
+        self.rightindex -= 1
+        self._total_items -= 1
+        self._state += 1
+        if self._total_items == 0:
+            # recenter the only remaining block
+            self.leftindex = CENTER + 1
+            self.rightindex = CENTER
+        elif self.rightindex < 0:
+            self.tail = block.parent
+            self.tail.child = None
+            self.rightindex = BLOCKLEN - 1
+        return val
+
+    def popleft(self):
+        if self._total_items == 0:
+            raise IndexError("pop from an empty BlockDeque")
+        block = self.head
+        val = block.data[self.leftindex]
+        # drop the reference so that the item can be garbage collected
+        block.data[self.leftindex] = None
+        self.leftindex += 1
+        self._total_items -= 1
+        self._state += 1
+        if self._total_items == 0:
+            # recenter the only remaining block
+            self.leftindex = CENTER + 1
+            self.rightindex = CENTER
+        elif self.leftindex == BLOCKLEN:
+            self.head = block.child
+            self.head.parent = None
+            self.leftindex = 0
+        return val
+
+    def count(self, x):
+        return sum(1 for item in self if item == x)
+
+    def copy(self):
+        return BlockDeque(self, maxlen=self.maxlen)
+
+    def clear(self):
+        # the old blocks are simply dropped and reclaimed by the garbage
+        # collector
+        self._reset()
+        self._state += 1
+
+    def extend(self, iterable):
+        if iterable is self:
+            # iterate over the data in advance since iterable is self
+            iterable = list(iterable)
+        append = self.append
+        for i in iterable:
+            append(i)
+
+    def extendleft(self, iterable):
+        if iterable is self:
+            # iterate over the data in advance since iterable is self
+            iterable = list(iterable)
+        appendleft = self.appendleft
+        for i in iterable:
+            appendleft(i)
+
+    def reverse(self):
+        # swap items pairwise from both ends, walking towards the middle
+        left_block, left = self.head, self.leftindex
+        right_block, right = self.tail, self.rightindex
+        for _ in range(self._total_items // 2):
+            left_data, right_data = left_block.data, right_block.data
+            left_data[left], right_data[right] = right_data[right], left_data[left]
+            left += 1
+            if left == BLOCKLEN:
+                left_block, left = left_block.child, 0
+            right -= 1
+            if right < 0:
+                right_block, right = right_block.parent, BLOCKLEN - 1
+        self._state += 1
+
+    def remove(self, value):
+        del self[self.index(value)]
+
+    def rotate(self, n=1):
+        n = as_index(n)
+        total = self._total_items
+        if total <= 1:
+            return
+        # rotate in whichever direction moves fewer items
+        n %= total
+        if n > total // 2:
+            n -= total
+        if n > 0:
+            pop, appendleft = self.pop, self.appendleft
+            for _ in range(n):
+                appendleft(pop())
+        elif n < 0:
+            popleft, append = self.popleft, self.append
+            for _ in range(-n):
+                append(popleft())
+
+    def _rectify_negative_index(self, idx):
+        if idx < 0:
+            idx = self._total_items + idx
+        return idx
+
+    def index(self, x, start=None, stop=None):
+        if start is None:
+            start = 0
+        if stop is None:
+            stop = self._total_items
+        start = max(self._rectify_negative_index(start), 0)
+        stop = min(self._rectify_negative_index(stop), self._total_items)
+        if start < stop:
+            it = self._Iterator(self, consumed=start)
+            for idx in range(start, stop):
+                if next(it) == x:
+                    # the comparison above could have mutated the deque
+                    self._check_not_mutated(it.state)
+                    return idx
+                self._check_not_mutated(it.state)
+        raise ValueError(f"{x} is not in the BlockDeque")
+
+    def insert(self, i, x):
+        if self.maxlen is not None and self._total_items >= self.maxlen:
+            raise IndexError("BlockDeque already at its maximum size")
+        if i < -self._total_items:
+            i = 0
+        if i >= self._total_items:
+            i = self._total_items
+        i = self._rectify_negative_index(i)
+        if i == self._total_items:
+            self.append(x)
+            return
+        # rotate the insertion point to the left end, insert, and rotate back
+        self.rotate(-i)
+        self.appendleft(x)
+        self.rotate(i)
+
+    def __len__(self):
+        return self._total_items
+
+    def _locate(self, index):
+        """Find the block and the offset within the block of index.
+
+        This only needs to walk the blocks between index and the closest end,
+        so it costs O(n / BLOCKLEN).
+
+        """
+        if index >= self._total_items or index < -self._total_items:
+            raise IndexError("index out of range")
+        index = self._rectify_negative_index(index)
+        if index <= (self._total_items - 1) // 2:
+            offset = index + self.leftindex
+            block = self.head
+            for _ in range(offset // BLOCKLEN):
+                block = block.child
+            return block, offset % BLOCKLEN
+        else:
+            # distance from the last slot of the tail block
+            offset = (BLOCKLEN - 1 - self.rightindex) + (self._total_items - 1 - index)
+            block = self.tail
+            for _ in range(offset // BLOCKLEN):
+                block = block.parent
+            return block, BLOCKLEN - 1 - offset % BLOCKLEN
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            raise TypeError("BlockDeque does not support slicing, use Deque")
+        if not isinstance(index, int):
+            raise TypeError(f"sequence index must be integer, not '{type(index)}'")
+        block, offset = self._locate(index)
+        return block.data[offset]
+
+    def __setitem__(self, index, value):
+        block, offset = self._locate(index)
+        block.data[offset] = value
+
+    def __delitem__(self, index):
+        # validate the index before rotating
+        self._locate(index)
+        index = self._rectify_negative_index(index)
+        self.rotate(-index)
+        self.popleft()
+        self.rotate(index)
+
+    def __contains__(self, item):
+        return any(val == item for val in self)
+
+    def __iter__(self):
+        return self._Iterator(self)
+
+    def __reversed__(self):
+        return self._Iterator(self, reverse=True)
+
+    def __eq__(self, other):
+        if isinstance(other, BlockDeque):
+            return len(self) == len(other) and all(s == o for s, o in zip(self, other))
+        else:
+            return False
+
+    def __lt__(self, other):
+        if isinstance(other, BlockDeque):
+            # look for the first item in `self` that is less than `other`
+            for s, o in zip(self, other):
+                if s != o:
+                    return s < o
+            # if all items are equal, check that the length of `self` is
+            # strictly less than `other`
+            return len(self) < len(other)
+        else:
+            raise TypeError(
+                f"supported between instances of '{type(self)}' and " f"'{type(other)}'"
+            )
+
+    def __add__(self, other):
+        if isinstance(other, BlockDeque):
+            ret = BlockDeque(self, maxlen=self.maxlen)
+            ret.extend(other)
+            return ret
+        else:
+            raise TypeError(
+                f'can only concatenate BlockDeque (not "{type(other)}") to BlockDeque'
+            )
+
+    def __iadd__(self, other):
+        self.extend(other)
+        return self
+
+    def __mul__(self, other):
+        if isinstance(other, int):
+            ret = BlockDeque(maxlen=self.maxlen)
+            if other > 0:
+                tmp_self = list(self)
+                for _ in range(other):
+                    ret.extend(tmp_self)
+            return ret
+        else:
+            raise TypeError(
+                f"can't multiply sequence by non-int of type '{type(other)}'"
+            )
+
+    def __rmul__(self, first):
+        return self * first
+
+    def __imul__(self, other):
+        if isinstance(other, int):
+            if other <= 0:
+                self.clear()
+            else:
+                tmp_self = list(self)
+                for _ in range(other - 1):
+                    self.extend(tmp_self)
+            return self
+        else:
+            raise TypeError(
+                f"can't multiply sequence by non-int of type '{type(other)}'"
+            )
+
+    def __reduce__(self):
+        # the items are passed as an iterator so that pickle adds them back with
+        # `extend`, this lets self referential deques round trip
+        return type(self), ((), self.maxlen), None, iter(self)
+
+    def __str__(self):
+        # see `Deque.__str__` for why self references are truncated
+        inner = ", ".join(
+            str(n) if not isinstance(n, BlockDeque) else "BlockDeque([...])"
+            for n in self
+        )
+        return f"[{inner}]"
+
+    def __repr__(self):
+        ret = f"BlockDeque({self}"
+        if self.maxlen is not None:
+            ret += f", maxlen={self.maxlen}"
+        ret += ")"
+        return ret
@@ -0,0 +1,182 @@
+"""A thread-safe deque that blocks instead of failing or evicting."""
+import threading
+import time
+from collections import deque
+
+from .deque import Deque
+
+# Note: a single mutex guards the deque and is only held for the O(1) deque
+#       operation itself. Rather than waiting on `threading.Condition`s like
+#       `queue.Queue`, a blocked thread parks on its own lock, which is kept in
+#       a FIFO of waiters the same way `AsyncDeque` keeps its futures. An append
+#       pops the oldest waiting consumer and releases its lock (and a pop does
+#       the same for producers). A thread that was woken up is no longer in the
+#       FIFO while it waits to run again, so later calls see that nobody is
+#       waiting and skip the wakeup entirely.
+#       https://github.com/python/cpython/blob/main/Lib/asyncio/queues.py
+
+
+class BlockingDeque:
+    """A thread-safe wrapper around `Deque` with blocking pops and appends.
+
+    Unlike `Deque`, appending to a full `BlockingDeque` waits until a consumer
+    makes room rather than evicting an item from the other end. Both pops and
+    appends take `block` and `timeout` arguments, and raise `IndexError` when
+    they cannot complete.
+
+    """
+
+    def __init__(self, iterable=None, maxlen=None):
+        if maxlen is not None and maxlen <= 0:
+            # nothing could ever be appended, so every append would block
+            raise ValueError("maxlen must be > 0")
+        self._deque = Deque(iterable, maxlen=maxlen)
+        self._maxlen = maxlen
+        # a plain counter is cheaper to check under the lock than `len(Deque)`
+        self._size = len(self._deque)
+        self._lock = threading.Lock()
+        # the locks of the threads that are waiting for an item / for room, every
+        # call checks these so they are builtin deques whose truth test is cheap
+        self._getters = deque()
+        self._putters = deque()
+
+    @property
+    def maxlen(self):
+        return self._maxlen
+
+    def _has_items(self):
+        return self._size > 0
+
+    def _has_room(self):
+        return self._maxlen is None or self._size < self._maxlen
+
+    @staticmethod
+    def _wakeup_next(waiters):
+        if waiters:
+            waiters.popleft().release()
+
+    @staticmethod
+    def _discard(waiters, waiter):
+        try:
+            waiters.remove(waiter)
+        except ValueError:
+            # the waiter was already woken up
+            pass
+
+    def _wait(self, waiters, ready, timeout):
+        """Park until ready() or the timeout expires. The lock must be held."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        # we loop since another thread may take the item (or the room) between
+        # our wakeup and the time that we get the lock back
+        while not ready():
+            remaining = -1
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+            waiter = threading.Lock()
+            waiter.acquire()
+            waiters.append(waiter)
+            self._lock.release()
+            try:
+                woken = waiter.acquire(True, remaining)
+            except BaseException:
+                self._lock.acquire()
+                self._discard(waiters, waiter)
+                # if we were interrupted after being woken, hand the wakeup on
+                if ready():
+                    self._wakeup_next(waiters)
+                raise
+            self._lock.acquire()
+            if not woken:
+                self._discard(waiters, waiter)
+        return True
+
+    def _push(self, val, left, block, timeout):
+        """Append val, waiting for room if needed. The lock must be held."""
+        if not self._has_room():
+            if not block or not self._wait(self._putters, self._has_room, timeout):
+                raise IndexError("BlockingDeque already at its maximum size")
+        if left:
+            self._deque.appendleft(val)
+        else:
+            self._deque.append(val)
+        self._size += 1
+        if self._getters:
+            self._wakeup_next(self._getters)
+
+    def _pop(self, left, block, timeout):
+        """Pop an item, waiting for one if needed. The lock must be held."""
+        if not self._size:
+            if not block or not self._wait(self._getters, self._has_items, timeout):
+                raise IndexError("pop from an empty BlockingDeque")
+        val = self._deque.popleft() if left else self._deque.pop()
+        self._size -= 1
+        if self._putters:
+            self._wakeup_next(self._putters)
+        return val
+
+    # `append` and `popleft`, the usual producer / consumer pair, inline the
+    # case where they don't have to wait
+
+    def append(self, val, block=True, timeout=None):
+        with self._lock:
+            if self._maxlen is None or self._size < self._maxlen:
+                self._deque.append(val)
+                self._size += 1
+                if self._getters:
+                    self._getters.popleft().release()
+                return
+            self._push(val, False, block, timeout)
+
+    def appendleft(self, val, block=True, timeout=None):
+        with self._lock:
+            self._push(val, True, block, timeout)
+
+    def pop(self, block=True, timeout=None):
+        with self._lock:
+            return self._pop(False, block, timeout)
+
+    def popleft(self, block=True, timeout=None):
+        with self._lock:
+            if self._size:
+                val = self._deque.popleft()
+                self._size -= 1
+                if self._putters:
+                    self._putters.popleft().release()
+                return val
+            return self._pop(True, block, timeout)
+
+    def drain(self, n=None, block=False, timeout=None):
+        """Pop up to n items (or all of them) from the left under one lock.
+
+        When `block` is set, this waits until there is at least one item and
+        returns an empty list if the timeout expires first.
+
+        """
+        if n is not None and n < 0:
+            raise ValueError("n must be >= 0")
+        with self._lock:
+            if block and not self._size:
+                self._wait(self._getters, self._has_items, timeout)
+            count = self._size if n is None else min(n, self._size)
+            popleft = self._deque.popleft
+            items = [popleft() for _ in range(count)]
+            self._size -= count
+            for _ in range(min(count, len(self._putters))):
+                self._wakeup_next(self._putters)
+            return items
+
+    def clear(self):
+        with self._lock:
+            self._deque.clear()
+            self._size = 0
+            while self._putters:
+                self._wakeup_next(self._putters)
+
+    def __len__(self):
+        return self._size
+
+    def __repr__(self):
+        with self._lock:
+            return f"Blocking{self._deque!r}"
@@ -9,12 +9,21 @@ from functools import total_ordering
 #       `__eq__` and `__lt__`.
 #       https://docs.python.org/3/library/functools.html#functools.total_ordering
 
+# comparing two objects whose types are both in this set only runs builtin code,
+# so such a comparison cannot mutate the deque
+_BUILTIN_SCALARS = frozenset({int, float, complex, bool, str, bytes, type(None)})
+
 
 @total_ordering
 class Deque:
     """A pure python implementation of collections.deque"""
 
     class _Node:
+        # nodes are allocated once per item, so we avoid a per node `__dict__`
+        # and a finalizer. Unreachable chains are reclaimed by the garbage
+        # collector.
+        __slots__ = ("val", "parent", "child")
+
         def __init__(self, val):
             self.val = val
             self.parent = None
@@ -28,25 +37,21 @@ class Deque:
             node.child = self
             self.parent = node
 
-        def set_none(self, var_name):
-            if hasattr(self, var_name):
-                setattr(self, var_name, None)
-
-        def clear(self, unlink=False):
-            # the reason we use hasattr is because this method has to work
-            # even if the initializer fails to fully run (since it is used in
-            # `__del__`
-            if unlink:
-                if hasattr(self, "parent") and self.parent is not None:
-                    self.parent.child = self.child
-                if hasattr(self, "parent") and self.child is not None:
-                    self.child.parent = self.parent
-            self.set_none("val")
-            self.set_none("parent")
-            self.set_none("child")
-
-        def __del__(self):
-            self.clear(True)
+        def unlink(self):
+            """Remove the node from its chain by linking its neighbors."""
+            if self.parent is not None:
+                self.parent.child = self.child
+            if self.child is not None:
+                self.child.parent = self.parent
+            self.val = self.parent = self.child = None
+
+        # pickle protocols 0 and 1 need these to pickle a class with __slots__
+        # (e.g. when pickling a `Deque._Iterator`)
+        def __getstate__(self):
+            return self.val, self.parent, self.child
+
+        def __setstate__(self, state):
+            self.val, self.parent, self.child = state
 
         def __eq__(self, other):  # pragma: no cover
             return self.val == other.val
@@ -81,6 +86,135 @@ class Deque:
                 self._update()
                 return node if self.node else node.val
 
+    class _View:
+        """A lazy view of a slice of a `Deque`.
+
+        No items are copied when the view is created. Each traversal starts
+        from whichever of the head, tail or finger is closest to the first
+        index of the slice and then follows the links, skipping `step` nodes
+        at a time. Mutating the deque invalidates the view.
+
+        """
+
+        def __init__(self, deque, indices, state) -> None:
+            self.deque = deque
+            # a `range` of (logical) indices into the deque
+            self.indices = indices
+            self.state = state
+
+        def __len__(self):
+            self.deque._check_not_mutated(self.state)
+            return len(self.indices)
+
+        def _iter(self, indices):
+            deque = self.deque
+            deque._check_not_mutated(self.state)
+            if not indices:
+                return
+            node = deque._getnode(indices[0])
+            step = abs(indices.step)
+            # the physical direction depends on the orientation of the deque
+            forward = (indices.step > 0) != deque._reversed
+            for _ in range(len(indices) - 1):
+                yield node.val
+                deque._check_not_mutated(self.state)
+                for _ in range(step):
+                    node = node.child if forward else node.parent
+            yield node.val
+
+        def __iter__(self):
+            return self._iter(self.indices)
+
+        def __reversed__(self):
+            return self._iter(self.indices[::-1])
+
+        def __getitem__(self, index):
+            self.deque._check_not_mutated(self.state)
+            if isinstance(index, slice):
+                return type(self)(self.deque, self.indices[index], self.state)
+            return self.deque._getnode(self.indices[index]).val
+
+        def copy(self):
+            """Materialize the view into a new `Deque`."""
+            return Deque(self)
+
+        def __repr__(self):
+            return f"Deque._View({list(self)})"
+
+    class _Cursor(_Iterator):
+        """A position in a `Deque` that allows O(1) edits while walking it.
+
+        The cursor sits on one item and holds a reference to its node, so it
+        can move in both directions and insert or remove items around it
+        without looking up an index again. Moving past either end leaves the
+        cursor off the deque. Changing the deque other than through this
+        cursor invalidates it.
+
+        """
+
+        def __init__(self, deque, node, index) -> None:
+            # the iterator walks the chain in the deque's logical order
+            super().__init__(node, reverse=deque._reversed)
+            self.deque = deque
+            self.index = index
+            self.state = deque._state
+
+        def _check(self):
+            self.deque._check_not_mutated(self.state)
+            if self.current is None:
+                raise IndexError("cursor is not on an item of the Deque")
+
+        def __next__(self):
+            self.deque._check_not_mutated(self.state)
+            val = super().__next__()
+            self.index += 1
+            return val
+
+        @property
+        def value(self):
+            self._check()
+            return self.current.val
+
+        def replace(self, val):
+            self._check()
+            self.current.val = val
+
+        def move_next(self):
+            """Move to the next item, return False if we moved past the end."""
+            self._check()
+            self._update()
+            self.index += 1
+            return self.current is not None
+
+        def move_prev(self):
+            """Move to the previous item, return False if we moved past the start."""
+            self._check()
+            self.current = self.current.child if self.reverse else self.current.parent
+            self.index -= 1
+            return self.current is not None
+
+        def insert_before(self, val):
+            self._check()
+            # in a reversed deque, the previous item is the next node in the chain
+            self.deque._link_node(self.current, val, after=self.reverse)
+            self.index += 1
+            self.state = self.deque._state
+
+        def insert_after(self, val):
+            self._check()
+            self.deque._link_node(self.current, val, after=not self.reverse)
+            self.state = self.deque._state
+
+        def remove_current(self):
+            """Remove the current item and move to the one after it."""
+            self._check()
+            node = self.current
+            val = node.val
+            self._update()
+            self.deque._unlink_node(node)
+            self.state = self.deque._state
+            return val
+
     def __init__(self, iterable=None, maxlen=None):
         if maxlen is not None and maxlen < 0:
             raise ValueError("maxlen must be > 0")
@@ -91,6 +225,12 @@ class Deque:
         self.tail = None
         self._total_items = 0
         self._maxlen = maxlen
+        # (index, node) of the last node found by `_walk`. Like `head` and
+        # `tail`, the index refers to the physical order of the chain
+        self._finger = None
+        # when set, the logical left end of the deque is `tail` rather than
+        # `head`, which lets `reverse` run in O(1)
+        self._reversed = False
         self.__is_iterating = False
         self.__state = 0  # moves whenever indices are changed
         if iterable is not None:
@@ -100,131 +240,449 @@ class Deque:
     def maxlen(self):
         return self._maxlen
 
+    @property
+    def _state(self):
+        return self.__state
+
     def _check_not_mutated(self, start_state):
         if self.__state != start_state:
             raise RuntimeError("linked list mutated during iteration")
 
-    def append(self, val):
+    def _push(self, val, left):
+        """Link a new node at the head (left) or the tail of the chain."""
         if self.maxlen is not None and self._total_items >= self.maxlen:
             if self.maxlen == 0:
                 return
             else:
-                self.popleft()
-        if self.tail is None:
-            self.head = self.tail = self._Node(val)
+                self._pop(not left)
+        node = self._Node(val)
+        if self.head is None:
+            self.head = self.tail = node
+        elif left:
+            self.head.appendleft(node)
+            self.head = node
         else:
-            node = self._Node(val)
             self.tail.append(node)
             self.tail = node
         self._total_items += 1
         self.__state += 1
+        if left:
+            self._shift_finger(1)
 
-    def appendleft(self, val):
-        if self.maxlen is not None and self._total_items >= self.maxlen:
-            if self.maxlen == 0:
-                return
+    def _pop(self, left):
+        """Unlink the node at the head (left) or the tail of the chain."""
+        if len(self) == 0:
+            raise IndexError("pop from an empty Deque")
+        if left:
+            node = self.head
+            self.head = node.child
+            if self.head is None:
+                self.tail = None
             else:
-                self.pop()
-        if self.head is None:
-            self.head = self.tail = self._Node(val)
+                self.head.parent = None
         else:
-            node = self._Node(val)
-            self.head.appendleft(node)
-            self.head = node
-        self._total_items += 1
+            node = self.tail
+            self.tail = node.parent
+            if self.tail is None:
+                self.head = None
+            else:
+                self.tail.child = None
+        self._total_items -= 1
         self.__state += 1
+        if left:
+            self._shift_finger(-1)
+        elif self._finger is not None and self._finger[0] == self._total_items:
+            self._finger = None
+        return node.val
 
-    def count(self, x):
+    def append(self, val):
+        self._push(val, left=self._reversed)
+
+    def appendleft(self, val):
+        self._push(val, left=not self._reversed)
+
+    def pop(self):
+        return self._pop(left=self._reversed)
+
+    def popleft(self):
+        return self._pop(left=not self._reversed)
+
+    def _scan(self, x, start, stop, first):
+        """Compare x with the items at indices [start, stop) in order.
+
+        Returns the index of the first match (or -1) when first is set, and the
+        number of matches otherwise. The nodes are walked directly, and the
+        mutation state is only checked after comparisons that could have run
+        user code, i.e. unless both operands are builtin scalars. The finger
+        is left on the first match so that it can be accessed in O(1).
+
+        """
+        if start >= stop:
+            return -1 if first else 0
+        # when x is not a builtin scalar, every comparison has to be checked
+        scalars = _BUILTIN_SCALARS if type(x) in _BUILTIN_SCALARS else frozenset()
+        # the loop is duplicated for each direction since choosing the next
+        # node with a conditional costs about as much as the comparison itself
+        scan = self._scan_parents if self._reversed else self._scan_children
+        return scan(x, self._getnode(start), start, stop, first, scalars)
+
+    def _scan_children(self, x, node, start, stop, first, scalars):
+        """The loop of `_scan` for a deque that isn't reversed."""
+        start_state = self.__state
         total = 0
+        for idx in range(start, stop):
+            val = node.val
+            if val == x:
+                if type(val) not in scalars:
+                    self._check_not_mutated(start_state)
+                if first:
+                    self._finger = (idx, node)
+                    return idx
+                total += 1
+            elif type(val) not in scalars:
+                self._check_not_mutated(start_state)
+            node = node.child
+        return -1 if first else total
+
+    def _scan_parents(self, x, node, start, stop, first, scalars):
+        """The loop of `_scan` for a reversed deque, which walks from the tail."""
         start_state = self.__state
-        for item in self:
-            if item == x:
+        total = 0
+        for idx in range(start, stop):
+            val = node.val
+            if val == x:
+                if type(val) not in scalars:
+                    self._check_not_mutated(start_state)
+                if first:
+                    self._finger = (self._total_items - 1 - idx, node)
+                    return idx
                 total += 1
-            self._check_not_mutated(start_state)
+            elif type(val) not in scalars:
+                self._check_not_mutated(start_state)
+            node = node.parent
+        return -1 if first else total
 
-        return total
+    def count(self, x):
+        return self._scan(x, 0, self._total_items, first=False)
 
     def copy(self):
         return Deque(self, maxlen=self.maxlen)
 
-    def clear(self):
-        # extract nodes in advance since iteration requires the next node
-        nodes = [n for n in self._Iterator(self.head, node=True)]
+    def freeze(self):
+        """Return a `PersistentDeque` with the same items.
+
+        Both halves are read through slice views that walk outwards from the
+        middle, so no intermediate list is built and each node is read once.
 
-        for node in nodes:
-            # we are removing all nodes, so we don't need to unlink them
-            node.clear(unlink=False)
+        """
+        from .persistent_deque import PersistentDeque
+
+        mid = (self._total_items + 1) // 2
+        # the left half is linked from the middle towards the left end and the
+        # right half from the middle towards the right end
+        front = self[mid - 1 :: -1] if mid else ()
+        return PersistentDeque._from_halves(
+            front, mid, self[mid:], self._total_items - mid, self.maxlen
+        )
 
+    def clear(self):
+        # the chain is simply dropped and left for the garbage collector to
+        # reclaim rather than unlinking each node
         self.head = self.tail = None
         self._total_items = 0
+        self._finger = None
         self.__state += 1
 
-    def extend(self, iterable):
-        # iterate over the data in advance in case iterable is self
-        tmp_data = [i for i in iterable]
-        for i in tmp_data:
-            self.append(i)
+    def _build_chain(self, iterable):
+        """Link the items of iterable into a detached chain of nodes.
+
+        Only the last `maxlen` items are kept. Once the chain is full, the node
+        at its start is recycled for the next item rather than allocating a
+        new one. Returns the first node, last node and the length of the chain.
+
+        """
+        maxlen = self.maxlen
+        first = last = None
+        size = 0
+        for val in iterable:
+            if size == maxlen:
+                if size == 0:
+                    # we still consume the iterable, like `collections.deque`
+                    continue
+                node = first
+                if node is last:
+                    node.val = val
+                    continue
+                first = node.child
+                first.parent = None
+                node.child = None
+                node.val = val
+            else:
+                node = self._Node(val)
+                size += 1
+            if last is None:
+                first = node
+            else:
+                last.append(node)
+            last = node
+        return first, last, size
+
+    def _build_chain_left(self, iterable):
+        """Like `_build_chain` but each item is linked in front of the last."""
+        maxlen = self.maxlen
+        first = last = None
+        size = 0
+        for val in iterable:
+            if size == maxlen:
+                if size == 0:
+                    continue
+                node = last
+                if node is first:
+                    node.val = val
+                    continue
+                last = node.parent
+                last.child = None
+                node.parent = None
+                node.val = val
+            else:
+                node = self._Node(val)
+                size += 1
+            if first is None:
+                last = node
+            else:
+                first.appendleft(node)
+            first = node
+        return first, last, size
 
-    def extendleft(self, iterable):
-        # iterate over the data in advance in case iterable is self
-        tmp_data = [i for i in iterable]
-        for i in tmp_data:
-            self.appendleft(i)
+    def _trim(self, count, left):
+        """Drop count nodes from the left or right end in a single cut.
 
-    def pop(self):
-        if len(self) == 0:
-            raise IndexError("pop from an empty Deque")
-        node_val = self.tail.val
-        if self.tail.parent is not None:
-            self.tail = self.tail.parent
-            self.tail.child = None
+        Returns the first and last node of the detached chain. The mutation
+        state is left for the caller to bump.
+
+        """
+        if count >= self._total_items:
+            first, last = self.head, self.tail
+            self.head = self.tail = None
+            self._total_items = 0
+            self._finger = None
+        elif count > 0:
+            if left:
+                node = self._walk(count)
+                first, last = self.head, node.parent
+                node.parent.child = None
+                node.parent = None
+                self.head = node
+            else:
+                node = self._walk(self._total_items - count - 1)
+                first, last = node.child, self.tail
+                node.child.parent = None
+                node.child = None
+                self.tail = node
+            self._total_items -= count
+            # `_walk` left the finger on the new end node
+            self._finger = (0 if left else self._total_items - 1, node)
         else:
-            self.tail = self.head = None
-        self._total_items -= 1
+            first = last = None
+        return first, last
+
+    def _flip_chain(self):
+        """Physically reverse the chain and toggle the orientation flag.
+
+        The logical order of the items stays the same, but this is O(n) since
+        every node's links are swapped.
+
+        """
+        node = self.head
+        while node is not None:
+            node.parent, node.child = node.child, node.parent
+            node = node.parent
+        self.head, self.tail = self.tail, self.head
+        self._reversed = not self._reversed
+        if self._finger is not None:
+            index, node = self._finger
+            self._finger = (self._total_items - 1 - index, node)
         self.__state += 1
-        return node_val
 
-    def popleft(self):
-        if len(self) == 0:
-            raise IndexError("pop from an empty Deque")
-        node_val = self.head.val
-        if self.head.child is not None:
-            self.head = self.head.child
-            self.head.parent = None
+    def _splice_chain(self, first, last, size, left=False):
+        """Link a detached chain of nodes onto the left or right end.
+
+        Nodes that would be pushed past `maxlen` are trimmed from the opposite
+        end before the chain is linked. The chain must be at most `maxlen`
+        long.
+
+        """
+        if size == 0:
+            return
+        if self.maxlen is not None:
+            self._trim(self._total_items + size - self.maxlen, left=not left)
+        if self._total_items == 0:
+            self.head, self.tail = first, last
+        elif left:
+            first.parent, last.child = None, self.head
+            self.head.parent = last
+            self.head = first
+            self._shift_finger(size)
         else:
-            self.head = self.tail = None
-        self._total_items -= 1
+            self.tail.child, first.parent = first, self.tail
+            last.child = None
+            self.tail = last
+        self._total_items += size
         self.__state += 1
-        return node_val
+
+    def _extend(self, iterable, left):
+        # the chain is only linked in once the iterable is exhausted, so
+        # iterable can even be self
+        if left:
+            chain = self._build_chain_left(iterable)
+        else:
+            chain = self._build_chain(iterable)
+        self._splice_chain(*chain, left=left)
+
+    def extend(self, iterable):
+        self._extend(iterable, left=self._reversed)
+
+    def extendleft(self, iterable):
+        self._extend(iterable, left=not self._reversed)
+
+    def splice(self, other, left=False):
+        """Move all the nodes of other onto the right (or left) end.
+
+        Unlike `extend`, no items are copied and other is left empty. The items
+        keep their order, so `a.splice(b)` leaves `a` holding `a + b` and
+        `a.splice(b, left=True)` leaves it holding `b + a`. When this exceeds
+        `maxlen`, items are dropped from the opposite end like `extend` does.
+
+        This is O(1) unless the two deques have opposite orientations (one of
+        them was reversed), in which case the shorter chain has to be flipped.
+
+        """
+        if not isinstance(other, Deque):
+            raise TypeError(f"can only splice a Deque, not '{type(other)}'")
+        if other is self:
+            raise ValueError("cannot splice a Deque onto itself")
+        if other._reversed != self._reversed:
+            if len(other) <= len(self):
+                other._flip_chain()
+            else:
+                self._flip_chain()
+        size = other._total_items
+        if self.maxlen is not None and size > self.maxlen:
+            # only the items of other that are furthest from self survive
+            other._trim(size - self.maxlen, left=left == other._reversed)
+            size = self.maxlen
+        first, last = other.head, other.tail
+        other.clear()
+        self._splice_chain(first, last, size, left=left != self._reversed)
+
+    def split(self, i):
+        """Detach the items from index i onwards into a new `Deque`.
+
+        This takes a single walk to index i. The new deque has the same
+        `maxlen` as this one.
+
+        """
+        i = self._rectify_negative_index(i)
+        i = min(max(i, 0), self._total_items)
+        size = self._total_items - i
+        other = Deque(maxlen=self.maxlen)
+        other._reversed = self._reversed
+        if size > 0:
+            # when reversed, the logical right end is the head of the chain
+            first, last = self._trim(size, left=self._reversed)
+            self.__state += 1
+            other._splice_chain(first, last, size)
+        return other
 
     def reverse(self):
-        # extract nodes in advance since iteration requires the next node
-        nodes = [n for n in self._Iterator(self.head, node=True)]
-        for node in nodes:
-            node.child, node.parent = node.parent, node.child
-        self.head, self.tail = self.tail, self.head
+        # the nodes are left untouched, we just swap which end of the chain is
+        # treated as the left end of the deque
+        self._reversed = not self._reversed
+        self.__state += 1
 
     def remove(self, value):
-        start_state = self.__state
-        for i, v in enumerate(self):
-            if v == value:
-                self._check_not_mutated(start_state)
-                del self[i]
-                break
-            else:
-                self._check_not_mutated(start_state)
-        else:
+        i = self._scan(value, 0, self._total_items, first=True)
+        if i == -1:
             raise ValueError(f"{value} not in deque")
+        # the scan left the finger on the match, so this doesn't walk again
+        del self[i]
+
+    def _filter(self, keep, scalars=frozenset()):
+        """Unlink every node whose value fails keep in a single traversal.
+
+        The mutation state is checked after each call to keep, unless the type
+        of the value is in scalars, and bumped once at the end. Returns the
+        number of nodes that were removed.
+
+        """
+        start_state = self.__state
+        reverse = self._reversed
+        node = self.tail if reverse else self.head
+        removed = 0
+        try:
+            while node is not None:
+                next_node = node.parent if reverse else node.child
+                val = node.val
+                kept = keep(val)
+                if type(val) not in scalars:
+                    self._check_not_mutated(start_state)
+                if not kept:
+                    if node is self.head:
+                        self.head = node.child
+                    if node is self.tail:
+                        self.tail = node.parent
+                    node.unlink()
+                    self._total_items -= 1
+                    removed += 1
+                    # keep may index the deque, which moves the finger, so it
+                    # is dropped after every unlink rather than at the end
+                    self._finger = None
+                node = next_node
+        finally:
+            # keep may raise part way through, the nodes removed until then
+            # stay removed
+            if removed:
+                self.__state += 1
+        return removed
+
+    def remove_all(self, value):
+        """Remove every item equal to value and return how many were removed."""
+        if type(value) in _BUILTIN_SCALARS:
+            return self._filter(lambda val: not val == value, _BUILTIN_SCALARS)
+        return self._filter(lambda val: not val == value)
+
+    def retain(self, predicate):
+        """Keep only the items for which predicate(item) is true.
+
+        Returns the number of items that were removed.
+
+        """
+        return self._filter(predicate)
 
     def rotate(self, n=1):
+        if not isinstance(n, int):
+            raise TypeError(f"'{type(n)}' object cannot be interpreted as an integer")
         if self._total_items == 0:
             return
-        elif n > 0:
-            for _ in range(n):
-                self.appendleft(self.pop())
-        elif n < 0:
-            for _ in range(-n):
-                self.append(self.popleft())
+        if self._reversed:
+            # rotating the deque right rotates the chain left
+            n = -n
+        # rotating by a multiple of the length is a no-op, so only the
+        # remainder matters (this also turns left rotations into right ones)
+        n %= self._total_items
+        if n == 0:
+            return
+        # the node at index `len - n` becomes the new head. `_walk` starts from
+        # the closer end so this only touches min(n, len - n) nodes
+        new_head = self._walk(self._total_items - n)
+        # close the chain into a ring and then break it just before the new head
+        self.tail.append(self.head)
+        self.tail = new_head.parent
+        self.tail.child = None
+        new_head.parent = None
+        self.head = new_head
+        self._finger = (0, new_head)
+        self.__state += 1
 
     def _rectify_negative_index(self, idx):
         if idx < 0:
@@ -237,22 +695,11 @@ class Deque:
         if stop is None:
             stop = self._total_items
         if not (start >= self._total_items or stop < -self._total_items):
-            start = self._rectify_negative_index(start)
-            stop = self._rectify_negative_index(stop)
-            start_state = self.__state
-            for idx, val in enumerate(self):
-                # we need to do the checks in each of the if statements in case
-                # the mutation happens in an overloaded comparison function
-                if idx < start:
-                    self._check_not_mutated(start_state)
-                    continue
-                elif idx >= stop:
-                    self._check_not_mutated(start_state)
-                    break
-                elif val == x:
-                    self._check_not_mutated(start_state)
-                    return idx
-                self._check_not_mutated(start_state)
+            start = max(self._rectify_negative_index(start), 0)
+            stop = min(self._rectify_negative_index(stop), self._total_items)
+            idx = self._scan(x, start, stop, first=True)
+            if idx != -1:
+                return idx
         raise ValueError(f"{x} is not in the Deque")
 
     def insert(self, i, x):
@@ -268,48 +715,101 @@ class Deque:
         elif i == self._total_items:
             self.append(x)
         else:
-            parent_node = self._getnode(i - 1)
+            if self._reversed:
+                i = self._total_items - i
             # current node at i will become i+1
-            child_node = self._getnode(i)
+            child_node = self._walk(i)
             new_node = self._Node(x)
-            parent_node.append(new_node)
+            child_node.parent.append(new_node)
             new_node.append(child_node)
             self._total_items += 1
+            self._finger = (i, new_node)
             self.__state += 1
 
     def __len__(self):
         return self._total_items
 
+    def _shift_finger(self, offset):
+        """Move the finger's index after items are added or removed on the left.
+
+        The finger is dropped if its node is no longer in the deque.
+
+        """
+        if self._finger is not None:
+            index, node = self._finger
+            index += offset
+            self._finger = (index, node) if 0 <= index < self._total_items else None
+
     def _getnode(self, index):
         if index >= self._total_items or index < -self._total_items:
             raise IndexError("index out of range")
         index = self._rectify_negative_index(index)
-        # we need this conditional so that we can optimally reach indices
-        # on the other side of the doubly linked list without having to iterate
-        # over the entire array
-        iterate_forward = ((self._total_items - 1) // 2) - index >= 0
-        if iterate_forward:
-            start_state = self.__state
-            for i, node in enumerate(
-                self._Iterator(self.head, node=True)
-            ):  # pragma: no branch
-                self._check_not_mutated(start_state)
-                if i == index:
-                    return node
-        else:
-            start_state = self.__state
-            for i, node in enumerate(  # pragma: no branch
-                self._Iterator(self.tail, node=True, reverse=True)
-            ):
-                self._check_not_mutated(start_state)
-                if (self._total_items - 1 - i) == index:
-                    return node
+        if self._reversed:
+            index = self._total_items - 1 - index
+        return self._walk(index)
+
+    def _walk(self, index):
+        """Find the node at a (non-negative) index in the physical chain."""
+        # we start the walk from whichever of the head, the tail or the finger
+        # (the last node that we looked up) is closest to index. This makes
+        # sequential access, e.g. `d[i]` for each i, O(1) amortized
+        pos, node = 0, self.head
+        if self._total_items - 1 - index < index:
+            pos, node = self._total_items - 1, self.tail
+        if self._finger is not None and abs(self._finger[0] - index) < abs(pos - index):
+            pos, node = self._finger
+        for _ in range(pos, index):
+            node = node.child
+        for _ in range(index, pos):
+            node = node.parent
+        self._finger = (index, node)
+        return node
 
     def __getitem__(self, index):
+        if isinstance(index, slice):
+            indices = range(self._total_items)[index]
+            return self._View(self, indices, self.__state)
         if not isinstance(index, int):
             raise TypeError(f"sequence index must be integer, not '{type(index)}'")
         return self._getnode(index).val
 
+    def _link_node(self, ref, val, after):
+        """Link a new node holding val right after (or before) ref in the chain."""
+        if self.maxlen is not None and self._total_items >= self.maxlen:
+            raise IndexError("Deque already at its maximum size")
+        node = self._Node(val)
+        if after:
+            if ref.child is None:
+                self.tail = node
+            else:
+                node.append(ref.child)
+            ref.append(node)
+        else:
+            if ref.parent is None:
+                self.head = node
+            else:
+                node.appendleft(ref.parent)
+            ref.appendleft(node)
+        self._total_items += 1
+        self._finger = None
+        self.__state += 1
+
+    def _unlink_node(self, node):
+        """Remove node from the chain, wherever it is."""
+        if node is self.head:
+            self.head = node.child
+        if node is self.tail:
+            self.tail = node.parent
+        node.unlink()
+        self._total_items -= 1
+        self._finger = None
+        self.__state += 1
+
+    def cursor(self, index=0):
+        """Return a cursor on the item at index for editing while walking."""
+        node = self._getnode(index)
+        return self._Cursor(self, node, self._rectify_negative_index(index))
+
     def __setitem__(self, index, value):
         node = self._getnode(index)
         node.val = value
@@ -323,27 +823,27 @@ class Deque:
             self.pop()
         else:
             node = self._getnode(index)
+            # the next node in the chain takes over the index of the removed node
+            self._finger = (self._finger[0], node.child)
             # since we are removing only one node, we need to unlink it
-            node.clear(unlink=True)
+            node.unlink()
             self._total_items -= 1
             self.__state += 1
 
     def __contains__(self, item):
-        start_state = self.__state
-        for val in self:
-            if val == item:
-                return True
-            self._check_not_mutated(start_state)
-        else:
-            return False
+        return self._scan(item, 0, self._total_items, first=True) != -1
 
     def __iter__(self):
+        if self._reversed:
+            return self._Iterator(self.tail, reverse=True)
         return self._Iterator(self.head)
 
     def __reversed__(self):
         # we could just use the default implementation of reversed that uses
         # __len__ and __getitem__, but this is likely more optimal
         # TODO: validate the above assumption
+        if self._reversed:
+            return self._Iterator(self.head)
         return self._Iterator(self.tail, reverse=True)
 
     def __eq__(self, other):
@@ -1,97 +1,458 @@
 """A hash map implementation with a fixed size."""
+import math
+from array import array
 
-# TODO: Update this implementation so that you can insert None as a key. This is
-#       done through the use of sentinel objects.
+# Note: the map is laid out like CPython's dict. The keys, values and hashes
+#       are stored in dense lists in insertion order, and `data` is a sparse
+#       index of `capacity` small integers: each slot holds the position of an
+#       entry in the dense lists, `_EMPTY` if the slot was never used or
+#       `_DUMMY` if its entry was deleted (a tombstone). The index uses the
+#       smallest integer type that fits the capacity, so an empty map costs 1
+#       to 8 bytes per slot, and iterating only touches the dense lists.
+#
+#       Probes compare the stored hash of an entry before its key, so `__eq__`
+#       is only called when the full hashes match (which for keys that are not
+#       equal is very unlikely), and keys are compared by identity first like
+#       dict does. Rebuilding the index never calls `hash` again either.
+#
+#       Deleting an entry leaves a hole (the `_DELETED` sentinel, which also
+#       means that None can be used as a key) in the dense lists. Once there
+#       are more holes than entries, the dense lists are squeezed and the slots
+#       of the entries that moved are updated.
+#       https://mail.python.org/pipermail/python-dev/2012-December/123028.html
 
+# Note: in Robin Hood mode, an entry's distance from its home slot (the slot
+#       its hash maps to) is worked out from its stored hash. An insert that
+#       reaches an entry which is closer to its home than the new key is to
+#       its own (a "richer" entry) takes that slot and carries on inserting the
+#       displaced entry instead. This evens out the probe lengths, and since
+#       the entries along any probe path are ordered by distance, a lookup can
+#       stop at the first entry that is closer to its home than the lookup is.
+#       Deletion shifts the rest of the cluster back by one slot instead of
+#       leaving a tombstone.
+#       https://codecapsule.com/2013/11/11/robin-hood-hashing/
+
+_EMPTY = -1
+_DUMMY = -2
+_DELETED = object()  # marks the hole left by a deleted entry
 
-class FixedHashMap:
-    class HashItem:
-        __slots__ = ("key", "value", "is_tombstone")
 
-        def __init__(self, key=None, value=None):
-            self.key = key
-            self.value = value
-            self.is_tombstone = False
+def _index_array(capacity):
+    """Return an index of `_EMPTY` slots with the smallest type that fits."""
+    for typecode in "bhi":
+        if capacity < 2 ** (array(typecode).itemsize * 8 - 1):
+            break
+    else:
+        typecode = "q"
+    return array(typecode, [_EMPTY]) * capacity
 
-        def clear(self):
-            self.key = None
-            self.value = None
-            self.is_tombstone = True
 
-        def set(self, key, value):
-            self.key = key
-            self.value = value
-            self.is_tombstone = False
+def _pairs(items):
+    """Return the key, value pairs of a mapping, or an iterable of pairs as is."""
+    if hasattr(items, "items"):
+        return items.items()
+    if hasattr(items, "keys"):
+        return [(key, items[key]) for key in items.keys()]
+    return items
 
-        def __bool__(self):
-            """Evaluate to `False` if the key is not set."""
-            return False if self.key is None else True
 
-        def __str__(self):  # pragma: no cover
-            return "" if self.key is None else f"{self.key}: {self.value}"
+def _sized(items):
+    """Return the key, value pairs of items in a container with a length."""
+    items = _pairs(items)
+    return items if hasattr(items, "__len__") else list(items)
 
-        def __repr__(self):  # pragma: no cover
-            return f"HashItem({self})"
 
-    __slots__ = ("capacity", "size", "data")
+class FixedHashMap:
+    __slots__ = (
+        "capacity",
+        "size",
+        "data",
+        "tombstones",
+        "max_tombstones",
+        "robin_hood",
+        "_keys",
+        "_values",
+        "_hashes",
+        "_state",
+    )
 
-    def __init__(self, capacity=1000):
+    def __init__(self, capacity=1000, max_tombstones=0.25, robin_hood=False):
         self.capacity = capacity
+        # the fraction of the slots that can be tombstones before `compact`
+        self.max_tombstones = max_tombstones
+        self.robin_hood = robin_hood
+        # bumped whenever entries are added, removed or moved, so that
+        # iterators can tell that the map was mutated
+        self._state = 0
+        self.clear()
+
+    @classmethod
+    def from_items(cls, items, load_factor=0.75, **kwargs):
+        """Build a map from a mapping or an iterable of key, value pairs.
+
+        The capacity is worked out up front so that the map ends up with the
+        given load factor (if every key is unique), and the pairs are inserted
+        with `set_many`. Any other arguments are passed on to the constructor.
+
+        """
+        if not 0 < load_factor <= 1:
+            raise ValueError("load_factor must be between 0 and 1")
+        items = _sized(items)
+        hash_map = cls(max(math.ceil(len(items) / load_factor), 1), **kwargs)
+        hash_map.set_many(items)
+        return hash_map
+
+    def clear(self):
+        self.data = _index_array(self.capacity)
+        self._keys = []
+        self._values = []
+        self._hashes = array("q")
         self.size = 0
-        self.data = [self.HashItem() for _ in range(self.capacity)]
+        self.tombstones = 0
+        self._state += 1
 
-    def _find_slot(self, key):
+    @staticmethod
+    def _hash(key):
         try:
-            hash_idx = hash(key) % self.capacity
+            return hash(key)
         except TypeError:
             raise ValueError("key must be hashable")
-        count = 1
-        while (self.data[hash_idx] and (self.data[hash_idx].key != key)) or self.data[
-            hash_idx
-        ].is_tombstone:
-            hash_idx = (hash_idx + 1) % self.capacity
-            # this prevents an infinite loop when getting a non-existent key
-            # when the hash map is full
-            if count >= self.size:
-                raise KeyError(f"could not find key: {key}")
-            count += 1
-        return hash_idx
-
-    def get_existing_hash_item(self, key):
-        key_idx = self._find_slot(key)
-        if self.data[key_idx]:
-            return self.data[key_idx]
+
+    def _probe(self, key, key_hash, data, capacity, used):
+        """Linearly probe the index data for key.
+
+        Returns the slot and entry of key, or the slot where it should be
+        inserted and -1. That is the first tombstone on the probe path, or the
+        empty slot that ends it. Only `used` slots are in use, so the probe
+        gives up once it has seen that many of them, and returns a slot of -1
+        if none of them was free.
+
+        """
+        keys, hashes = self._keys, self._hashes
+        slot = key_hash % capacity
+        first_tombstone = -1
+        for _ in range(used):
+            entry = data[slot]
+            if entry == _EMPTY:
+                break
+            if entry == _DUMMY:
+                if first_tombstone < 0:
+                    first_tombstone = slot
+            elif hashes[entry] == key_hash and (
+                keys[entry] is key or keys[entry] == key
+            ):
+                return slot, entry
+            slot = (slot + 1) % capacity
         else:
-            raise KeyError(f"could not find key: {key}")
+            # every slot in use was probed, this prevents an infinite loop when
+            # every slot has been used
+            if first_tombstone < 0 and data[slot] != _EMPTY:
+                return -1, -1
+        return (slot if first_tombstone < 0 else first_tombstone), -1
+
+    def _robin_hood_probe(self, key, key_hash):
+        """Return the slot and entry of key, or -1 and -1."""
+        data, keys, hashes = self.data, self._keys, self._hashes
+        capacity = self.capacity
+        slot = key_hash % capacity
+        for distance in range(capacity):
+            entry = data[slot]
+            # every entry further along is even closer to its home than this one
+            if entry == _EMPTY or (slot - hashes[entry]) % capacity < distance:
+                break
+            if hashes[entry] == key_hash and (keys[entry] is key or keys[entry] == key):
+                return slot, entry
+            slot = (slot + 1) % capacity
+        return -1, -1
+
+    def _find(self, key, key_hash):
+        """Return the slot and entry of key (see `_probe`)."""
+        if self.robin_hood:
+            return self._robin_hood_probe(key, key_hash)
+        return self._probe(
+            key, key_hash, self.data, self.capacity, self.size + self.tombstones
+        )
+
+    def _place(self, entry):
+        """Index an entry whose key is not in the index yet."""
+        data, capacity = self.data, self.capacity
+        slot = self._hashes[entry] % capacity
+        if not self.robin_hood:
+            while data[slot] != _EMPTY:
+                slot = (slot + 1) % capacity
+            data[slot] = entry
+            return
+        hashes = self._hashes
+        distance = 0
+        while True:
+            other = data[slot]
+            if other == _EMPTY:
+                data[slot] = entry
+                return
+            other_distance = (slot - hashes[other]) % capacity
+            if other_distance < distance:
+                # take the slot from the richer entry and find it a new one
+                data[slot] = entry
+                entry, distance = other, other_distance
+            slot = (slot + 1) % capacity
+            distance += 1
+
+    def _robin_hood_remove(self, slot):
+        """Empty the slot, shifting the rest of its cluster back."""
+        data, hashes, capacity = self.data, self._hashes, self.capacity
+        next_slot = (slot + 1) % capacity
+        entry = data[next_slot]
+        # the entries that are already in their home slot can't move back
+        while entry != _EMPTY and (next_slot - hashes[entry]) % capacity > 0:
+            data[slot] = entry
+            slot = next_slot
+            next_slot = (slot + 1) % capacity
+            entry = data[next_slot]
+        data[slot] = _EMPTY
+
+    def _squeeze(self):
+        """Remove the holes from the dense lists, keeping the index up to date."""
+        data, keys, values, hashes = self.data, self._keys, self._values, self._hashes
+        capacity = self.capacity
+        new_entry = 0
+        for entry in range(len(keys)):
+            key = keys[entry]
+            if key is _DELETED:
+                continue
+            if entry != new_entry:
+                # entries only ever move to a lower position, so nothing else
+                # in the index refers to this position yet
+                slot = hashes[entry] % capacity
+                while data[slot] != entry:
+                    slot = (slot + 1) % capacity
+                data[slot] = new_entry
+                keys[new_entry] = key
+                values[new_entry] = values[entry]
+                hashes[new_entry] = hashes[entry]
+            new_entry += 1
+        del keys[new_entry:]
+        del values[new_entry:]
+        del hashes[new_entry:]
+        self._state += 1
+
+    def compact(self):
+        """Rebuild the index and the dense lists without tombstones or holes."""
+        live = [entry for entry, key in enumerate(self._keys) if key is not _DELETED]
+        self._keys = [self._keys[entry] for entry in live]
+        self._values = [self._values[entry] for entry in live]
+        self._hashes = array("q", [self._hashes[entry] for entry in live])
+        self.data = _index_array(self.capacity)
+        self.tombstones = 0
+        self._state += 1
+        for entry in range(len(live)):
+            self._place(entry)
 
     def get(self, key):
-        return self.get_existing_hash_item(key).value
+        _, entry = self._find(key, self._hash(key))
+        if entry < 0:
+            raise KeyError(f"could not find key: {key}")
+        return self._values[entry]
 
     def set(self, key, value):
         if self.size >= self.capacity:
             raise MemoryError("the hash map is full")
-        # we don't use get_hash item here because we are okay with using up
-        # an empty slot
-        key_idx = self._find_slot(key)
-        hash_item = self.data[key_idx]
-        if hash_item:
-            hash_item.set(hash_item.key, value)
+        key_hash = self._hash(key)
+        slot, entry = self._find(key, key_hash)
+        if entry >= 0:
+            self._values[entry] = value
+            return
+        if len(self._keys) >= self.capacity:
+            # there is no room left in the dense lists for another entry, the
+            # squeeze doesn't change which slots are free
+            self._squeeze()
+        entry = len(self._keys)
+        self._keys.append(key)
+        self._values.append(value)
+        self._hashes.append(key_hash)
+        self.size += 1
+        self._state += 1
+        if self.robin_hood:
+            self._place(entry)
         else:
-            hash_item.set(key, value)
-            self.size += 1
+            # reuse the first tombstone on the probe path
+            if self.data[slot] == _DUMMY:
+                self.tombstones -= 1
+            self.data[slot] = entry
 
     def delete(self, key):
-        # use tombstone deletion
-        # https://stackoverflow.com/a/60644631/3262054
-        hash_item = self.get_existing_hash_item(key)
-        hash_item.clear()
+        slot, entry = self._find(key, self._hash(key))
+        if entry < 0:
+            raise KeyError(f"could not find key: {key}")
+        self._keys[entry] = _DELETED
+        self._values[entry] = None
         self.size -= 1
+        self._state += 1
+        if slot < 0:
+            # the entry is only in the previous index of a resizing `HashMap`
+            pass
+        elif self.robin_hood:
+            self._robin_hood_remove(slot)
+        else:
+            # use tombstone deletion
+            # https://stackoverflow.com/a/60644631/3262054
+            self.data[slot] = _DUMMY
+            self.tombstones += 1
+        self._tidy()
+
+    def _tidy(self):
+        """Compact the map once deletes have left too many tombstones or holes."""
+        if self.tombstones > self.max_tombstones * self.capacity:
+            self.compact()
+        elif len(self._keys) - self.size > self.size:
+            self._squeeze()
+
+    def get_many(self, keys, default=None):
+        """Return a list of the values of keys, or default for missing keys."""
+        values = self._values
+        used = self.size + self.tombstones
+        if self.robin_hood or used >= self.capacity:
+            # without an empty slot the probes need the bound that `_probe` has
+            find, hash_key = self._find, self._hash
+            result = []
+            for key in keys:
+                _, entry = find(key, hash_key(key))
+                result.append(default if entry < 0 else values[entry])
+            return result
+        data, stored_keys, hashes = self.data, self._keys, self._hashes
+        capacity, empty = self.capacity, _EMPTY
+        result = []
+        append = result.append
+        for key in keys:
+            try:
+                key_hash = hash(key)
+            except TypeError:
+                raise ValueError("key must be hashable")
+            # the probe of `_probe` inlined, calling it for every key costs
+            # about as much as the probe itself. It always ends at an empty slot
+            slot = key_hash % capacity
+            entry = data[slot]
+            while entry != empty:
+                if entry >= 0 and hashes[entry] == key_hash:
+                    other = stored_keys[entry]
+                    if other is key or other == key:
+                        append(values[entry])
+                        break
+                slot = (slot + 1) % capacity
+                entry = data[slot]
+            else:
+                append(default)
+        return result
+
+    def set_many(self, pairs):
+        """Set each key, value pair in turn, like calling `set` for each."""
+        pairs = iter(pairs)
+        if not self.robin_hood and self.size + self.tombstones < self.capacity:
+            self._set_many_open(pairs)
+        # the pairs that are left once no slot is empty (or in Robin Hood mode)
+        for key, value in pairs:
+            self.set(key, value)
+
+    def _set_many_open(self, pairs):
+        """Set pairs from the iterator until the index has no empty slot left.
+
+        The index must have an empty slot when this is called.
+
+        """
+        data, keys, values, hashes = self.data, self._keys, self._values, self._hashes
+        append_key, append_value = keys.append, values.append
+        append_hash = hashes.append
+        capacity, empty, dummy = self.capacity, _EMPTY, _DUMMY
+        size, tombstones, entries = self.size, self.tombstones, len(keys)
+        try:
+            for key, value in pairs:
+                try:
+                    key_hash = hash(key)
+                except TypeError:
+                    raise ValueError("key must be hashable")
+                # the probe of `_probe` inlined (see `get_many`), it ends at an
+                # empty slot since there is one
+                slot = key_hash % capacity
+                entry = data[slot]
+                first_tombstone = -1
+                while entry != empty:
+                    if entry == dummy:
+                        if first_tombstone < 0:
+                            first_tombstone = slot
+                    elif hashes[entry] == key_hash and (
+                        keys[entry] is key or keys[entry] == key
+                    ):
+                        values[entry] = value
+                        break
+                    slot = (slot + 1) % capacity
+                    entry = data[slot]
+                else:
+                    if first_tombstone >= 0:
+                        slot = first_tombstone
+                        tombstones -= 1
+                    if entries >= capacity:
+                        # see `set`
+                        self._squeeze()
+                        entries = len(keys)
+                    data[slot] = entries
+                    append_key(key)
+                    append_value(value)
+                    append_hash(key_hash)
+                    entries += 1
+                    size += 1
+                    if size + tombstones >= capacity:
+                        return
+        finally:
+            if size != self.size:
+                self._state += 1
+            self.size, self.tombstones = size, tombstones
+
+    def update(self, other=(), **kwargs):
+        """Set the pairs of a mapping or an iterable of pairs, then kwargs."""
+        self.set_many(_pairs(other))
+        if kwargs:
+            self.set_many(kwargs.items())
 
     def load(self):
         return float(self.size) / float(self.capacity)
 
+    def _mutated(self):
+        return RuntimeError(f"{type(self).__name__} mutated during iteration")
+
+    def __iter__(self):
+        """Yield the keys in insertion order."""
+        state = self._state
+        for key in self._keys:
+            if key is not _DELETED:
+                yield key
+                if state != self._state:
+                    raise self._mutated()
+
     def keys(self):
-        return [hash_item.key for hash_item in self.data if hash_item]
+        return iter(self)
+
+    def values(self):
+        """Yield the values in insertion order."""
+        state = self._state
+        for key, value in zip(self._keys, self._values):
+            if key is not _DELETED:
+                yield value
+                if state != self._state:
+                    raise self._mutated()
+
+    def items(self):
+        """Yield the key, value pairs in insertion order."""
+        state = self._state
+        for item in zip(self._keys, self._values):
+            if item[0] is not _DELETED:
+                yield item
+                if state != self._state:
+                    raise self._mutated()
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, key):
+        return self._find(key, self._hash(key))[1] >= 0
 
     def __setitem__(self, key, value):
         self.set(key, value)
@@ -103,14 +464,7 @@ class FixedHashMap:
         return self.delete(key)
 
     def __repr__(self):
-        return f"FixedHashMap({self})"
+        return f"{type(self).__name__}({self})"
 
     def __str__(self):
-        tuple_data = [(k, self.get(k)) for k in self.keys() if k is not None]
-        if not tuple_data:
-            return "{}"
-        else:
-            fhm_rep = "{"
-            fhm_rep += ", ".join(f"{k!r}: {v!r}" for k, v in tuple_data)
-            fhm_rep += "}"
-            return fhm_rep
+        return "{" + ", ".join(f"{k!r}: {v!r}" for k, v in self.items()) + "}"
@@ -0,0 +1,223 @@
+"""A hash map that resizes itself as keys are added and removed."""
+from .fixed_hash_map import _DELETED, FixedHashMap, _index_array, _sized
+
+# Note: the table grows geometrically (doubling its capacity) once the load
+#       factor exceeds `max_load` and halves once it drops below a quarter of
+#       that, so the load stays between max_load / 4 and max_load. A resize
+#       builds a new index: it walks the entries once and drops each one into
+#       the first free slot of its probe sequence. No keys have to be compared
+#       since every key is unique, and tombstones are left behind. Deleting a
+#       key leaves both a tombstone in the index and a hole in the dense lists,
+#       so the load counts the holes too (there are never fewer holes than
+#       tombstones). A resize squeezes the holes out of the dense lists, and
+#       when it is mostly holes that push the load over `max_load`, the table
+#       is rebuilt at the same capacity. Deletes never compact the map
+#       themselves, the resizes take care of it.
+#
+#       In incremental mode, a resize only allocates the new index and keeps
+#       the old one around. Every insert and delete then walks the next few
+#       entries, moving each one down over the holes before it and adding it
+#       to the new index, until the walk catches up with the end of the dense
+#       lists. Lookups that miss in the new index check the old one until every
+#       entry that existed at the time of the resize is in the new index. The
+#       old index may point at positions that now hold other (already migrated)
+#       keys, but those are always found in the new index first. Lookups and
+#       updates don't move entries, so that they don't invalidate iterators.
+#       Each step walks enough entries that the walk catches up before the
+#       dense lists could fill the new index, and the load is only checked
+#       again once it has.
+#       https://en.wikipedia.org/wiki/Hash_table#Incremental_resizing
+
+# the minimum number of entries that an insert or delete migrates
+_MIGRATE_ENTRIES = 4
+
+
+class HashMap(FixedHashMap):
+    """A `FixedHashMap` that grows and shrinks with the number of keys.
+
+    Parameters:
+        capacity: The initial (and minimum) number of slots
+        max_load: The load factor above which the capacity is doubled
+        incremental: Spread each resize over the following operations instead
+            of rehashing every key at once
+
+    """
+
+    __slots__ = (
+        "min_capacity",
+        "max_load",
+        "incremental",
+        "_migrate_entries",
+        "_old_data",
+        "_old_capacity",
+        "_migrated",
+        "_compacted",
+        "_migrate_stop",
+    )
+
+    def __init__(self, capacity=8, max_load=0.75, incremental=False):
+        if capacity <= 0:
+            raise ValueError("capacity must be > 0")
+        if not 0 < max_load < 1:
+            raise ValueError("max_load must be between 0 and 1")
+        self.min_capacity = capacity
+        self.max_load = max_load
+        self.incremental = incremental
+        # a migration of L entries takes at most L / (k - 1) inserts, so with k
+        # entries per step the dense lists stay below L * k / (k - 1), which
+        # has to fit in the capacity for any load up to `max_load`
+        self._migrate_entries = max(_MIGRATE_ENTRIES, int(1 / (1 - max_load)) + 2)
+        super().__init__(capacity)
+
+    def clear(self):
+        super().clear()
+        self._old_data = None  # the previous index during an incremental resize
+        self._migrated = None  # the position of the walk, or None if not migrating
+
+    def _resize(self, capacity):
+        self._finish_migration()
+        if not self.incremental and len(self._keys) > self.size:
+            # rebuilds the index and squeezes the holes out of the dense lists
+            self.capacity = capacity
+            super().compact()
+            return
+        if self.incremental:
+            self._old_data = self.data
+            self._old_capacity = self.capacity
+            self._migrated = self._compacted = 0
+            self._migrate_stop = len(self._keys)  # the entries in the old index
+        self.capacity = capacity
+        self.tombstones = 0
+        self.data = _index_array(capacity)
+        if not self.incremental:
+            for entry in range(len(self._keys)):
+                self._place(entry)
+
+    def _reindex(self, entry, new_entry):
+        """Point the slot of an entry in the index at its new position."""
+        data, capacity = self.data, self.capacity
+        slot = self._hashes[entry] % capacity
+        while data[slot] != entry:
+            slot = (slot + 1) % capacity
+        data[slot] = new_entry
+
+    def _migrate(self, entries=None):
+        """Walk the next entries of a running migration (see the note above)."""
+        if self._migrated is None:
+            return
+        keys, values, hashes = self._keys, self._values, self._hashes
+        entry, new_entry = self._migrated, self._compacted
+        stop = min(entry + (entries or self._migrate_entries), len(keys))
+        moved = False
+        while entry < stop:
+            key = keys[entry]
+            if key is not _DELETED:
+                if entry != new_entry:
+                    if entry >= self._migrate_stop:
+                        # inserted since the resize, so it is in the new index
+                        self._reindex(entry, new_entry)
+                    keys[new_entry] = key
+                    values[new_entry] = values[entry]
+                    hashes[new_entry] = hashes[entry]
+                    keys[entry] = _DELETED
+                    values[entry] = None
+                    moved = True
+                if entry < self._migrate_stop:
+                    self._place(new_entry)
+                new_entry += 1
+            entry += 1
+        if moved:
+            self._state += 1
+        if entry >= self._migrate_stop:
+            self._old_data = None
+        if entry < len(keys):
+            self._migrated, self._compacted = entry, new_entry
+            return
+        del keys[new_entry:]
+        del values[new_entry:]
+        del hashes[new_entry:]
+        self._migrated = None
+
+    def _finish_migration(self):
+        if self._migrated is not None:
+            self._migrate(len(self._keys))
+
+    def _find(self, key, key_hash):
+        slot, entry = super()._find(key, key_hash)
+        if entry < 0 and self._old_data is not None:
+            _, old_entry = self._probe(
+                key, key_hash, self._old_data, self._old_capacity, self._old_capacity
+            )
+            # deleted entries are holes, which the old index probes past
+            if old_entry >= 0:
+                return -1, old_entry
+        return slot, entry
+
+    def _squeeze(self):
+        # moving entries would break the old index
+        self._finish_migration()
+        super()._squeeze()
+
+    def compact(self):
+        self._finish_migration()
+        super().compact()
+
+    def _tidy(self):
+        # `_check_load` clears the tombstones and holes with a resize, which
+        # unlike `compact` can be incremental
+        pass
+
+    def _check_load(self):
+        if self._migrated is not None:
+            # the running migration is still squeezing the dense lists
+            return
+        # the live entries and the holes, which bound size + tombstones
+        used = len(self._keys)
+        if used > self.max_load * self.capacity:
+            if self.size > self.max_load / 2 * self.capacity:
+                self._resize(self.capacity * 2)
+            else:
+                self._resize(self.capacity)
+        elif (
+            self.size < self.max_load / 4 * self.capacity
+            and self.capacity > self.min_capacity
+        ):
+            capacity = max(self.capacity // 2, self.min_capacity)
+            if self.incremental and used > self.max_load * capacity:
+                # the holes stay until the migration squeezes them out, so
+                # squeeze them at the current capacity first
+                capacity = self.capacity
+            self._resize(capacity)
+
+    def set(self, key, value):
+        if len(self._keys) >= self.capacity:
+            # `FixedHashMap.set` squeezes the dense lists after it has found a
+            # free slot, so finish the migration, which fills slots, up front
+            self._finish_migration()
+        size = self.size
+        super().set(key, value)
+        if self.size != size:
+            self._migrate()
+            self._check_load()
+
+    def delete(self, key):
+        super().delete(key)
+        self._migrate()
+        self._check_load()
+
+    def get_many(self, keys, default=None):
+        # the bulk lookups only probe the new index
+        self._finish_migration()
+        return super().get_many(keys, default)
+
+    def set_many(self, pairs):
+        pairs = _sized(pairs)
+        # grow once for all of the pairs rather than doubling along the way
+        capacity = self.capacity
+        while self.size + len(pairs) > self.max_load * capacity:
+            capacity *= 2
+        if capacity != self.capacity:
+            self._resize(capacity)
+        self._finish_migration()
+        super().set_many(pairs)
+        self._check_load()
@@ -0,0 +1,237 @@
+"""An immutable deque whose updates return new versions that share structure."""
+from functools import total_ordering
+
+# Note: the deque is stored as two singly linked lists of `(val, next)` tuples.
+#       `front` holds the left half with the leftmost item first and `rear`
+#       holds the right half with the rightmost item first, so all four end
+#       operations only touch the head of one list. Since a list is never
+#       modified once built, every version can share it. When one side runs
+#       out while the other still has two or more items, the other side is
+#       split in half. That O(n) step amortizes to O(1) per operation as long
+#       as each version is only updated once. Repeating an operation that
+#       splits on the same old version pays for the split every time.
+#       See section 5.2 of Okasaki's "Purely Functional Data Structures".
+
+
+def _cons_list(items):
+    """Link items into a `(val, next)` list whose head is the last item."""
+    head = None
+    for val in items:
+        head = (val, head)
+    return head
+
+
+def _walk(head):
+    while head is not None:
+        yield head[0]
+        head = head[1]
+
+
+@total_ordering
+class PersistentDeque:
+    """An immutable version of `Deque` with O(1) snapshots.
+
+    `append`, `appendleft`, `pop`, `popleft`, `extend` and `extendleft` return
+    a new `PersistentDeque` and leave the original untouched. Versions share
+    their nodes, so keeping an old version around costs nothing extra. The
+    read only API (indexing, iteration, `count`, `index`, comparisons) is the
+    same as `Deque`'s.
+
+    """
+
+    __slots__ = ("_front", "_front_len", "_rear", "_rear_len", "_maxlen")
+
+    def __init__(self, iterable=None, maxlen=None):
+        if maxlen is not None and maxlen < 0:
+            raise ValueError("maxlen must be > 0")
+        items = [] if iterable is None else list(iterable)
+        if maxlen is not None:
+            items = items[len(items) - maxlen :] if len(items) > maxlen else items
+        mid = (len(items) + 1) // 2
+        self._set(
+            _cons_list(reversed(items[:mid])),
+            mid,
+            _cons_list(items[mid:]),
+            len(items) - mid,
+            maxlen,
+        )
+
+    def _set(self, front, front_len, rear, rear_len, maxlen):
+        self._front = front
+        self._front_len = front_len
+        self._rear = rear
+        self._rear_len = rear_len
+        self._maxlen = maxlen
+
+    @classmethod
+    def _from_halves(cls, front_items, front_len, rear_items, rear_len, maxlen):
+        """Build a deque from its two halves, both given from the middle out."""
+        ret = cls.__new__(cls)
+        ret._set(
+            _cons_list(front_items),
+            front_len,
+            _cons_list(rear_items),
+            rear_len,
+            maxlen,
+        )
+        return ret
+
+    def _make(self, front, front_len, rear, rear_len):
+        """Create a new version, splitting one side if the other is empty.
+
+        Keeping both sides non-empty (when there are two or more items) means
+        that both ends can always be read in O(1).
+
+        """
+        if front is None and rear_len > 1:
+            items = list(_walk(rear))[::-1]
+        elif rear is None and front_len > 1:
+            items = list(_walk(front))
+        else:
+            ret = type(self).__new__(type(self))
+            ret._set(front, front_len, rear, rear_len, self._maxlen)
+            return ret
+        mid = (len(items) + 1) // 2
+        return self._from_halves(
+            reversed(items[:mid]), mid, items[mid:], len(items) - mid, self._maxlen
+        )
+
+    @property
+    def maxlen(self):
+        return self._maxlen
+
+    def append(self, val):
+        if self._maxlen == 0:
+            return self
+        base = self
+        if self._maxlen is not None and len(self) >= self._maxlen:
+            base = self.popleft()
+        return base._make(
+            base._front, base._front_len, (val, base._rear), base._rear_len + 1
+        )
+
+    def appendleft(self, val):
+        if self._maxlen == 0:
+            return self
+        base = self
+        if self._maxlen is not None and len(self) >= self._maxlen:
+            base = self.pop()
+        return base._make(
+            (val, base._front), base._front_len + 1, base._rear, base._rear_len
+        )
+
+    def pop(self):
+        """Return a new version without the rightmost item (see `d[-1]`)."""
+        if self._rear is not None:
+            return self._make(
+                self._front, self._front_len, self._rear[1], self._rear_len - 1
+            )
+        if self._front is not None:
+            # a single item is left
+            return self._make(None, 0, None, 0)
+        raise IndexError("pop from an empty PersistentDeque")
+
+    def popleft(self):
+        """Return a new version without the leftmost item (see `d[0]`)."""
+        if self._front is not None:
+            return self._make(
+                self._front[1], self._front_len - 1, self._rear, self._rear_len
+            )
+        if self._rear is not None:
+            return self._make(None, 0, None, 0)
+        raise IndexError("pop from an empty PersistentDeque")
+
+    def extend(self, iterable):
+        ret = self
+        for val in iterable:
+            ret = ret.append(val)
+        return ret
+
+    def extendleft(self, iterable):
+        ret = self
+        for val in iterable:
+            ret = ret.appendleft(val)
+        return ret
+
+    def copy(self):
+        # versions are immutable, so a snapshot is the version itself
+        return self
+
+    def thaw(self):
+        """Return a mutable `Deque` with the same items."""
+        from .deque import Deque
+
+        return Deque(self, maxlen=self._maxlen)
+
+    def count(self, x):
+        return sum(1 for val in self if val == x)
+
+    def index(self, x, start=None, stop=None):
+        start, stop, _ = slice(start, stop).indices(len(self))
+        for idx, val in enumerate(self):
+            if idx >= stop:
+                break
+            if idx >= start and val == x:
+                return idx
+        raise ValueError(f"{x} is not in the PersistentDeque")
+
+    def __len__(self):
+        return self._front_len + self._rear_len
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return type(self)(list(self)[index])
+        if not isinstance(index, int):
+            raise TypeError(f"sequence index must be integer, not '{type(index)}'")
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("PersistentDeque index out of range")
+        if index < self._front_len:
+            node, steps = self._front, index
+        else:
+            node, steps = self._rear, len(self) - 1 - index
+        for _ in range(steps):
+            node = node[1]
+        return node[0]
+
+    def __contains__(self, item):
+        return any(val == item for val in self)
+
+    def __iter__(self):
+        yield from _walk(self._front)
+        yield from reversed(list(_walk(self._rear)))
+
+    def __reversed__(self):
+        yield from _walk(self._rear)
+        yield from reversed(list(_walk(self._front)))
+
+    def __eq__(self, other):
+        if isinstance(other, PersistentDeque):
+            return len(self) == len(other) and all(s == o for s, o in zip(self, other))
+        else:
+            return False
+
+    def __lt__(self, other):
+        if isinstance(other, PersistentDeque):
+            for s, o in zip(self, other):
+                if s != o:
+                    return s < o
+            return len(self) < len(other)
+        else:
+            raise TypeError(
+                f"supported between instances of '{type(self)}' and '{type(other)}'"
+            )
+
+    def __hash__(self):
+        return hash(tuple(self))
+
+    def __reduce__(self):
+        return type(self), (list(self), self._maxlen)
+
+    def __repr__(self):
+        ret = f"PersistentDeque({list(self)}"
+        if self._maxlen is not None:
+            ret += f", maxlen={self._maxlen}"
+        ret += ")"
+        return ret
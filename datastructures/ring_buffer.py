@@ -0,0 +1,185 @@
+"""A bounded deque of numbers stored in a typed ring buffer."""
+from array import array
+
+# Note: unlike `Deque`, which boxes every item in its own node, the items live
+#       unboxed in one preallocated `array.array` (or NumPy array) that is used
+#       as a circular buffer. Window statistics run over the raw buffer rather
+#       than walking a linked list.
+
+
+class RingBuffer:
+    """A fixed-capacity `Deque` of numbers backed by a typed array.
+
+    Appending to a full buffer evicts an item from the opposite end, exactly
+    like `Deque(maxlen=maxlen)`. The contents can be exposed without copying
+    through `segments`, which returns one `memoryview` or two when the buffer
+    wraps around.
+
+    Parameters:
+        iterable: Initial items of the buffer
+        maxlen: The capacity of the buffer, this is required
+        typecode: An `array` typecode, the default "d" stores C doubles
+        use_numpy: Store the items in a NumPy array so that the statistics are
+            computed by NumPy (requires numpy to be installed)
+
+    """
+
+    def __init__(self, iterable=None, maxlen=None, typecode="d", use_numpy=False):
+        if maxlen is None:
+            raise ValueError("RingBuffer requires a maxlen")
+        if maxlen < 0:
+            raise ValueError("maxlen must be > 0")
+        if use_numpy:
+            try:
+                import numpy as np
+            except ImportError:
+                raise ValueError(
+                    "please install numpy to use the numpy backend"
+                ) from None
+            self._numpy = np
+            self._data = np.zeros(maxlen, dtype=typecode)
+            # return python numbers rather than NumPy scalars
+            self._item = self._data.item
+        else:
+            self._numpy = None
+            self._data = array(typecode, [0]) * maxlen
+            self._item = self._data.__getitem__
+        self._view = memoryview(self._data)
+        self._typecode = typecode
+        self._maxlen = maxlen
+        self._start = 0  # index of the leftmost item in `_data`
+        self._size = 0
+        self._state = 0  # moves whenever the contents change
+        if iterable is not None:
+            self.extend(iterable)
+
+    @property
+    def maxlen(self):
+        return self._maxlen
+
+    @property
+    def typecode(self):
+        return self._typecode
+
+    def _physical(self, index):
+        """Map a logical index in [0, size) to an index into `_data`."""
+        index += self._start
+        if index >= self._maxlen:
+            index -= self._maxlen
+        return index
+
+    def append(self, val):
+        if self._maxlen == 0:
+            return
+        self._data[self._physical(self._size)] = val
+        if self._size == self._maxlen:
+            # the item we overwrote was the leftmost one
+            self._start = self._physical(1)
+        else:
+            self._size += 1
+        self._state += 1
+
+    def appendleft(self, val):
+        if self._maxlen == 0:
+            return
+        self._start = self._physical(self._maxlen - 1)
+        self._data[self._start] = val
+        if self._size < self._maxlen:
+            self._size += 1
+        self._state += 1
+
+    def pop(self):
+        if self._size == 0:
+            raise IndexError("pop from an empty RingBuffer")
+        self._size -= 1
+        self._state += 1
+        return self._item(self._physical(self._size))
+
+    def popleft(self):
+        if self._size == 0:
+            raise IndexError("pop from an empty RingBuffer")
+        val = self._item(self._start)
+        self._start = self._physical(1)
+        self._size -= 1
+        self._state += 1
+        return val
+
+    def extend(self, iterable):
+        for val in iterable:
+            self.append(val)
+
+    def clear(self):
+        self._start = self._size = 0
+        self._state += 1
+
+    def _chunks(self, storage):
+        """Slice storage into the one or two runs that hold the items in order."""
+        end = self._start + self._size
+        if end <= self._maxlen:
+            return (storage[self._start : end],)
+        return storage[self._start :], storage[: end - self._maxlen]
+
+    def segments(self):
+        """Return the items in order as one or two zero-copy memoryviews.
+
+        The views share memory with the buffer, so they are only meaningful
+        until the next mutation.
+
+        """
+        return self._chunks(self._view)
+
+    def sum(self):
+        if self._numpy is not None:
+            return sum(chunk.sum().item() for chunk in self._chunks(self._data))
+        return sum(sum(chunk) for chunk in self._chunks(self._view))
+
+    def mean(self):
+        if self._size == 0:
+            raise ValueError("mean of an empty RingBuffer")
+        return self.sum() / self._size
+
+    def min(self):
+        if self._size == 0:
+            raise ValueError("min of an empty RingBuffer")
+        if self._numpy is not None:
+            return min(chunk.min().item() for chunk in self._chunks(self._data))
+        return min(min(chunk) for chunk in self._chunks(self._view))
+
+    def max(self):
+        if self._size == 0:
+            raise ValueError("max of an empty RingBuffer")
+        if self._numpy is not None:
+            return max(chunk.max().item() for chunk in self._chunks(self._data))
+        return max(max(chunk) for chunk in self._chunks(self._view))
+
+    def _check_index(self, index):
+        if not isinstance(index, int):
+            raise TypeError(f"sequence index must be integer, not '{type(index)}'")
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("RingBuffer index out of range")
+        return self._physical(index)
+
+    def __getitem__(self, index):
+        return self._item(self._check_index(index))
+
+    def __setitem__(self, index, value):
+        self._data[self._check_index(index)] = value
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        state = self._state
+        for chunk in self._chunks(self._view):
+            for val in chunk:
+                if self._state != state:
+                    raise RuntimeError("RingBuffer mutated during iteration")
+                yield val
+
+    def __repr__(self):
+        return (
+            f"RingBuffer({list(self)}, maxlen={self._maxlen}, "
+            f"typecode='{self._typecode}')"
+        )
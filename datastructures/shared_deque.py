@@ -0,0 +1,244 @@
+"""A queue of fixed-size records in shared memory for use across processes."""
+import multiprocessing
+import struct
+import sys
+import time
+from multiprocessing import resource_tracker, shared_memory
+
+# Note: this is a ring buffer of `maxlen` fixed-size slots that lives in a
+#       `multiprocessing.shared_memory` block. The header holds two counters:
+#       `head` (the number of records consumed so far) and `tail` (the number of
+#       records produced so far), each on its own cache line. Only producers
+#       write `tail` and only consumers write `head`, and a producer writes the
+#       slot before it publishes the new `tail`. With a single producer and a
+#       single consumer, no lock is needed at all. Multiple producers (or
+#       consumers) take a lock that is only shared by their side.
+#       https://en.wikipedia.org/wiki/Circular_buffer
+
+# indices of the 8 byte header fields, the header spans two cache lines
+_HEAD, _MAXLEN, _RECORD_SIZE = 0, 1, 2  # in the first cache line
+_TAIL = 8  # in the second cache line
+_HEADER_SIZE = 128
+
+# the names of the blocks created by this process, see `SharedDeque._attach`
+_created = set()
+
+# how long waiting producers / consumers sleep between polls of the counters
+_MAX_BACKOFF = 0.001
+
+
+class SharedDeque:
+    """A bounded queue of fixed-size records shared between processes.
+
+    Records are either raw `bytes` of exactly `record_size` bytes, or values
+    that are packed with `struct_format` (only one of record_size and
+    struct_format is allowed). `append` packs a record straight into its slot
+    and `popleft` unpacks it from there, so nothing is pickled.
+
+    Unlike `Deque`, a full `SharedDeque` does not evict the oldest record, since
+    the producer cannot safely take a record from under a consumer. Like
+    `BlockingDeque`, `append` and `popleft` wait (or raise `IndexError` when
+    `block` is False or the timeout expires) instead.
+
+    Pass the deque to other processes as a `multiprocessing.Process` argument.
+    A single-producer / single-consumer deque can also be attached by `name`.
+
+    Parameters:
+        maxlen: The number of slots, required unless attaching by name
+        record_size: The size in bytes of a raw record
+        struct_format: A `struct` format for the fields of each record
+        name: The name of an existing shared memory block to attach to
+        multi_producer: Allow several processes to append at the same time
+        multi_consumer: Allow several processes to pop at the same time
+
+    """
+
+    def __init__(
+        self,
+        maxlen=None,
+        record_size=None,
+        struct_format=None,
+        name=None,
+        multi_producer=False,
+        multi_consumer=False,
+    ):
+        if record_size is not None and struct_format is not None:
+            raise ValueError("only one of record_size and struct_format is allowed")
+        if record_size is None and struct_format is None:
+            raise ValueError("one of record_size and struct_format must be specified")
+        if struct_format is not None:
+            record_size = struct.calcsize(struct_format)
+        if record_size <= 0:
+            raise ValueError("record_size must be > 0")
+        if name is None:
+            if maxlen is None or maxlen <= 0:
+                raise ValueError("maxlen must be > 0")
+            shm = shared_memory.SharedMemory(
+                create=True, size=_HEADER_SIZE + maxlen * record_size
+            )
+            header = shm.buf[:_HEADER_SIZE].cast("Q")
+            header[_MAXLEN] = maxlen
+            header[_RECORD_SIZE] = record_size
+            header.release()
+            _created.add(shm.name)
+        else:
+            if multi_producer or multi_consumer:
+                raise ValueError(
+                    "a multi producer / consumer SharedDeque has to be passed to "
+                    "other processes rather than attached by name"
+                )
+            shm = self._attach(name)
+            if (
+                sys.version_info < (3, 13)
+                and name not in _created
+                and multiprocessing.parent_process() is None
+            ):
+                # before 3.13, attaching registers the block with the resource
+                # tracker of this process, which unlinks it when this process
+                # exits and so destroys the deque for every other process. A
+                # process started by `multiprocessing` shares the tracker of its
+                # parent instead, where the creator's registration has to stay
+                resource_tracker.unregister(shm._name, "shared_memory")
+        locks = (
+            multiprocessing.Lock() if multi_producer else None,
+            multiprocessing.Lock() if multi_consumer else None,
+        )
+        self._setup(shm, struct_format, locks)
+        if maxlen is not None and maxlen != self._maxlen:
+            self.close()
+            raise ValueError(f"the shared deque has maxlen={self._maxlen}")
+        if record_size != self._record_size:
+            self.close()
+            raise ValueError(f"the shared deque has record_size={self._record_size}")
+
+    @staticmethod
+    def _attach(name):
+        if sys.version_info >= (3, 13):  # pragma: no cover
+            # only the creator should unlink the block when it exits
+            return shared_memory.SharedMemory(name=name, track=False)
+        # a process started by the creator shares its resource tracker, so
+        # registering the block again there is harmless
+        return shared_memory.SharedMemory(name=name)
+
+    def _setup(self, shm, struct_format, locks):
+        self._shm = shm
+        self._struct_format = struct_format
+        self._producer_lock, self._consumer_lock = locks
+        self._header = shm.buf[:_HEADER_SIZE].cast("Q")
+        self._maxlen = self._header[_MAXLEN]
+        self._record_size = self._header[_RECORD_SIZE]
+        self._slots = shm.buf[_HEADER_SIZE:]
+        if struct_format is None:
+            self._struct = None
+        else:
+            self._struct = struct.Struct(struct_format)
+            # single field records are passed as plain values, not 1-tuples
+            fields = self._struct.unpack(bytes(self._struct.size))
+            self._single_field = len(fields) == 1
+
+    @property
+    def maxlen(self):
+        return self._maxlen
+
+    @property
+    def name(self):
+        return self._shm.name
+
+    @staticmethod
+    def _wait(ready, timeout):
+        """Poll ready() with an increasing sleep, return False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        delay = 0
+        while not ready():
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(delay)
+            delay = min(delay * 2 or 1e-6, _MAX_BACKOFF)
+        return True
+
+    def _has_room(self):
+        return self._header[_TAIL] - self._header[_HEAD] < self._maxlen
+
+    def _has_items(self):
+        return self._header[_TAIL] != self._header[_HEAD]
+
+    def _append(self, record, block, timeout):
+        if self._struct is None and len(record) != self._record_size:
+            raise ValueError(f"records must be exactly {self._record_size} bytes")
+        header = self._header
+        tail = header[_TAIL]
+        if tail - header[_HEAD] >= self._maxlen:
+            if not block or not self._wait(self._has_room, timeout):
+                raise IndexError("SharedDeque already at its maximum size")
+        offset = (tail % self._maxlen) * self._record_size
+        if self._struct is None:
+            self._slots[offset : offset + self._record_size] = record
+        elif self._single_field:
+            self._struct.pack_into(self._slots, offset, record)
+        else:
+            self._struct.pack_into(self._slots, offset, *record)
+        # publish the record only once it has been written
+        header[_TAIL] = tail + 1
+
+    def _popleft(self, block, timeout):
+        header = self._header
+        head = header[_HEAD]
+        if head == header[_TAIL]:
+            if not block or not self._wait(self._has_items, timeout):
+                raise IndexError("pop from an empty SharedDeque")
+        offset = (head % self._maxlen) * self._record_size
+        if self._struct is None:
+            record = bytes(self._slots[offset : offset + self._record_size])
+        else:
+            record = self._struct.unpack_from(self._slots, offset)
+            if self._single_field:
+                record = record[0]
+        # free the slot only once it has been read
+        header[_HEAD] = head + 1
+        return record
+
+    def append(self, record, block=True, timeout=None):
+        if self._producer_lock is None:
+            self._append(record, block, timeout)
+        else:
+            with self._producer_lock:
+                self._append(record, block, timeout)
+
+    def popleft(self, block=True, timeout=None):
+        if self._consumer_lock is None:
+            return self._popleft(block, timeout)
+        with self._consumer_lock:
+            return self._popleft(block, timeout)
+
+    def __len__(self):
+        # with concurrent producers / consumers this is only a snapshot
+        return self._header[_TAIL] - self._header[_HEAD]
+
+    def close(self):
+        """Detach from the shared memory, the deque can't be used afterwards."""
+        self._header.release()
+        self._slots.release()
+        self._shm.close()
+
+    def unlink(self):
+        """Free the shared memory once every process has closed the deque."""
+        self._shm.unlink()
+        _created.discard(self.name)
+
+    def __getstate__(self):
+        # the locks can only be pickled while a `Process` is being started
+        return (
+            self.name,
+            self._struct_format,
+            (self._producer_lock, self._consumer_lock),
+        )
+
+    def __setstate__(self, state):
+        name, struct_format, locks = state
+        self._setup(self._attach(name), struct_format, locks)
+
+    def __repr__(self):
+        return (
+            f"SharedDeque(name={self.name!r}, maxlen={self._maxlen}, "
+            f"record_size={self._record_size}, len={len(self)})"
+        )
@@ -0,0 +1,151 @@
+"""Sliding window minimum and maximum using monotonic deques."""
+import time
+from collections.abc import Sequence
+from itertools import count
+
+from .deque import Deque
+
+# Note: rather than storing every value in the window, we keep two deques of
+#       candidates. `_mins` holds values in increasing order: when a new value
+#       arrives, every candidate at the right end that is not smaller can never
+#       be the minimum again (the new value is smaller and expires later), so
+#       it is popped. The minimum is then always at the left end, and values
+#       leave through the left end once they fall out of the window. Each value
+#       is pushed and popped at most once, so this is O(1) amortized per value.
+
+
+class SlidingWindowAggregator:
+    """Rolling min and max over the most recent values.
+
+    The window either holds the last `size` values (a count-based window), or
+    the values pushed within the last `duration` seconds (a time-based
+    window). Only one of size and duration is allowed.
+
+    Time-based windows timestamp each value with `clock` unless a timestamp is
+    passed explicitly, timestamps must never decrease. Old values are dropped
+    when a newer value is pushed or when `expire` is called.
+
+    Parameters:
+        size: The number of values in a count-based window
+        duration: The length in seconds of a time-based window
+        clock: The function used to timestamp values in a time-based window
+
+    """
+
+    def __init__(self, size=None, duration=None, clock=time.monotonic):
+        if size is not None and duration is not None:
+            raise ValueError("only one of size and duration is allowed")
+        if size is None and duration is None:
+            raise ValueError("one of size and duration must be specified")
+        if size is not None and size <= 0:
+            raise ValueError("size must be > 0")
+        if duration is not None and duration <= 0:
+            raise ValueError("duration must be > 0")
+        self.size = size
+        self.duration = duration
+        # how far back from the newest key the window reaches
+        self._span = size if size is not None else duration
+        self._clock = clock
+        # (key, value) candidates, where the key is the position of the value
+        # for count-based windows and its timestamp for time-based windows
+        self._mins = Deque()
+        self._maxs = Deque()
+        self._pushed = 0  # the number of values pushed so far
+        self._last_timestamp = None
+
+    def _key(self, timestamp):
+        if self.size is not None:
+            if timestamp is not None:
+                raise ValueError("timestamps require a time-based window")
+            self._pushed += 1
+            return self._pushed
+        if timestamp is None:
+            timestamp = self._clock()
+        if self._last_timestamp is not None and timestamp < self._last_timestamp:
+            raise ValueError("timestamps must not decrease")
+        self._last_timestamp = timestamp
+        self._pushed += 1
+        return timestamp
+
+    def _expire(self, cutoff):
+        """Drop the candidates whose key is at or before cutoff."""
+        for candidates in self._mins, self._maxs:
+            while candidates and candidates[0][0] <= cutoff:
+                candidates.popleft()
+
+    def push(self, value, timestamp=None):
+        key = self._key(timestamp)
+        mins, maxs = self._mins, self._maxs
+        while mins and mins[-1][1] >= value:
+            mins.pop()
+        mins.append((key, value))
+        while maxs and maxs[-1][1] <= value:
+            maxs.pop()
+        maxs.append((key, value))
+        self._expire(key - self._span)
+
+    def extend(self, values, timestamps=None):
+        """Push every value of an iterable.
+
+        This is equivalent to calling `push` for each value, but with the
+        loop inlined. For a count-based window, only the last `size` values of
+        a sequence can end up in the window, so the rest are skipped.
+
+        """
+        if self.size is not None:
+            if timestamps is not None:
+                raise ValueError("timestamps require a time-based window")
+            if isinstance(values, Sequence) and len(values) > self.size:
+                skipped = len(values) - self.size
+                self._pushed += skipped
+                values = values[skipped:]
+            # the keys are consecutive, so we number the values directly
+            keyed = zip(count(self._pushed + 1), values)
+        elif timestamps is not None:
+            keyed = ((self._key(t), value) for t, value in zip(timestamps, values))
+        else:
+            keyed = ((self._key(None), value) for value in values)
+        mins, maxs = self._mins, self._maxs
+        span = self._span
+        key = None
+        for key, value in keyed:
+            while mins and mins[-1][1] >= value:
+                mins.pop()
+            mins.append((key, value))
+            while maxs and maxs[-1][1] <= value:
+                maxs.pop()
+            maxs.append((key, value))
+            cutoff = key - span
+            while mins[0][0] <= cutoff:
+                mins.popleft()
+            while maxs[0][0] <= cutoff:
+                maxs.popleft()
+        if self.size is not None and key is not None:
+            self._pushed = key
+
+    def expire(self, timestamp=None):
+        """Drop the values of a time-based window that are older than duration.
+
+        This lets a time-based window move forward without pushing a value.
+
+        """
+        if self.duration is None:
+            raise ValueError("expire requires a time-based window")
+        if timestamp is None:
+            timestamp = self._clock()
+        self._expire(timestamp - self.duration)
+
+    def min(self):
+        if not self._mins:
+            raise ValueError("min of an empty window")
+        return self._mins[0][1]
+
+    def max(self):
+        if not self._maxs:
+            raise ValueError("max of an empty window")
+        return self._maxs[0][1]
+
+    def __repr__(self):
+        if self.size is not None:
+            return f"SlidingWindowAggregator(size={self.size})"
+        return f"SlidingWindowAggregator(duration={self.duration})"
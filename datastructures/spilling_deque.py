@@ -0,0 +1,285 @@
+"""An unbounded deque that spills the items in its middle to disk."""
+import mmap
+import os
+import pickle
+import shutil
+import tempfile
+import weakref
+
+from .deque import Deque
+
+# Note: the items are split into three runs: `_left` and `_right` are in memory
+#       `Deque`s holding the two ends, and `_spilled` holds the blocks in the
+#       middle that were written to disk. When the ends hold more items than
+#       the budget allows, a block of `block_size` items is cut from the inner
+#       side of an end (next to the spilled blocks) and pickled onto the end of
+#       the current segment file. Segment files are append only, so a block
+#       spilled from the left end simply lands after blocks spilled from the
+#       right end; `_spilled` records where each block is and keeps them in
+#       order. When an end runs out, the closest spilled block is read back
+#       through a memory map of its segment. A segment file is deleted as soon
+#       as none of its blocks are left. Every block costs O(block_size) to
+#       spill or load once per block_size items, so every operation stays O(1)
+#       amortized.
+
+
+class _Segment:
+    """An append only file of pickled blocks."""
+
+    __slots__ = ("path", "file", "map", "size", "blocks")
+
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, "w+b")
+        self.map = None
+        self.size = 0
+        self.blocks = 0  # the number of blocks still in the deque
+
+    def write(self, data):
+        offset = self.size
+        self.file.write(data)
+        self.size += len(data)
+        self.blocks += 1
+        return offset
+
+    def read(self, offset, length):
+        if self.map is None or len(self.map) < offset + length:
+            # the file grew since it was mapped
+            self.file.flush()
+            if self.map is not None:
+                self.map.close()
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self.map[offset : offset + length]
+
+    def close(self):
+        if self.map is not None:
+            self.map.close()
+        self.file.close()
+        os.remove(self.path)
+
+
+def _remove_segments(segments, directory, owned):
+    for segment in segments.values():
+        segment.close()
+    segments.clear()
+    if owned:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+class SpillingDeque:
+    """A deque that keeps at most `block_size * memory_blocks` items in memory.
+
+    It supports `append`, `appendleft`, `pop`, `popleft`, `extend`,
+    `extendleft`, `len` and iteration like `Deque`. Once the deque holds more
+    items than the budget, blocks from its middle are pickled into segment
+    files under `directory` (a new temporary directory by default), so the
+    items must be picklable. Only the items in memory count towards the
+    budget, the size of the items themselves is up to the caller.
+
+    Call `close` (or use the deque as a context manager) to delete the segment
+    files, otherwise they are deleted when the deque is garbage collected.
+
+    Parameters:
+        iterable: The initial items
+        block_size: The number of items that are spilled or loaded at once
+        memory_blocks: The number of blocks that can stay in memory (>= 2)
+        directory: Where to create the segment files
+        segment_size: The size in bytes after which a new segment is started
+
+    """
+
+    def __init__(
+        self,
+        iterable=None,
+        block_size=1024,
+        memory_blocks=4,
+        directory=None,
+        segment_size=64 * 1024 * 1024,
+    ):
+        if block_size <= 0:
+            raise ValueError("block_size must be > 0")
+        if memory_blocks < 2:
+            raise ValueError("memory_blocks must be >= 2")
+        self.block_size = block_size
+        self.memory_blocks = memory_blocks
+        self.segment_size = segment_size
+        self._budget = block_size * memory_blocks
+        self._left = Deque()
+        self._right = Deque()
+        # (segment, offset, length, item count) of each spilled block in order
+        self._spilled = Deque()
+        self._spilled_items = 0
+        self._segments = {}  # path -> _Segment
+        self._segment = None  # the segment that blocks are spilled to
+        self._directory = directory
+        self._owns_directory = False
+        self._finalizer = None
+        self._state = 0
+        if iterable is not None:
+            self.extend(iterable)
+
+    def _new_segment(self):
+        if self._finalizer is None:
+            if self._directory is None:
+                self._directory = tempfile.mkdtemp(prefix="spilling_deque_")
+                self._owns_directory = True
+            self._finalizer = weakref.finalize(
+                self,
+                _remove_segments,
+                self._segments,
+                self._directory,
+                self._owns_directory,
+            )
+        fd, path = tempfile.mkstemp(suffix=".seg", dir=self._directory)
+        os.close(fd)
+        segment = _Segment(path)
+        self._segments[path] = segment
+        return segment
+
+    def _spill(self, from_right):
+        """Write a block from the inner side of one end to disk."""
+        # since the budget holds at least two blocks, one of the ends always
+        # has a full block to spill
+        if len(self._right if from_right else self._left) < self.block_size:
+            from_right = not from_right
+        # popping unlinks every node, so the items are freed right away rather
+        # than when the garbage collector gets to a detached chain
+        if from_right:
+            block = [self._right.popleft() for _ in range(self.block_size)]
+        else:
+            block = [self._left.pop() for _ in range(self.block_size)]
+            block.reverse()
+        data = pickle.dumps(block, pickle.HIGHEST_PROTOCOL)
+        if self._segment is None or self._segment.size >= self.segment_size:
+            self._segment = self._new_segment()
+        record = (self._segment, self._segment.write(data), len(data), len(block))
+        if from_right:
+            self._spilled.append(record)
+        else:
+            self._spilled.appendleft(record)
+        self._spilled_items += len(block)
+
+    def _load(self, record):
+        segment, offset, length, count = record
+        items = pickle.loads(segment.read(offset, length))
+        self._spilled_items -= count
+        segment.blocks -= 1
+        if segment.blocks == 0:
+            del self._segments[segment.path]
+            segment.close()
+            if segment is self._segment:
+                self._segment = None
+        return items
+
+    def _check_budget(self, from_right):
+        if len(self._left) + len(self._right) > self._budget:
+            self._spill(from_right)
+
+    def append(self, val):
+        self._state += 1
+        self._right.append(val)
+        self._check_budget(from_right=True)
+
+    def appendleft(self, val):
+        self._state += 1
+        self._left.appendleft(val)
+        self._check_budget(from_right=False)
+
+    def extend(self, iterable):
+        for val in iterable:
+            self.append(val)
+
+    def extendleft(self, iterable):
+        for val in iterable:
+            self.appendleft(val)
+
+    def pop(self):
+        if not self._right:
+            if self._spilled:
+                self._right = Deque(self._load(self._spilled.pop()))
+                self._check_budget(from_right=False)
+            elif self._left:
+                self._state += 1
+                return self._left.pop()
+            else:
+                raise IndexError("pop from an empty SpillingDeque")
+        self._state += 1
+        return self._right.pop()
+
+    def popleft(self):
+        if not self._left:
+            if self._spilled:
+                self._left = Deque(self._load(self._spilled.popleft()))
+                self._check_budget(from_right=True)
+            elif self._right:
+                self._state += 1
+                return self._right.popleft()
+            else:
+                raise IndexError("pop from an empty SpillingDeque")
+        self._state += 1
+        return self._left.popleft()
+
+    def clear(self):
+        self._state += 1
+        self._left.clear()
+        self._right.clear()
+        self._spilled.clear()
+        self._spilled_items = 0
+        self._segment = None
+        for segment in self._segments.values():
+            segment.close()
+        self._segments.clear()
+
+    def close(self):
+        """Delete the segment files (and the temporary directory).
+
+        The deque is left empty and can still be used, any further spills go
+        to a new temporary directory (or the same `directory` as before).
+
+        """
+        self.clear()
+        if self._finalizer is not None:
+            self._finalizer()
+            self._finalizer = None
+            if self._owns_directory:
+                self._directory = None
+                self._owns_directory = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def in_memory(self):
+        """The number of items that are currently held in memory."""
+        return len(self._left) + len(self._right)
+
+    def __len__(self):
+        return len(self._left) + self._spilled_items + len(self._right)
+
+    def __iter__(self):
+        state = self._state
+
+        def check():
+            if state != self._state:
+                raise RuntimeError("SpillingDeque mutated during iteration")
+
+        for val in self._left:
+            yield val
+            check()
+        # the spilled blocks are read straight from their segments, one at a
+        # time, without loading them into the deque
+        for segment, offset, length, _ in self._spilled:
+            check()
+            items = pickle.loads(segment.read(offset, length))
+            for val in items:
+                yield val
+                check()
+        for val in self._right:
+            yield val
+            check()
+
+    def __repr__(self):
+        return f"SpillingDeque(len={len(self)}, in_memory={self.in_memory})"
@@ -0,0 +1,144 @@
+"""Tests for the asyncio AsyncDeque."""
+
+import asyncio
+
+import pytest
+
+
+def test_basics():
+    from datastructures import AsyncDeque
+
+    async def main():
+        d = AsyncDeque(range(3), maxlen=5)
+        assert len(d) == 3
+        assert d.maxlen == 5
+        await d.append(3)
+        await d.appendleft(-1)
+        assert repr(d) == "AsyncDeque([-1, 0, 1, 2, 3], maxlen=5)"
+        assert await d.popleft() == -1
+        assert await d.pop() == 3
+        assert await d.get_many(2) == [0, 1]
+        assert await d.get_many(10) == [2]
+        assert await d.get_many(10, timeout=0.01) == []
+
+    asyncio.run(main())
+
+    # every append to an empty maxlen would wait forever
+    with pytest.raises(ValueError):
+        AsyncDeque(maxlen=0)
+
+
+def test_waiting():
+    from datastructures import AsyncDeque
+
+    async def main():
+        d = AsyncDeque(maxlen=1)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(d.popleft(), 0.01)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(d.pop(), 0.01)
+        await d.append(1)
+        # a full deque applies backpressure rather than evicting
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(d.append(2), 0.01)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(d.appendleft(2), 0.01)
+        assert await d.popleft() == 1
+
+        received = []
+
+        async def consumer():
+            for _ in range(100):
+                received.append(await d.popleft())
+
+        task = asyncio.ensure_future(consumer())
+        for i in range(100):
+            await d.append(i)
+        await task
+        assert received == list(range(100))
+
+        # a consumer waiting in `get_many` is woken up by an append
+        for timeout in (None, 5):
+            task = asyncio.ensure_future(d.get_many(5, timeout=timeout))
+            await asyncio.sleep(0)
+            await d.append("a")
+            assert await task == ["a"]
+
+        # the same goes for the right end
+        task = asyncio.ensure_future(d.pop())
+        await asyncio.sleep(0)
+        await d.appendleft("b")
+        assert await task == "b"
+        await d.appendleft("c")
+        task = asyncio.ensure_future(d.appendleft("d"))
+        await asyncio.sleep(0)
+        assert await d.pop() == "c"
+        await task
+        assert await d.pop() == "d"
+
+    asyncio.run(main())
+
+
+def test_cancelled_waiters():
+    from datastructures import AsyncDeque
+
+    async def main():
+        d = AsyncDeque()
+        cancelled = asyncio.ensure_future(d.popleft())
+        waiting = asyncio.ensure_future(d.popleft())
+        await asyncio.sleep(0)
+        await d.append(1)
+        # the first consumer was woken up but is cancelled before it runs, so
+        # it has to hand the item on to the next consumer
+        cancelled.cancel()
+        assert await waiting == 1
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+
+        d = AsyncDeque([0], maxlen=1)
+        cancelled = asyncio.ensure_future(d.append(1))
+        waiting = asyncio.ensure_future(d.append(2))
+        await asyncio.sleep(0)
+        assert await d.popleft() == 0
+        cancelled.cancel()
+        await waiting
+        assert await d.get_many(5) == [2]
+
+        # a waiter that is cancelled before it is woken up is removed
+        task = asyncio.ensure_future(d.popleft())
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert len(d._getters) == 0
+
+    asyncio.run(main())
+
+
+def test_many_tasks():
+    from datastructures import AsyncDeque
+
+    n_tasks, n_items = 20, 200
+
+    async def main():
+        d = AsyncDeque(maxlen=8)
+        received = []
+
+        async def producer(start):
+            for i in range(start, start + n_items):
+                await d.append(i)
+
+        async def consumer():
+            remaining = n_items
+            while remaining:
+                items = await d.get_many(remaining, timeout=5)
+                received.extend(items)
+                remaining -= len(items)
+
+        await asyncio.gather(
+            *(producer(i * n_items) for i in range(n_tasks)),
+            *(consumer() for _ in range(n_tasks)),
+        )
+        assert sorted(received) == list(range(n_tasks * n_items))
+
+    asyncio.run(main())
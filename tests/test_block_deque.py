@@ -0,0 +1,288 @@
+"""Block deque tests."""
+
+import pytest
+
+# Note: the behavior of `BlockDeque` is checked against `collections.deque`
+#       since both should have the same semantics. The block size is small
+#       compared to the sizes used here so that block boundaries are crossed
+#       often.
+
+BIG = 100_00
+
+
+def test_basics():
+    from datastructures import BlockDeque
+
+    d = BlockDeque(range(-5125, -5000))
+    d.__init__(range(200))
+    for i in range(200, 400):
+        d.append(i)
+    for i in reversed(range(-200, 0)):
+        d.appendleft(i)
+    assert list(d) == list(range(-200, 400))
+    assert len(d) == 600
+
+    left = [d.popleft() for i in range(250)]
+    assert left == list(range(-200, 50))
+    assert list(d) == list(range(50, 400))
+
+    right = [d.pop() for i in range(250)]
+    right.reverse()
+    assert right == list(range(150, 400))
+    assert list(d) == list(range(50, 150))
+
+    assert repr(BlockDeque()) == "BlockDeque([])"
+
+
+def test_random_operations():
+    import random
+    from collections import deque
+
+    from datastructures import BlockDeque
+
+    random.seed(0)
+
+    for maxlen in (None, 0, 1, 70, 300):
+        d = BlockDeque(maxlen=maxlen)
+        cmp_deque = deque(maxlen=maxlen)
+        for i in range(3000):
+            op = random.randrange(9)
+            if op < 2:
+                d.append(i)
+                cmp_deque.append(i)
+            elif op < 4:
+                d.appendleft(i)
+                cmp_deque.appendleft(i)
+            elif op == 4 and cmp_deque:
+                assert d.pop() == cmp_deque.pop()
+            elif op == 5 and cmp_deque:
+                assert d.popleft() == cmp_deque.popleft()
+            elif op == 6:
+                n = random.randrange(-200, 200)
+                d.rotate(n)
+                cmp_deque.rotate(n)
+            elif op == 7 and cmp_deque and len(cmp_deque) != maxlen:
+                j = random.randrange(-len(cmp_deque), len(cmp_deque))
+                d.insert(j, i)
+                cmp_deque.insert(j, i)
+            elif op == 8 and cmp_deque:
+                j = random.randrange(-len(cmp_deque), len(cmp_deque))
+                del d[j]
+                del cmp_deque[j]
+            assert len(d) == len(cmp_deque)
+        assert list(d) == list(cmp_deque)
+        assert list(reversed(d)) == list(reversed(cmp_deque))
+
+
+def test_maxlen():
+    from datastructures import BlockDeque
+
+    with pytest.raises(ValueError):
+        BlockDeque("abc", -1)
+
+    it = iter(range(10))
+    d = BlockDeque(it, maxlen=3)
+    assert list(it) == []
+    assert repr(d) == "BlockDeque([7, 8, 9], maxlen=3)"
+    d.append(10)
+    assert list(d) == [8, 9, 10]
+    d.appendleft(7)
+    assert list(d) == [7, 8, 9]
+    d.extend([10, 11])
+    assert list(d) == [9, 10, 11]
+    d.extendleft([8, 7])
+    assert list(d) == [7, 8, 9]
+
+    d = BlockDeque(maxlen=0)
+    d.extend(range(100))
+    d.extendleft(range(100))
+    assert list(d) == []
+
+    with pytest.raises(AttributeError):
+        d.maxlen = 10
+
+
+def test_getitem_setitem():
+    from datastructures import BlockDeque
+
+    n = 500
+    d = BlockDeque(range(n))
+    for i in range(-n, n):
+        assert d[i] == list(range(n))[i]
+    for i in range(n):
+        d[i] = 10 * i
+    assert list(d) == [10 * i for i in range(n)]
+
+    with pytest.raises(IndexError):
+        d[n]
+    with pytest.raises(IndexError):
+        d[-n - 1]
+    with pytest.raises(TypeError):
+        d[1.5]
+    with pytest.raises(TypeError, match="slicing"):
+        d[1:3]
+    with pytest.raises(IndexError):
+        del d[n]
+
+
+def test_count_index_contains_remove():
+    from datastructures import BlockDeque
+
+    s = list("simsalabim" * 50 + "abc")
+    d = BlockDeque(s)
+    for letter in "abcdefghijklmnopqrstuvwxyz":
+        assert s.count(letter) == d.count(letter)
+        assert (letter in s) == (letter in d)
+
+    elements = "ABCDEFGHI"
+    d = BlockDeque(elements * 2)
+    s = list(elements * 2)
+    for start in range(-20, 20):
+        for stop in range(-20, 20):
+            for element in elements + "Z":
+                try:
+                    target = s.index(element, start, stop)
+                except ValueError:
+                    with pytest.raises(ValueError):
+                        d.index(element, start, stop)
+                else:
+                    assert d.index(element, start, stop) == target
+
+    d = BlockDeque("abdefghcij")
+    d.remove("c")
+    assert d == BlockDeque("abdefghij")
+    with pytest.raises(ValueError):
+        d.remove("c")
+
+
+def test_mutation_during_iteration():
+    from datastructures import BlockDeque
+
+    class MutateCmp:
+        def __init__(self, deque):
+            self.deque = deque
+
+        def __eq__(self, other):
+            self.deque.clear()
+            return False
+
+    for method in ("count", "index", "__contains__", "remove"):
+        d = BlockDeque(range(200))
+        d[100] = MutateCmp(d)
+        with pytest.raises(RuntimeError):
+            getattr(d, method)(300)
+
+    d = BlockDeque(range(10))
+    it = iter(d)
+    next(it)
+    d.append(10)
+    with pytest.raises(RuntimeError):
+        next(it)
+
+
+def test_reverse_rotate():
+    from datastructures import BlockDeque
+
+    for n in (0, 1, 2, 63, 64, 65, 200):
+        d = BlockDeque(range(n))
+        d.reverse()
+        assert list(d) == list(reversed(range(n)))
+
+    s = tuple("abcde")
+    d = BlockDeque(s)
+    d.rotate(1)
+    assert "".join(d) == "eabcd"
+    d.rotate(-2)
+    assert "".join(d) == "bcdea"
+    d.rotate(BIG + 1)
+    assert tuple(d) == s
+
+    with pytest.raises(TypeError):
+        d.rotate("x")
+
+
+def test_operators():
+    from datastructures import BlockDeque
+
+    d = BlockDeque("abc")
+    assert d + BlockDeque("def") == BlockDeque("abcdef")
+    assert d * 2 == BlockDeque("abcabc")
+    assert 0 * d == BlockDeque()
+    assert BlockDeque("ab") < BlockDeque("abc") < BlockDeque("abd")
+    d += d
+    assert list(d) == list("abcabc")
+    d *= 2
+    assert list(d) == list("abcabc" * 2)
+    d *= 0
+    assert list(d) == []
+
+    with pytest.raises(TypeError):
+        BlockDeque("abc") + "def"
+    with pytest.raises(TypeError):
+        BlockDeque("abc") * 1.5
+    with pytest.raises(TypeError):
+        assert BlockDeque("abc") < list("abc")
+
+
+def test_pickle_copy():
+    import copy
+    import pickle
+
+    from datastructures import BlockDeque
+
+    for d in BlockDeque(range(200)), BlockDeque(range(200), 100):
+        for proto in range(pickle.HIGHEST_PROTOCOL + 1):
+            e = pickle.loads(pickle.dumps(d, proto))
+            assert e == d
+            assert e.maxlen == d.maxlen
+        assert copy.copy(d) == d
+        assert d.copy() == d
+
+    d = BlockDeque("abc")
+    d.append(d)
+    e = pickle.loads(pickle.dumps(d))
+    assert e[-1] is e
+    assert repr(d) == "BlockDeque([a, b, c, BlockDeque([...])])"
+
+    d = BlockDeque(range(200))
+    it = iter(d)
+    for _ in range(70):
+        next(it)
+    it, e = pickle.loads(pickle.dumps((it, d)))
+    assert list(it) == list(range(70, 200))
+    assert list(pickle.loads(pickle.dumps(reversed(d)))) == list(reversed(range(200)))
+
+
+def test_big_queue():
+    from datastructures import BlockDeque
+
+    d = BlockDeque()
+    for i in range(BIG):
+        d.append(i)
+    for i in range(BIG):
+        assert d.popleft() == i
+    assert len(d) == 0
+    # the deque should shrink back to a single block
+    assert d.head is d.tail
+
+
+def test_insert_underflow():
+    from datastructures import BlockDeque
+
+    elements = "ABCDEFGHI"
+    for i in range(-5 - len(elements) * 2, 5 + len(elements) * 2):
+        d = BlockDeque(elements)
+        s = list(elements)
+        d.insert(i, "Z")
+        s.insert(i, "Z")
+        assert list(d) == s
+
+    d = BlockDeque("abc", maxlen=3)
+    with pytest.raises(IndexError):
+        d.insert(1, "Z")
+
+    d = BlockDeque()
+    with pytest.raises(IndexError):
+        d.pop()
+    with pytest.raises(IndexError):
+        d.popleft()
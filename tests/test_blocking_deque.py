@@ -0,0 +1,133 @@
+"""Tests for the thread-safe BlockingDeque."""
+
+import pytest
+
+
+def test_basics():
+    from datastructures import BlockingDeque
+
+    d = BlockingDeque(range(3), maxlen=5)
+    assert len(d) == 3
+    assert d.maxlen == 5
+    d.append(3)
+    d.appendleft(-1)
+    assert repr(d) == "BlockingDeque([-1, 0, 1, 2, 3], maxlen=5)"
+    assert d.popleft() == -1
+    assert d.pop() == 3
+    with pytest.raises(ValueError):
+        d.drain(-1)
+    assert len(d) == 3
+    assert d.drain(2) == [0, 1]
+    assert d.drain() == [2]
+    assert d.drain() == []
+    d.append(1)
+    d.clear()
+    assert len(d) == 0
+
+    # every append to an empty maxlen would block forever
+    with pytest.raises(ValueError):
+        BlockingDeque(maxlen=0)
+
+
+def test_non_blocking():
+    from datastructures import BlockingDeque
+
+    d = BlockingDeque(maxlen=1)
+    with pytest.raises(IndexError):
+        d.pop(block=False)
+    with pytest.raises(IndexError):
+        d.popleft(timeout=0.01)
+    d.append(1, block=False)
+    # a full deque does not evict, it refuses the item
+    with pytest.raises(IndexError):
+        d.append(2, block=False)
+    with pytest.raises(IndexError):
+        d.appendleft(2, timeout=0.01)
+    assert d.drain(block=True) == [1]
+    assert d.drain(block=True, timeout=0.01) == []
+
+
+def test_blocking_handoff():
+    import threading
+
+    from datastructures import BlockingDeque
+
+    d = BlockingDeque(maxlen=1)
+    received = []
+
+    def consumer():
+        for _ in range(100):
+            received.append(d.popleft(timeout=5))
+
+    thread = threading.Thread(target=consumer)
+    thread.start()
+    # the deque only holds a single item so every append has to wait for the
+    # consumer
+    for i in range(100):
+        d.append(i, timeout=5)
+    thread.join()
+    assert received == list(range(100))
+
+
+def test_multiple_producers_consumers():
+    import threading
+
+    from datastructures import BlockingDeque
+
+    n_threads, n_items = 4, 2000
+    d = BlockingDeque(maxlen=16)
+    received = []
+    lock = threading.Lock()
+
+    def producer(start):
+        for i in range(start, start + n_items):
+            d.append(i, timeout=5)
+
+    def consumer():
+        items = []
+        while len(items) < n_items:
+            items.extend(d.drain(n_items - len(items), block=True, timeout=5))
+        with lock:
+            received.extend(items)
+
+    threads = [
+        threading.Thread(target=producer, args=(i * n_items,)) for i in range(n_threads)
+    ] + [threading.Thread(target=consumer) for _ in range(n_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(received) == list(range(n_threads * n_items))
+    assert len(d) == 0
+
+
+def test_wakeups():
+    import threading
+    import time
+
+    from datastructures import BlockingDeque
+
+    d = BlockingDeque(maxlen=1)
+    # a consumer that timed out must not swallow the wakeup of the next one
+    with pytest.raises(IndexError):
+        d.popleft(timeout=0.01)
+    received = []
+    thread = threading.Thread(target=lambda: received.append(d.popleft(timeout=5)))
+    thread.start()
+    d.append(1)
+    thread.join()
+    assert received == [1]
+
+    # clear wakes up every waiting producer
+    d.append(2)
+    producers = [threading.Thread(target=d.append, args=(i,)) for i in range(2)]
+    for producer in producers:
+        producer.start()
+    while len(d._putters) < 2:
+        time.sleep(0.001)
+    d.clear()
+    items = d.drain(block=True, timeout=5)
+    items += d.drain(block=True, timeout=5)
+    assert sorted(items) == [0, 1]
+    for producer in producers:
+        producer.join()
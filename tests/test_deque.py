@@ -243,6 +243,34 @@ def test_extend():
     assert list(d) == list("abcdabcd")
 
 
+def test_extend_maxlen():
+    from collections import deque
+
+    from datastructures import Deque
+
+    for maxlen in (None, 0, 1, 2, 5):
+        for size in range(4):
+            for batch in (0, 1, 3, 5, 8):
+                d = Deque(range(size), maxlen=maxlen)
+                cmp_deque = deque(range(size), maxlen=maxlen)
+                d.extend(range(100, 100 + batch))
+                cmp_deque.extend(range(100, 100 + batch))
+                assert list(d) == list(cmp_deque)
+                assert list(reversed(d)) == list(reversed(cmp_deque))
+                d.extendleft(range(200, 200 + batch))
+                cmp_deque.extendleft(range(200, 200 + batch))
+                assert list(d) == list(cmp_deque)
+                assert list(reversed(d)) == list(reversed(cmp_deque))
+                assert len(d) == len(cmp_deque)
+
+    # the batch is streamed and trimmed before it is linked in
+    d = Deque(range(10), maxlen=10)
+    d.extend(i for i in range(100_000))
+    assert list(d) == list(range(99_990, 100_000))
+    d.extendleft(i for i in range(100_000))
+    assert list(d) == list(reversed(range(99_990, 100_000)))
+
+
 def test_add():
     from datastructures import Deque
 
@@ -327,6 +355,156 @@ def test_getitem():
     assert pytest.raises(TypeError, d.__getitem__, other)
 
 
+def test_getitem_finger():
+    import random
+    from collections import deque
+
+    from datastructures import Deque
+
+    random.seed(0)
+
+    # every mutation has to keep the cached finger in sync, so we interleave
+    # them with random lookups
+    d = Deque(range(50), maxlen=80)
+    cmp_deque = deque(range(50), maxlen=80)
+    ops = [
+        lambda x: x.append(-1),
+        lambda x: x.appendleft(-2),
+        lambda x: x.pop(),
+        lambda x: x.popleft(),
+        lambda x: x.rotate(7),
+        lambda x: x.rotate(-3),
+        lambda x: x.reverse(),
+        lambda x: x.extend(range(5)),
+        lambda x: x.extendleft(range(5)),
+        lambda x: x.insert(len(x) // 3, -3),
+        lambda x: x.__delitem__(len(x) // 2),
+        lambda x: x.remove(x[-2]),
+    ]
+    for _ in range(2000):
+        if len(cmp_deque) < 5:
+            d.extend(range(20))
+            cmp_deque.extend(range(20))
+        op = random.choice(ops)
+        if op is ops[9] and len(cmp_deque) == cmp_deque.maxlen:
+            continue
+        op(d)
+        op(cmp_deque)
+        for _ in range(3):
+            j = random.randrange(-len(cmp_deque), len(cmp_deque))
+            assert d[j] == cmp_deque[j]
+            d[j] = cmp_deque[j] = random.random()
+    assert list(d) == list(cmp_deque)
+    assert list(reversed(d)) == list(reversed(cmp_deque))
+
+    # sequential access only takes a single step from the finger
+    n = 20_000
+    d = Deque(range(n))
+    assert [d[i] for i in range(n)] == list(range(n))
+    assert [d[i] for i in reversed(range(n))] == list(reversed(range(n)))
+
+
+def test_getitem_slice():
+    from datastructures import Deque
+
+    items = list(range(20))
+    steps = (None, 1, 2, 3, -1, -2, -7, 25)
+    bounds = (None, 0, 3, -3, 10, 19, 20, 50, -50)
+    for reverse in False, True:
+        d = Deque(reversed(items) if reverse else items)
+        if reverse:
+            d.reverse()
+        for start in bounds:
+            for stop in bounds:
+                for step in steps:
+                    s = slice(start, stop, step)
+                    view = d[s]
+                    assert len(view) == len(items[s])
+                    assert list(view) == items[s]
+                    assert list(reversed(view)) == items[s][::-1]
+                    assert view.copy() == Deque(items[s])
+        view = d[2:15:3]
+        assert view[1] == items[5]
+        assert view[-1] == items[14]
+        assert list(view[::-1]) == items[2:15:3][::-1]
+        with pytest.raises(IndexError):
+            view[5]
+    assert repr(Deque("abc")[::2]) == "Deque._View(['a', 'c'])"
+    assert list(Deque()[:]) == []
+
+    # mutating the deque invalidates the view
+    d = Deque(range(10))
+    view = d[1:5]
+    it = iter(view)
+    next(it)
+    d.append(10)
+    for fn in (len, list, Deque._View.copy, lambda v: v[0]):
+        with pytest.raises(RuntimeError):
+            fn(view)
+    with pytest.raises(RuntimeError):
+        next(it)
+
+    with pytest.raises(ValueError):
+        d[::0]
+
+
+def test_splice_split():
+    import random
+
+    from datastructures import Deque
+
+    random.seed(0)
+
+    for _ in range(2000):
+        maxlen = random.choice([None, 0, 1, 3, 6])
+        a = Deque(range(random.randrange(8)), maxlen=maxlen)
+        b = Deque(range(100, 100 + random.randrange(8)))
+        # the chains of the two deques may run in opposite directions
+        if random.random() < 0.5:
+            a.reverse()
+        if random.random() < 0.5:
+            b.reverse()
+        left = random.random() < 0.5
+        expected = list(b) + list(a) if left else list(a) + list(b)
+        if maxlen is not None:
+            start = max(len(expected) - maxlen, 0)
+            expected = expected[:maxlen] if left else expected[start:]
+        a.splice(b, left=left)
+        assert list(a) == expected
+        assert list(reversed(a)) == expected[::-1]
+        assert [a[i] for i in range(len(a))] == expected
+        assert len(b) == 0 and list(b) == []
+
+        i = random.randint(-10, 10)
+        tail = a.split(i)
+        assert list(a) == expected[:i]
+        assert list(tail) == expected[i:]
+        assert tail.maxlen == maxlen
+        assert [a[i] for i in range(len(a))] == expected[:i]
+        assert list(reversed(tail)) == expected[i:][::-1]
+        b.extend([1, 2])
+        assert list(b) == [1, 2]
+
+    # both deques are invalidated
+    a, b = Deque("abc"), Deque("def")
+    view_a, view_b = a[:], b[:]
+    a.splice(b)
+    assert a == Deque("abcdef")
+    with pytest.raises(RuntimeError):
+        list(view_a)
+    with pytest.raises(RuntimeError):
+        list(view_b)
+    view_a = a[:]
+    assert a.split(2) == Deque("cdef")
+    with pytest.raises(RuntimeError):
+        list(view_a)
+
+    with pytest.raises(ValueError):
+        a.splice(a)
+    with pytest.raises(TypeError):
+        a.splice([1, 2])
+
+
 def test_index():
     from datastructures import Deque
 
@@ -383,6 +561,41 @@ def test_index_bug_24913():
         d.index("Hello world", 0, 4)
 
 
+def test_scan():
+    from datastructures import Deque
+
+    items = [1, "a", 2.0, None, b"b", 1, True, "a", 3 + 0j, 1]
+    for reverse in False, True:
+        d = Deque(reversed(items) if reverse else items)
+        if reverse:
+            d.reverse()
+        for x in set(items) | {"z"}:
+            assert d.count(x) == items.count(x)
+            assert (x in d) == (x in items)
+            for start in (-20, -3, 0, 2, 5):
+                for stop in (-2, 4, 9, 20):
+                    try:
+                        expected = items.index(x, start, stop)
+                    except ValueError:
+                        expected = None
+                    if expected is None:
+                        with pytest.raises(ValueError):
+                            d.index(x, start, stop)
+                    else:
+                        assert d.index(x, start, stop) == expected
+
+    # comparing a builtin with a user defined type still checks for mutations
+    d = Deque([1, 2, 3])
+    d.append(MutateCmp(d, False))
+    d.append(4)
+    with pytest.raises(RuntimeError):
+        d.index(4)
+    d = Deque([1, MutateCmp(None, True)])
+    d[1].deque = d
+    with pytest.raises(RuntimeError):
+        d.remove(5)
+
+
 def test_insert():
     from datastructures import Deque
 
@@ -539,6 +752,27 @@ def test_reverse():
         # Arity is zero
         d.reverse(1)
 
+    # a reversed deque keeps working through every method
+    d = Deque("abcde", maxlen=8)
+    d.reverse()
+    assert d == Deque("edcba")
+    d.append("z")
+    d.appendleft("y")
+    assert list(d) == list("yedcbaz")
+    d.rotate(2)
+    assert list(d) == list("azyedcb")
+    d.insert(1, "x")
+    assert list(d) == list("axzyedcb")
+    del d[2]
+    d.extend("pq")
+    d.extendleft("r")
+    assert list(d) == list("rxyedcbp")
+    assert list(reversed(d)) == list("pbcdeyxr")
+    assert d.pop() == "p" and d.popleft() == "r"
+    d.reverse()
+    assert list(d) == list("bcdeyx")
+    assert d.index("c") == 1 and d[-1] == "x"
+
 
 def test_rotate():
     from datastructures import Deque
@@ -599,6 +833,22 @@ def test_rotate():
     assert d == Deque()
 
 
+def test_rotate_large():
+    from collections import deque
+
+    from datastructures import Deque
+
+    for n in (1, 2, 7, 100):
+        d = Deque(range(n))
+        cmp_deque = deque(range(n))
+        for k in (1, -1, n // 2, -(n // 3), n, 3 * n + 1, 10**9, -(10**9)):
+            d.rotate(k)
+            cmp_deque.rotate(k)
+            assert list(d) == list(cmp_deque)
+            assert list(reversed(d)) == list(reversed(cmp_deque))
+            assert d[0] == cmp_deque[0] and d[-1] == cmp_deque[-1]
+
+
 def test_len():
     from datastructures import Deque
 
@@ -674,6 +924,205 @@ def test_remove():
             d.remove("c")
         assert d == Deque()
 
+    # the matching node is unlinked without walking the deque again
+    d = Deque(range(10))
+    d.reverse()
+    d.remove(3)
+    assert list(d) == [9, 8, 7, 6, 5, 4, 2, 1, 0]
+    assert [d[i] for i in range(len(d))] == list(d)
+
+
+def test_cursor():
+    import random
+
+    from datastructures import Deque
+
+    random.seed(0)
+
+    for reverse in False, True:
+        for _ in range(200):
+            items = list(range(random.randrange(1, 8)))
+            d = Deque(reversed(items) if reverse else items)
+            if reverse:
+                d.reverse()
+            i = random.randrange(len(items))
+            c = d.cursor(i - len(items) if random.random() < 0.5 else i)
+            for step in range(30):
+                assert c.index == i
+                assert c.value == items[i]
+                op = random.randrange(6)
+                if op == 0:
+                    c.insert_before(-step)
+                    items.insert(i, -step)
+                    i += 1
+                elif op == 1:
+                    c.insert_after(-step)
+                    items.insert(i + 1, -step)
+                elif op == 2:
+                    c.replace(step)
+                    items[i] = step
+                elif op == 3 and len(items) > 1:
+                    assert c.remove_current() == items.pop(i)
+                    if i == len(items):
+                        # we removed the last item, so we are past the end
+                        with pytest.raises(IndexError):
+                            c.value
+                        c = d.cursor(i - 1)
+                        i -= 1
+                elif op == 4 and i + 1 < len(items):
+                    assert c.move_next()
+                    i += 1
+                elif op == 5 and i > 0:
+                    assert c.move_prev()
+                    i -= 1
+                assert list(d) == items
+                assert list(reversed(d)) == items[::-1]
+                assert len(d) == len(items)
+                assert [d[j] for j in range(len(d))] == items
+            # the head and tail are still valid ends
+            d.append("end")
+            d.appendleft("start")
+            assert list(d) == ["start"] + items + ["end"]
+
+
+def test_cursor_errors():
+    from datastructures import Deque
+
+    d = Deque("abc")
+    c = d.cursor()
+    assert next(c) == "a" and c.value == "b" and c.index == 1
+    assert list(c) == ["b", "c"]
+    with pytest.raises(IndexError):
+        c.value
+    c = d.cursor(-1)
+    assert not c.move_next() and c.index == 3
+    with pytest.raises(IndexError):
+        c.move_next()
+    c = d.cursor(0)
+    assert not c.move_prev() and c.index == -1
+    with pytest.raises(IndexError):
+        Deque().cursor()
+
+    # the last item can be removed through the cursor
+    d = Deque([1])
+    c = d.cursor()
+    assert c.remove_current() == 1
+    assert len(d) == 0 and list(d) == [] and d.head is None and d.tail is None
+    d.append(2)
+    assert list(d) == [2]
+
+    d = Deque("ab", maxlen=2)
+    with pytest.raises(IndexError):
+        d.cursor().insert_after("c")
+
+
+def test_cursor_invalidation():
+    from datastructures import Deque
+
+    # edits through any other path invalidate the cursor
+    d = Deque("abc")
+    c = d.cursor(1)
+    other = d.cursor(0)
+    c.insert_after("x")
+    with pytest.raises(RuntimeError):
+        other.value
+    d.append("d")
+    for fn in (
+        lambda: c.value,
+        lambda: c.move_next(),
+        lambda: c.insert_before("y"),
+        lambda: c.remove_current(),
+        lambda: next(c),
+    ):
+        with pytest.raises(RuntimeError):
+            fn()
+
+
+def test_remove_all_retain():
+    import random
+
+    from datastructures import Deque
+
+    random.seed(0)
+
+    for _ in range(300):
+        items = [random.randrange(4) for _ in range(random.randrange(12))]
+        for reverse in False, True:
+            d = Deque(reversed(items) if reverse else items, maxlen=20)
+            if reverse:
+                d.reverse()
+            value = random.randrange(4)
+            assert d.remove_all(value) == items.count(value)
+            expected = [x for x in items if x != value]
+            assert list(d) == expected
+            assert list(reversed(d)) == expected[::-1]
+            assert len(d) == len(expected)
+            assert [d[i] for i in range(len(d))] == expected
+            # the head and tail are still valid ends
+            d.append(10)
+            d.appendleft(-10)
+            assert list(d) == [-10] + expected + [10]
+
+            d = Deque(items)
+            seen = []
+            assert d.retain(lambda x: seen.append(x) or x % 2) == len(
+                [x for x in items if not x % 2]
+            )
+            assert seen == items
+            assert list(d) == [x for x in items if x % 2]
+
+    # a single state bump invalidates views
+    d = Deque([1, 2, 1, 3, 1])
+    view = d[:]
+    assert d.remove_all(1) == 3
+    with pytest.raises(RuntimeError):
+        list(view)
+    view = d[:]
+    assert d.remove_all(5) == 0
+    assert list(view) == [2, 3]
+
+    # a predicate (or comparison) that mutates the deque is detected
+    d = Deque(range(5))
+    with pytest.raises(RuntimeError):
+        d.retain(lambda x: d.append(x))
+    d = Deque([1, 2])
+    d.append(MutateCmp(d, True))
+    with pytest.raises(RuntimeError):
+        d.remove_all(2)
+
+    # items removed before an exception stay removed
+    def keep(x):
+        if x == 3:
+            raise ValueError
+        return x % 2
+
+    d = Deque(range(6))
+    with pytest.raises(ValueError):
+        d.retain(keep)
+    assert list(d) == [1, 3, 4, 5]
+    assert len(d) == 4
+
+    # a predicate that indexes the deque sees the items that are left so far
+    d = Deque(range(10))
+    d[5]
+    left = list(range(10))
+
+    def keep_odd(x):
+        assert d[len(d) // 2] == left[len(left) // 2]
+        if not x % 2:
+            left.remove(x)
+        return x % 2
+
+    for reverse in False, True:
+        if reverse:
+            d = Deque(range(10))
+            d.reverse()
+            d[3]
+            left = list(range(9, -1, -1))
+        assert d.retain(keep_odd) == 5
+        assert list(d) == left
+        assert [d[i] for i in range(len(d))] == left
+
 
 def test_repr():
     from datastructures import Deque
@@ -947,6 +1396,30 @@ def test_gc_doesnt_blowup():
         gc.collect()
 
 
+def test_node_memory():
+    import sys
+    import tracemalloc
+
+    from datastructures import Deque
+
+    node = Deque._Node(None)
+    assert not hasattr(node, "__dict__")
+    assert not hasattr(node, "__del__")
+
+    n = 10_000
+    tracemalloc.start()
+    d = Deque()
+    start, _ = tracemalloc.get_traced_memory()
+    for _ in range(n):
+        d.append(None)
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    bytes_per_item = (end - start) / n
+    # each item should only cost a single slotted node (96 bytes per item on
+    # CPython 3.11 before `_Node` used __slots__)
+    assert bytes_per_item <= sys.getsizeof(node) + 1, bytes_per_item
+
+
 def test_container_iterator():
     import gc
     import weakref
@@ -104,3 +104,308 @@ def test_non_existent_key_full_hash_map():
         _ = fhm[2]
 
     assert "could not find key" in str(e)
+
+
+def test_colliding_keys():
+    from datastructures import FixedHashMap
+
+    fhm = FixedHashMap(10)
+    fhm[0] = 1
+    fhm[10] = 2
+    fhm[20] = 3
+    del fhm[10]
+    assert fhm[0] == 1
+    assert fhm[20] == 3
+    with pytest.raises(KeyError):
+        _ = fhm[10]
+
+
+@pytest.mark.parametrize("max_tombstones", [0.25, 1.0])
+def test_churn(max_tombstones):
+    import random
+
+    from datastructures import FixedHashMap
+
+    random.seed(0)
+
+    fhm = FixedHashMap(64, max_tombstones=max_tombstones)
+    cmp_dict = {}
+    for i in range(2000):
+        key = random.randrange(80)
+        if key in cmp_dict and random.random() < 0.5:
+            del fhm[key]
+            del cmp_dict[key]
+        elif len(cmp_dict) < fhm.capacity:
+            fhm[key] = i
+            cmp_dict[key] = i
+        else:
+            with pytest.raises(MemoryError):
+                fhm[key] = i
+        assert fhm.size == len(cmp_dict)
+        assert fhm.tombstones <= max_tombstones * fhm.capacity
+        for key in range(80) if i % 20 == 0 else [key]:
+            if key in cmp_dict:
+                assert fhm[key] == cmp_dict[key]
+            else:
+                with pytest.raises(KeyError):
+                    _ = fhm[key]
+    assert sorted(fhm.keys()) == sorted(cmp_dict)
+
+
+def test_tombstones():
+    from datastructures import FixedHashMap
+
+    fhm = FixedHashMap(10, max_tombstones=0.2)
+    for i in (0, 10, 20):
+        fhm[i] = i
+    del fhm[0]
+    assert fhm.tombstones == 1
+    # the insert reuses the tombstone in slot 0
+    fhm[30] = 30
+    assert fhm.tombstones == 0 and fhm._keys[fhm.data[0]] == 30
+    del fhm[10]
+    del fhm[20]
+    assert fhm.tombstones == 2
+    # a third tombstone exceeds 20% of the slots and compacts the table
+    del fhm[30]
+    assert fhm.tombstones == 0 and fhm.size == 0
+    assert list(fhm.data) == [-1] * 10 and fhm._keys == []
+
+
+def test_robin_hood():
+    import random
+
+    from datastructures import FixedHashMap
+
+    random.seed(0)
+
+    fhm = FixedHashMap(64, robin_hood=True)
+    cmp_dict = {}
+    for i in range(2000):
+        key = random.randrange(80)
+        if key in cmp_dict and random.random() < 0.5:
+            del fhm[key]
+            del cmp_dict[key]
+        elif len(cmp_dict) < fhm.capacity:
+            fhm[key] = i
+            cmp_dict[key] = i
+        else:
+            with pytest.raises(MemoryError):
+                fhm[key] = i
+        assert fhm.size == len(cmp_dict)
+        for key in range(80) if i % 20 == 0 else [key]:
+            if key in cmp_dict:
+                assert fhm[key] == cmp_dict[key]
+            else:
+                with pytest.raises(KeyError):
+                    _ = fhm[key]
+        # going along a cluster, the distance from the home slot grows by at
+        # most one per slot
+        distances = [
+            -1 if entry < 0 else (slot - fhm._hashes[entry]) % 64
+            for slot, entry in enumerate(fhm.data)
+        ]
+        for slot, distance in enumerate(distances):
+            assert distance <= distances[slot - 1] + 1
+    # deletion never leaves tombstones
+    assert fhm.tombstones == 0
+    assert sorted(fhm.keys()) == sorted(cmp_dict)
+
+    fhm = FixedHashMap(10, robin_hood=True)
+    for key in (0, 10, 1, 20):
+        fhm[key] = key
+    # 20 displaced 1, which is closer to its home slot
+    assert [fhm._keys[entry] for entry in fhm.data[:4]] == [0, 10, 20, 1]
+    del fhm[0]
+    assert [fhm._keys[entry] for entry in fhm.data[:3]] == [10, 20, 1]
+    assert fhm.data[3] == -1
+    with pytest.raises(KeyError):
+        del fhm[30]
+    with pytest.raises(ValueError):
+        fhm[[1]] = 1
+
+
+def test_compact_layout():
+    from datastructures import FixedHashMap
+
+    assert FixedHashMap(100).data.itemsize == 1
+    assert FixedHashMap(1000).data.itemsize == 2
+    assert FixedHashMap(100_000).data.itemsize == 4
+
+    fhm = FixedHashMap(100)
+    for key in "hello world":
+        fhm[key] = ord(key)
+    del fhm["e"]
+    fhm["e"] = 0
+    # keys are kept in insertion order
+    assert list(fhm.keys()) == list("hlo wrde")
+    assert str(fhm).startswith("{'h': 104, 'l': 108, 'o': 111")
+    # once there are more holes than keys, the dense lists are squeezed
+    for key in "hlo wr":
+        del fhm[key]
+        assert len(fhm._keys) - fhm.size <= fhm.size
+    assert list(fhm.keys()) == ["d", "e"] and len(fhm._keys) <= 4
+    assert fhm["d"] == ord("d") and fhm["e"] == 0
+    # None is a valid key
+    fhm[None] = 1
+    assert fhm[None] == 1
+    assert list(fhm.keys()) == ["d", "e", None]
+    fhm.clear()
+    assert fhm.size == 0 and list(fhm.keys()) == [] and str(fhm) == "{}"
+    fhm["a"] = 1
+    assert fhm["a"] == 1
+
+
+class CountingKey:
+    """A key with a chosen hash that counts how often it is compared."""
+
+    eq_calls = 0
+
+    def __init__(self, name, key_hash):
+        self.name = name
+        self.key_hash = key_hash
+
+    def __hash__(self):
+        return self.key_hash
+
+    def __eq__(self, other):
+        CountingKey.eq_calls += 1
+        return isinstance(other, CountingKey) and self.name == other.name
+
+
+@pytest.mark.parametrize("robin_hood", [False, True])
+def test_stored_hashes(robin_hood):
+    from datastructures import FixedHashMap, HashMap
+
+    # every key has the same home slot but a different hash
+    keys = [CountingKey(i, i * 16) for i in range(8)]
+    fhm = FixedHashMap(16, robin_hood=robin_hood)
+    CountingKey.eq_calls = 0
+    for i, key in enumerate(keys):
+        fhm[key] = i
+    # equal keys that are different objects are still found
+    assert [fhm[CountingKey(i, i * 16)] for i in range(8)] == list(range(8))
+    assert CountingKey.eq_calls == 8
+    # but identical keys and keys whose hashes differ are never compared
+    assert [fhm[key] for key in keys] == list(range(8))
+    with pytest.raises(KeyError):
+        _ = fhm[CountingKey(8, 8 * 16)]
+    assert CountingKey.eq_calls == 8
+
+    # equal hashes fall back to __eq__
+    fhm[CountingKey("a", 0)] = "a"
+    assert fhm[CountingKey("a", 0)] == "a"
+    assert fhm[keys[0]] == 0
+
+    # resizing reuses the stored hashes
+    hm = HashMap()
+    for i, key in enumerate(keys):
+        hm[key] = i
+    CountingKey.eq_calls = 0
+    for key in keys:
+        key.key_hash = None  # hash() would now raise a TypeError
+    for i in range(8, 16):
+        hm[i] = i
+    assert hm.capacity == 32
+    assert CountingKey.eq_calls == 0
+
+
+@pytest.mark.parametrize("robin_hood", [False, True])
+def test_bulk(robin_hood):
+    import random
+
+    from datastructures import FixedHashMap
+
+    random.seed(0)
+
+    pairs = [(random.randrange(500), i) for i in range(1000)]
+    fhm = FixedHashMap.from_items(pairs, load_factor=0.5, robin_hood=robin_hood)
+    cmp_dict = dict(pairs)
+    # the capacity is sized for every pair, later duplicates win
+    assert fhm.capacity == 2000 and fhm.robin_hood == robin_hood
+    assert list(fhm.keys()) == list(cmp_dict)
+    assert fhm.get_many(range(600), -1) == [cmp_dict.get(i, -1) for i in range(600)]
+    assert fhm.get_many([]) == []
+
+    # set_many reuses tombstones and overwrites existing keys
+    for key in range(0, 500, 3):
+        if key in cmp_dict:
+            del fhm[key]
+            del cmp_dict[key]
+    updates = [(key, -key) for key in range(0, 700, 2)]
+    fhm.set_many(iter(updates))
+    cmp_dict.update(updates)
+    assert list(fhm.keys()) == list(cmp_dict)
+    assert fhm.get_many(range(700)) == [cmp_dict.get(i) for i in range(700)]
+
+    # update takes mappings, iterables of pairs and keyword arguments
+    other = FixedHashMap(10)
+    other["x"] = 1
+    fhm.update(other)
+    fhm.update({"y": 2}, z=3)
+    fhm.update([("x", 4)])
+    assert fhm.get_many("xyz") == [4, 2, 3]
+
+    assert list(FixedHashMap.from_items({})) == []
+    assert FixedHashMap.from_items(iter(["ab", "cd"])).get_many("ac") == ["b", "d"]
+    with pytest.raises(ValueError):
+        FixedHashMap.from_items(pairs, load_factor=0)
+    with pytest.raises(ValueError):
+        fhm.get_many([[1]])
+    with pytest.raises(ValueError):
+        fhm.set_many([("ok", 1), ([1], 1)])
+    # the pairs before the bad one were set
+    assert fhm["ok"] == 1
+
+    # without an empty slot left in the index, the probes are bounded
+    fhm = FixedHashMap(4, max_tombstones=1, robin_hood=robin_hood)
+    fhm.set_many((i, i) for i in range(4))
+    del fhm[0]
+    assert fhm.get_many([0, 3]) == [None, 3]
+    fhm.set_many([(3, -3), (4, 4)])
+    assert list(fhm.keys()) == [1, 2, 3, 4]
+    assert fhm.get_many(range(5)) == [None, 1, 2, -3, 4]
+
+    fhm = FixedHashMap(3, robin_hood=robin_hood)
+    with pytest.raises(MemoryError):
+        fhm.set_many((i, i) for i in range(4))
+    assert fhm.size == 3 and fhm.get_many(range(4)) == [0, 1, 2, None]
+
+
+@pytest.mark.parametrize("robin_hood", [False, True])
+def test_iteration(robin_hood):
+    from datastructures import FixedHashMap
+
+    fhm = FixedHashMap.from_items(zip("abcd", range(4)), robin_hood=robin_hood)
+    del fhm["b"]
+    assert len(fhm) == 3 and "a" in fhm and "b" not in fhm and None not in fhm
+    assert list(fhm) == list(fhm.keys()) == ["a", "c", "d"]
+    assert list(fhm.values()) == [0, 2, 3]
+    assert list(fhm.items()) == [("a", 0), ("c", 2), ("d", 3)]
+    assert str(fhm) == "{'a': 0, 'c': 2, 'd': 3}"
+    with pytest.raises(ValueError):
+        _ = [1] in fhm
+
+    # the iterators are lazy and only walk the dense lists
+    items = fhm.items()
+    assert next(items) == ("a", 0)
+    # replacing a value is not a mutation
+    fhm["c"] = -2
+    assert list(items) == [("c", -2), ("d", 3)]
+
+    mutations = [
+        lambda: fhm.set("e", 4),
+        lambda: fhm.delete("a"),
+        lambda: fhm.set_many([("f", 5)]),
+        fhm.compact,
+        fhm.clear,
+    ]
+    for mutate in mutations:
+        for iterate in (iter, FixedHashMap.values, FixedHashMap.items):
+            fhm.clear()
+            fhm.update(a=0, c=2, d=3)
+            iterator = iterate(fhm)
+            next(iterator)
+            mutate()
+            with pytest.raises(RuntimeError, match="FixedHashMap mutated"):
+                next(iterator)
@@ -0,0 +1,208 @@
+"""Tests for the resizing HashMap data structure."""
+
+import pytest
+
+
+@pytest.mark.parametrize("incremental", [False, True])
+def test_dict_behavior(incremental):
+    import random
+
+    from datastructures import HashMap
+
+    random.seed(0)
+
+    hm = HashMap(incremental=incremental)
+    cmp_dict = {}
+    capacities = set()
+    for i in range(20000):
+        key = random.randrange(2000)
+        op = random.random()
+        if op < 0.5:
+            hm[key] = i
+            cmp_dict[key] = i
+        elif op < 0.8:
+            if key in cmp_dict:
+                del hm[key]
+                del cmp_dict[key]
+            else:
+                with pytest.raises(KeyError):
+                    del hm[key]
+        elif key in cmp_dict:
+            assert hm[key] == cmp_dict[key]
+        else:
+            with pytest.raises(KeyError):
+                _ = hm[key]
+        assert len(hm) == len(cmp_dict)
+        assert hm.load() <= hm.max_load
+        capacities.add(hm.capacity)
+    # keys are kept in insertion order, like a dict
+    assert list(hm.keys()) == list(cmp_dict)
+    assert 2048 <= max(capacities) <= 4096
+    for key in cmp_dict:
+        del hm[key]
+    assert hm.capacity == 8
+
+
+def test_resize():
+    from datastructures import HashMap
+
+    hm = HashMap(capacity=4, max_load=0.5)
+    assert repr(hm) == "HashMap({})"
+    for i in range(3):
+        hm[i] = i
+    assert hm.capacity == 8
+    # collides with 0 and has to probe past it
+    hm[8] = 8
+    assert hm.capacity == 8 and len(hm) == 4
+    for i in range(3):
+        del hm[i]
+    # the tombstones are probed past as well
+    assert hm[8] == 8 and hm.capacity == 8
+    assert repr(hm) == "HashMap({8: 8})"
+    del hm[8]
+    # shrinking stops at the initial capacity
+    assert hm.capacity == 4 and len(hm) == 0
+
+    # churn on a few keys rehashes at the same capacity to drop tombstones
+    hm = HashMap(capacity=8)
+    for i in range(100):
+        hm[i] = i
+        del hm[i]
+    assert hm.capacity == 8 and len(hm) == 0
+
+    hm = HashMap(incremental=True)
+    for i in range(7):
+        hm[i] = i
+    assert hm.capacity == 16
+    # the old index is migrated a few entries per insert or delete, lookups
+    # and updates don't move entries
+    assert hm._old_data is not None
+    hm[0] = -1
+    for i in range(1, 4):
+        assert hm[i] == i
+    assert hm[0] == -1 and hm._old_data is not None
+    del hm[1]
+    hm[7] = 7
+    assert hm._old_data is None
+    # the walk squeezes the holes out of the dense lists as it goes
+    assert hm._keys == [0, 2, 3, 4, 5, 6, 7]
+    assert list(hm.items()) == [(0, -1)] + [(i, i) for i in range(2, 8)]
+
+    # rebuilding the index finishes a running migration first
+    hm = HashMap(incremental=True)
+    for i in range(7):
+        hm[i] = i
+    del hm[6]
+    assert hm._old_data is not None
+    hm.compact()
+    assert hm._old_data is None
+    assert [hm[i] for i in range(6)] == list(range(6))
+
+    with pytest.raises(ValueError):
+        HashMap(capacity=0)
+    with pytest.raises(ValueError):
+        HashMap(max_load=1)
+
+
+@pytest.mark.parametrize("incremental", [False, True])
+def test_bulk(incremental):
+    from datastructures import HashMap
+
+    hm = HashMap(incremental=incremental)
+    for i in range(7):
+        hm[i] = i
+    # a running migration is finished before the bulk operations
+    assert (hm._old_data is not None) == incremental
+    assert hm.get_many(range(8)) == list(range(7)) + [None]
+    assert hm._old_data is None
+
+    for i in range(7):
+        hm[i] = i
+    hm.set_many((i, -i) for i in range(1000))
+    # the capacity is doubled once for all of the pairs
+    assert hm.capacity == 2048 and len(hm) == 1000
+    assert hm.load() <= hm.max_load
+    assert hm.get_many([0, 999, 1000]) == [0, -999, None]
+
+    hm = HashMap.from_items((i, i) for i in range(100))
+    assert hm.capacity == 134 and hm.get_many(range(100)) == list(range(100))
+    hm.update({i: 0 for i in range(100, 200)})
+    assert len(hm) == 200 and hm.load() <= hm.max_load
+
+
+def test_iteration():
+    from datastructures import HashMap
+
+    hm = HashMap(incremental=True)
+    for i in range(7):
+        hm[i] = i
+    # the lookups also check the old index while it is being migrated
+    assert hm._old_data is not None
+    assert all(i in hm for i in range(7)) and 7 not in hm
+    assert list(hm.items()) == [(i, i) for i in range(7)] and len(hm) == 7
+    keys = iter(hm)
+    next(keys)
+    # resizing only rebuilds the index, but inserting is still a mutation
+    hm.set_many((i, i) for i in range(7, 100))
+    with pytest.raises(RuntimeError, match="HashMap mutated"):
+        next(keys)
+    assert list(hm.values()) == list(range(100))
+
+
+def test_incremental_churn():
+    import gc
+    import random
+    import time
+
+    from datastructures import HashMap
+
+    class CountingHashMap(HashMap):
+        rebuilds = 0
+
+        def compact(self):
+            CountingHashMap.rebuilds += 1
+            super().compact()
+
+        def _squeeze(self):
+            CountingHashMap.rebuilds += 1
+            super()._squeeze()
+
+        def _finish_migration(self):
+            if self._migrated is not None:
+                CountingHashMap.rebuilds += 1
+            super()._finish_migration()
+
+    random.seed(0)
+    n = 10_000
+    hm = CountingHashMap(incremental=True)
+    for i in range(n):
+        hm[i] = i
+    live, new_key = list(range(n)), n
+    worst = 0
+    gc.disable()
+    try:
+        # delete a random key and insert a new one, then delete every key
+        for _ in range(3 * n):
+            start = time.perf_counter()
+            i = random.randrange(n)
+            del hm[live[i]]
+            hm[new_key] = new_key
+            worst = max(worst, time.perf_counter() - start)
+            live[i] = new_key
+            new_key += 1
+        assert len(hm._keys) < hm.capacity
+        for key in live:
+            start = time.perf_counter()
+            del hm[key]
+            worst = max(worst, time.perf_counter() - start)
+        rebuilds = CountingHashMap.rebuilds
+        # the bulk insert does rebuild the map in one go
+        start = time.perf_counter()
+        hm.set_many((key, key) for key in live)
+        rebuild = time.perf_counter() - start
+    finally:
+        gc.enable()
+    # nothing ever compacts the map or finishes a migration in one go, so the
+    # slowest operation is far faster than rebuilding the map
+    assert rebuilds == 0 and len(hm) == n
+    assert worst < rebuild / 5
@@ -0,0 +1,110 @@
+"""Tests for the structurally shared PersistentDeque."""
+
+import pytest
+
+
+def test_versions():
+    import random
+    from collections import deque
+
+    from datastructures import PersistentDeque
+
+    random.seed(0)
+
+    for maxlen in (None, 0, 1, 5):
+        # every version is kept alongside a `collections.deque` copy of what it
+        # should contain, and new versions are derived from random old ones
+        versions = [(PersistentDeque(maxlen=maxlen), deque(maxlen=maxlen))]
+        for i in range(1500):
+            p, d = random.choice(versions[-20:])
+            d = d.copy()
+            op = random.randrange(5)
+            if op == 0:
+                p = p.append(i)
+                d.append(i)
+            elif op == 1:
+                p = p.appendleft(i)
+                d.appendleft(i)
+            elif op == 2:
+                p = p.extend(range(i, i + 3))
+                d.extend(range(i, i + 3))
+            elif d:
+                if op == 3:
+                    assert p[-1] == d[-1]
+                    p = p.pop()
+                    d.pop()
+                else:
+                    assert p[0] == d[0]
+                    p = p.popleft()
+                    d.popleft()
+            else:
+                with pytest.raises(IndexError):
+                    p.pop()
+                with pytest.raises(IndexError):
+                    p.popleft()
+            versions.append((p, d))
+        for p, d in versions:
+            assert len(p) == len(d)
+            assert list(p) == list(d)
+            assert list(reversed(p)) == list(reversed(d))
+            assert [p[i] for i in range(-len(d), len(d))] == list(d) * 2
+            assert p.maxlen == maxlen
+
+
+def test_read_api():
+    from datastructures import Deque, PersistentDeque
+
+    p = PersistentDeque("abracadabra")
+    assert p.count("a") == 5
+    assert p.index("c") == 4
+    assert p.index("a", 1) == 3
+    assert p.index("a", -3) == 10
+    with pytest.raises(ValueError):
+        p.index("c", 5)
+    with pytest.raises(ValueError):
+        p.index("a", 1, 3)
+    assert "d" in p and "z" not in p
+    assert list(p[2:9:3]) == list("abracadabra")[2:9:3]
+    with pytest.raises(IndexError):
+        p[11]
+    with pytest.raises(TypeError):
+        p[1.0]
+
+    assert p == PersistentDeque("abracadabra")
+    assert p != Deque("abracadabra")
+    assert PersistentDeque("abc") < PersistentDeque("abd") < PersistentDeque("abdd")
+    with pytest.raises(TypeError):
+        assert p < list(p)
+    assert hash(p) == hash(PersistentDeque(p))
+    assert p.copy() is p
+    assert p.extendleft("xy") == PersistentDeque("yxabracadabra")
+    assert (
+        repr(PersistentDeque([1, 2], maxlen=3)) == "PersistentDeque([1, 2], maxlen=3)"
+    )
+    assert repr(PersistentDeque()) == "PersistentDeque([])"
+    assert PersistentDeque(range(10), maxlen=3) == PersistentDeque([7, 8, 9])
+    with pytest.raises(ValueError):
+        PersistentDeque(maxlen=-1)
+
+
+def test_freeze_thaw():
+    import pickle
+
+    from datastructures import Deque, PersistentDeque
+
+    for n in range(8):
+        for reverse in False, True:
+            d = Deque(range(n), maxlen=n + 2)
+            if reverse:
+                d.reverse()
+            p = d.freeze()
+            assert isinstance(p, PersistentDeque)
+            assert list(p) == list(d)
+            assert p.maxlen == n + 2
+            # the frozen copy is independent of the deque
+            d.append(-1)
+            assert list(p) != list(d)
+            thawed = p.thaw()
+            assert isinstance(thawed, Deque)
+            assert list(thawed) == list(p) and thawed.maxlen == p.maxlen
+            assert pickle.loads(pickle.dumps(p)) == p
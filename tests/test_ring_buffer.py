@@ -0,0 +1,126 @@
+"""Tests for the typed RingBuffer."""
+
+import pytest
+
+
+def test_deque_behavior():
+    import random
+    from collections import deque
+
+    from datastructures import RingBuffer
+
+    random.seed(0)
+
+    for maxlen in (0, 1, 2, 7):
+        r = RingBuffer(range(10), maxlen=maxlen, typecode="q")
+        cmp_deque = deque(range(10), maxlen=maxlen)
+        assert list(r) == list(cmp_deque)
+        for i in range(500):
+            op = random.randrange(4)
+            if op == 0:
+                r.append(i)
+                cmp_deque.append(i)
+            elif op == 1:
+                r.appendleft(i)
+                cmp_deque.appendleft(i)
+            elif cmp_deque:
+                if op == 2:
+                    assert r.pop() == cmp_deque.pop()
+                else:
+                    assert r.popleft() == cmp_deque.popleft()
+            else:
+                with pytest.raises(IndexError):
+                    r.pop()
+                with pytest.raises(IndexError):
+                    r.popleft()
+            assert len(r) == len(cmp_deque)
+            assert list(r) == list(cmp_deque)
+            for j in range(-len(cmp_deque), len(cmp_deque)):
+                assert r[j] == cmp_deque[j]
+            segments = r.segments()
+            assert [x for seg in segments for x in seg] == list(cmp_deque)
+            assert 1 <= len(segments) <= 2 or not cmp_deque
+
+    r = RingBuffer([1.5, 2.5], maxlen=3)
+    assert repr(r) == "RingBuffer([1.5, 2.5], maxlen=3, typecode='d')"
+    assert r.maxlen == 3 and r.typecode == "d"
+    r[-1] = 4.0
+    assert list(r) == [1.5, 4.0]
+    with pytest.raises(IndexError):
+        r[2]
+    with pytest.raises(TypeError):
+        r[1.0]
+    r.clear()
+    assert list(r) == []
+
+    with pytest.raises(ValueError):
+        RingBuffer()
+    with pytest.raises(ValueError):
+        RingBuffer(maxlen=-1)
+
+
+def test_segments():
+    from datastructures import RingBuffer
+
+    r = RingBuffer(range(6), maxlen=6, typecode="i")
+    (segment,) = r.segments()
+    assert isinstance(segment, memoryview)
+    assert segment.tolist() == list(range(6))
+
+    r.extend([6, 7])
+    first, second = r.segments()
+    assert first.tolist() == [2, 3, 4, 5]
+    assert second.tolist() == [6, 7]
+    # the views share memory with the buffer
+    r[0] = 20
+    assert first[0] == 20
+
+    it = iter(r)
+    next(it)
+    r.append(8)
+    with pytest.raises(RuntimeError):
+        next(it)
+
+
+def _check_stats(use_numpy):
+    import random
+    from collections import deque
+
+    from datastructures import RingBuffer
+
+    random.seed(1)
+    r = RingBuffer(maxlen=50, use_numpy=use_numpy)
+    cmp_deque = deque(maxlen=50)
+    for method in ("mean", "min", "max"):
+        with pytest.raises(ValueError):
+            getattr(r, method)()
+    assert r.sum() == 0
+    for _ in range(300):
+        val = random.uniform(-100, 100)
+        r.append(val)
+        cmp_deque.append(val)
+        assert r.sum() == pytest.approx(sum(cmp_deque))
+        assert r.mean() == pytest.approx(sum(cmp_deque) / len(cmp_deque))
+        assert r.min() == min(cmp_deque)
+        assert r.max() == max(cmp_deque)
+    assert type(r.popleft()) is float
+
+
+def test_stats():
+    _check_stats(use_numpy=False)
+
+
+def test_stats_numpy():
+    pytest.importorskip("numpy")
+    _check_stats(use_numpy=True)
+
+
+def test_numpy_missing(monkeypatch):
+    import sys
+
+    from datastructures import RingBuffer
+
+    # a None entry in sys.modules makes the import fail
+    monkeypatch.setitem(sys.modules, "numpy", None)
+    with pytest.raises(ValueError):
+        RingBuffer(maxlen=3, use_numpy=True)
@@ -0,0 +1,210 @@
+"""Tests for the shared memory SharedDeque."""
+
+import pytest
+
+# the process targets have to be importable so that they also work with the
+# spawn start method
+
+
+def _produce(d, start, n):
+    for i in range(start, start + n):
+        d.append((i, i * 0.5))
+
+
+def _consume(d, n, results):
+    for _ in range(n):
+        results.put(d.popleft(timeout=10))
+
+
+def test_basics():
+    from datastructures import SharedDeque
+
+    d = SharedDeque(maxlen=3, record_size=4)
+    try:
+        assert d.maxlen == 3 and len(d) == 0
+        for record in (b"abcd", b"efgh", b"ijkl"):
+            d.append(record)
+        assert len(d) == 3
+        with pytest.raises(IndexError):
+            d.append(b"mnop", block=False)
+        with pytest.raises(IndexError):
+            d.append(b"mnop", timeout=0.01)
+        with pytest.raises(ValueError):
+            d.append(b"abc")
+        assert d.popleft() == b"abcd"
+        # the slots wrap around
+        d.append(b"mnop")
+        assert [d.popleft() for _ in range(3)] == [b"efgh", b"ijkl", b"mnop"]
+        with pytest.raises(IndexError):
+            d.popleft(block=False)
+        with pytest.raises(IndexError):
+            d.popleft(timeout=0.01)
+        assert repr(d) == (
+            f"SharedDeque(name={d.name!r}, maxlen=3, record_size=4, len=0)"
+        )
+
+        # a single producer / consumer deque can be attached by name
+        d.append(b"qrst")
+        other = SharedDeque(name=d.name, record_size=4)
+        assert other.maxlen == 3
+        assert other.popleft() == b"qrst"
+        other.append(b"uvwx")
+        other.close()
+        assert d.popleft() == b"uvwx"
+        with pytest.raises(ValueError):
+            SharedDeque(name=d.name, record_size=8)
+        with pytest.raises(ValueError):
+            SharedDeque(name=d.name, record_size=4, maxlen=5)
+        with pytest.raises(ValueError):
+            SharedDeque(name=d.name, record_size=4, multi_producer=True)
+    finally:
+        d.close()
+        d.unlink()
+
+
+def test_struct_records():
+    from datastructures import SharedDeque
+
+    d = SharedDeque(maxlen=4, struct_format="qd")
+    single = SharedDeque(maxlen=4, struct_format="d")
+    try:
+        d.append((1, 2.5))
+        assert d.popleft() == (1, 2.5)
+        single.append(1.5)
+        assert single.popleft() == 1.5
+    finally:
+        for shared in d, single:
+            shared.close()
+            shared.unlink()
+
+    with pytest.raises(ValueError):
+        SharedDeque(maxlen=4)
+    with pytest.raises(ValueError):
+        SharedDeque(maxlen=4, record_size=8, struct_format="q")
+    with pytest.raises(ValueError):
+        SharedDeque(maxlen=0, record_size=8)
+    with pytest.raises(ValueError):
+        SharedDeque(maxlen=4, record_size=0)
+
+
+def test_attach_from_other_process():
+    import subprocess
+    import sys
+
+    from datastructures import SharedDeque
+
+    d = SharedDeque(maxlen=3, record_size=4)
+    try:
+        d.append(b"abcd")
+        # an unrelated process attaches by name, uses the deque and exits
+        script = (
+            "from datastructures import SharedDeque\n"
+            f"d = SharedDeque(name={d.name!r}, record_size=4)\n"
+            "assert d.popleft() == b'abcd'\n"
+            "d.append(b'efgh')\n"
+            "d.close()\n"
+        )
+        child = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True
+        )
+        assert child.returncode == 0, child.stderr
+        assert "leaked" not in child.stderr
+        # the block outlives the other process
+        assert d.popleft() == b"efgh"
+        other = SharedDeque(name=d.name, record_size=4)
+        other.close()
+    finally:
+        d.close()
+        d.unlink()
+
+
+_SPAWN_SCRIPT = """
+import multiprocessing
+
+from datastructures import SharedDeque
+
+
+def attach(name):
+    d = SharedDeque(name=name, record_size=4)
+    d.append(d.popleft())
+    d.close()
+
+
+if __name__ == "__main__":
+    d = SharedDeque(maxlen=3, record_size=4)
+    d.append(b"abcd")
+    child = multiprocessing.get_context("spawn").Process(target=attach, args=(d.name,))
+    child.start()
+    child.join()
+    assert child.exitcode == 0
+    assert d.popleft() == b"abcd"
+    d.close()
+    d.unlink()
+"""
+
+
+def test_attach_from_spawned_process(tmp_path):
+    import os
+    import subprocess
+    import sys
+
+    import datastructures
+
+    # a spawned child shares the resource tracker of the creator, which prints
+    # an error if the child dropped the creator's registration
+    script = tmp_path / "spawn_attach.py"
+    script.write_text(_SPAWN_SCRIPT)
+    root = os.path.dirname(os.path.dirname(datastructures.__file__))
+    env = dict(os.environ, PYTHONPATH=root)
+    result = subprocess.run(
+        [sys.executable, str(script)], capture_output=True, text=True, env=env
+    )
+    assert result.returncode == 0, result.stderr
+    assert "KeyError" not in result.stderr
+    assert "leaked" not in result.stderr
+
+
+@pytest.mark.parametrize("n_producers", [1, 3])
+def test_processes(n_producers):
+    import multiprocessing
+
+    from datastructures import SharedDeque
+
+    n = 2000
+    d = SharedDeque(maxlen=16, struct_format="qd", multi_producer=n_producers > 1)
+    try:
+        producers = [
+            multiprocessing.Process(target=_produce, args=(d, i * n, n))
+            for i in range(n_producers)
+        ]
+        for producer in producers:
+            producer.start()
+        received = [d.popleft(timeout=10) for _ in range(n_producers * n)]
+        for producer in producers:
+            producer.join()
+            assert producer.exitcode == 0
+        assert sorted(received) == [(i, i * 0.5) for i in range(n_producers * n)]
+        # the records of each producer arrive in order
+        for i in range(n_producers):
+            mine = [r for r, _ in received if i * n <= r < (i + 1) * n]
+            assert mine == list(range(i * n, (i + 1) * n))
+
+        # several consumers
+        d_multi = SharedDeque(maxlen=8, struct_format="qd", multi_consumer=True)
+        results = multiprocessing.Queue()
+        consumers = [
+            multiprocessing.Process(target=_consume, args=(d_multi, n, results))
+            for _ in range(2)
+        ]
+        for consumer in consumers:
+            consumer.start()
+        _produce(d_multi, 0, 2 * n)
+        received = sorted(results.get(timeout=10) for _ in range(2 * n))
+        for consumer in consumers:
+            consumer.join()
+        assert received == [(i, i * 0.5) for i in range(2 * n)]
+        d_multi.close()
+        d_multi.unlink()
+    finally:
+        d.close()
+        d.unlink()
@@ -0,0 +1,93 @@
+"""Tests for the monotonic deque SlidingWindowAggregator."""
+
+import pytest
+
+
+def test_count_window():
+    import random
+
+    from datastructures import SlidingWindowAggregator
+
+    random.seed(0)
+
+    for size in (1, 2, 5, 50):
+        agg = SlidingWindowAggregator(size=size)
+        values = []
+        for _ in range(500):
+            val = random.randint(-20, 20)
+            agg.push(val)
+            values.append(val)
+            assert agg.min() == min(values[-size:])
+            assert agg.max() == max(values[-size:])
+
+        # a batch gives the same result as pushing one value at a time, both
+        # for sequences and for plain iterators
+        for batch in ([random.random() for _ in range(3 * size)], range(size // 2)):
+            agg.extend(batch)
+            agg.extend(iter(batch))
+            values += list(batch) * 2
+            assert agg.min() == min(values[-size:])
+            assert agg.max() == max(values[-size:])
+        # only the candidates are kept
+        assert len(agg._mins) <= size and len(agg._maxs) <= size
+
+
+def test_time_window():
+    import random
+
+    from datastructures import SlidingWindowAggregator
+
+    random.seed(1)
+
+    now = [0.0]
+    agg = SlidingWindowAggregator(duration=10, clock=lambda: now[0])
+    samples = []
+    for _ in range(500):
+        now[0] += random.choice([0, 0.5, 3])
+        val = random.random()
+        if random.random() < 0.5:
+            agg.push(val)
+        else:
+            agg.extend([val], timestamps=[now[0]])
+        samples.append((now[0], val))
+        window = [v for t, v in samples if t > now[0] - 10]
+        assert agg.min() == min(window)
+        assert agg.max() == max(window)
+
+    agg.extend([5.0, -5.0], timestamps=[now[0] + 1, now[0] + 2])
+    assert agg.min() == -5.0
+    now[0] += 11.5
+    agg.expire()
+    assert agg.min() == agg.max() == -5.0
+    agg.expire(now[0] + 20)
+    with pytest.raises(ValueError):
+        agg.min()
+    with pytest.raises(ValueError):
+        agg.max()
+
+    with pytest.raises(ValueError):
+        agg.push(1, timestamp=0)
+
+
+def test_errors():
+    from datastructures import SlidingWindowAggregator
+
+    with pytest.raises(ValueError):
+        SlidingWindowAggregator()
+    with pytest.raises(ValueError):
+        SlidingWindowAggregator(size=3, duration=3)
+    with pytest.raises(ValueError):
+        SlidingWindowAggregator(size=0)
+    with pytest.raises(ValueError):
+        SlidingWindowAggregator(duration=-1)
+
+    agg = SlidingWindowAggregator(size=3)
+    assert repr(agg) == "SlidingWindowAggregator(size=3)"
+    with pytest.raises(ValueError):
+        agg.push(1, timestamp=1)
+    with pytest.raises(ValueError):
+        agg.extend([1], timestamps=[1])
+    with pytest.raises(ValueError):
+        agg.expire()
+    agg = SlidingWindowAggregator(duration=2.5)
+    assert repr(agg) == "SlidingWindowAggregator(duration=2.5)"
@@ -0,0 +1,103 @@
+"""Tests for the disk spilling SpillingDeque."""
+
+import pytest
+
+
+def test_deque_behavior():
+    import random
+    from collections import deque
+
+    from datastructures import SpillingDeque
+
+    random.seed(0)
+
+    for block_size, memory_blocks in ((1, 2), (3, 2), (4, 3)):
+        d = SpillingDeque(
+            range(20),
+            block_size=block_size,
+            memory_blocks=memory_blocks,
+            segment_size=64,
+        )
+        cmp_deque = deque(range(20))
+        for i in range(2000):
+            op = random.randrange(6)
+            if op == 0:
+                d.append(i)
+                cmp_deque.append(i)
+            elif op == 1:
+                d.appendleft(i)
+                cmp_deque.appendleft(i)
+            elif op == 2:
+                d.extend(range(i, i + 5))
+                cmp_deque.extend(range(i, i + 5))
+            elif cmp_deque:
+                if op == 3:
+                    assert d.pop() == cmp_deque.pop()
+                else:
+                    assert d.popleft() == cmp_deque.popleft()
+            else:
+                with pytest.raises(IndexError):
+                    d.pop()
+                with pytest.raises(IndexError):
+                    d.popleft()
+            assert len(d) == len(cmp_deque)
+            assert d.in_memory <= block_size * memory_blocks
+            if i % 100 == 0:
+                assert list(d) == list(cmp_deque)
+        assert list(d) == list(cmp_deque)
+        d.close()
+
+
+def test_segments(tmp_path):
+    import os
+
+    from datastructures import SpillingDeque
+
+    with SpillingDeque(block_size=10, directory=tmp_path, segment_size=1) as d:
+        assert repr(d) == "SpillingDeque(len=0, in_memory=0)"
+        d.extend(range(100))
+        assert d.in_memory <= 40
+        assert repr(d) == f"SpillingDeque(len=100, in_memory={d.in_memory})"
+        # every spilled block went into its own segment
+        assert len(os.listdir(tmp_path)) == (100 - d.in_memory) // 10
+        d.extendleft(range(-1, -51, -1))
+        assert list(d) == list(range(-50, 100))
+
+        # segments are deleted once all their blocks are read back
+        assert [d.popleft() for _ in range(75)] == list(range(-50, 25))
+        assert len(os.listdir(tmp_path)) == (75 - d.in_memory) // 10
+
+        it = iter(d)
+        next(it)
+        d.append(100)
+        with pytest.raises(RuntimeError):
+            next(it)
+        d.clear()
+        assert len(d) == 0 and list(d) == []
+        assert os.listdir(tmp_path) == []
+        d.extend(range(100))
+    # the directory was passed in, so only the segments are deleted
+    assert os.listdir(tmp_path) == []
+
+    # a closed deque can be used again and spills to a new directory
+    d = SpillingDeque(range(100), block_size=10)
+    directory = d._directory
+    d.close()
+    assert len(d) == 0 and not os.path.exists(directory)
+    d.extend(range(100))
+    assert list(d) == list(range(100))
+    assert d._directory != directory and os.listdir(d._directory)
+    directory = d._directory
+    d.close()
+    assert not os.path.exists(directory)
+
+    d = SpillingDeque(range(10_000), block_size=10)
+    directory = d._directory
+    assert os.listdir(directory)
+    del d
+    assert not os.path.exists(directory)
+
+    with pytest.raises(ValueError):
+        SpillingDeque(block_size=0)
+    with pytest.raises(ValueError):
+        SpillingDeque(memory_blocks=1)